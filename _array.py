@@ -0,0 +1,123 @@
+# Arrays aus lauter ints bzw. lauter floats werden als numpy.ndarray
+# gespeichert (genauer als _ndarray.Array), dann rechnen die binops aus
+# bin_operations elementweise und summe/minimum/maximum laufen vektorisiert.
+# ints außerhalb von int64 landen in einem object-Array. Gemischte Arrays
+# bleiben Listen, ihr Rest arr[*] ist eine ArrayView (numpy-Slices sind
+# ohnehin Views).
+
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+_ARRAY_TYPES: tuple = ()  # (numpy.ndarray,), sobald numpy geladen ist
+
+
+def lazy_numpy():
+    """numpy erst beim ersten Gebrauch importieren, spart Zeit beim Start"""
+    global _ARRAY_TYPES
+    import numpy
+
+    _ARRAY_TYPES = (numpy.ndarray,)
+    return numpy
+
+
+def is_array(x):
+    return isinstance(x, _ARRAY_TYPES)
+
+
+def make_array(values: list):
+    """Array für homogene Zahlen, sonst die Liste selbst"""
+    if not values:
+        return values
+    if all(type(v) is int for v in values):
+        fits = INT64_MIN <= min(values) and max(values) <= INT64_MAX
+        return _new_array(values, "int64" if fits else object)
+    if all(type(v) is float for v in values):
+        return _new_array(values, "float64")
+    return values
+
+
+def _new_array(values: list, dtype):
+    lazy_numpy()
+    from _ndarray import array
+
+    return array(values, dtype)
+
+
+class ArrayView:
+    """Rest eines gemischten Arrays ohne Kopie: base[offset:]"""
+
+    __slots__ = ("base", "offset")
+
+    def __init__(self, base: list, offset: int):
+        self.base = base
+        self.offset = offset
+
+    def __len__(self):
+        return len(self.base) - self.offset
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self.base[self.offset + i]
+
+    def __iter__(self):
+        base = self.base
+        for i in range(self.offset, len(base)):
+            yield base[i]
+
+    def __eq__(self, other):
+        if is_array(other):  # der Rest ist homogen, z.B. [1.5, 2, 3][*] = [2, 3]
+            other = other.tolist()
+        if not isinstance(other, (list, ArrayView)) or len(other) != len(self):
+            return False
+        return all(a == b for a, b in zip(self, other))
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def tail_view(arr):
+    """arr[1:] ohne Kopie für Listen und Views, numpy-Slices teilen sich den Speicher"""
+    if isinstance(arr, ArrayView):
+        return ArrayView(arr.base, arr.offset + 1)
+    if isinstance(arr, list):
+        return ArrayView(arr, 1)
+    return arr[1:]
+
+
+def scalar(x):
+    """numpy-Skalare aus Arrays wieder zu int/float machen"""
+    if type(x).__module__ == "numpy" and getattr(x, "ndim", None) == 0:
+        return x.item()
+    return x
+
+
+def as_int(r):
+    """int() für Vergleiche, bei Arrays elementweise"""
+    return r.astype("int64") if is_array(r) else int(r)
+
+
+def _reduce(name, python_func):
+    def reduction(values):
+        if len(values) != 1:
+            raise Exception(f"{name} erwartet genau ein Argument")
+        arr = values[0]
+        if is_array(arr):
+            return scalar(getattr(arr, name)())  # object-Arrays liefern Python-ints
+        return python_func(arr)  # Listen, Cons-Listen, ...
+
+    return reduction
+
+
+summe = _reduce("sum", sum)
+minimum = _reduce("min", min)
+maximum = _reduce("max", max)
@@ -1,19 +1,64 @@
-from environment import Environment
-DEBUG = False
+from environment import Environment, Frame
+from _memo import DEFAULT_SIZE, MISSING, Memo, store_all
+
+
+class Signature:
+    """Vorberechnete Parameter-Tabelle eines Lambdas, wird von allen Aufrufen geteilt
+
+    template ist das vars-dict eines frischen Environments (alle Namen auf None),
+    param_slots die Frame-Slots der positionellen Parameter, wenn es eine
+    Slot-Tabelle gibt. Liegen sie vorne am Stück, reicht eine Slice-Zuweisung.
+    """
+
+    __slots__ = ("params", "varargs", "template", "param_slots", "prefix", "slot_count")
+
+    def __init__(self, params, default_names, varargs, names=None):
+        self.params: tuple = tuple(params)
+        self.varargs: str | None = varargs
+        template = dict.fromkeys(self.params)
+        template.update(dict.fromkeys(default_names))
+        if varargs is not None:
+            template.setdefault(varargs)
+        self.template: dict = template
+        if names is not None:
+            self.param_slots = tuple(names[p] for p in self.params)
+            self.prefix = self.param_slots == tuple(range(len(self.params)))
+            self.slot_count = len(names)
+        else:
+            self.param_slots, self.prefix, self.slot_count = None, False, 0
 
 
 class Lambda:
     """Repräsentiert eine Lambda-Funktion mit Parametern, Defaults und Closure"""
 
-    def __init__(self, params, varargs, defaults, body, closure_env):
-        self.params: list = params  # Liste der Parameter-Namen
+    __slots__ = ("params", "varargs", "defaults", "closure_env", "body", "names", "signature", "memo")
+
+    def __init__(self, params, varargs, defaults, body, closure_env, names=None, signature=None):
+        if signature is None:
+            signature = Signature(params, defaults, varargs, names)
+        self.signature: Signature = signature
+        self.params: tuple = signature.params  # Parameter-Namen
         self.varargs: str | None = varargs  # Name des varargs Parameters oder None
-        self.defaults: dict = defaults  # Dict mit default-Werten
+        self.defaults: dict = defaults  # Dict mit default-Werten, wird nie verändert
         self.closure_env: Environment = closure_env  # Environment zur Closure-Zeit
         self.body = body  # AST des Lambda-Bodies
+        self.names: dict | None = names  # Slot-Tabelle, wenn der Body einen Frame erwartet
+        self.memo: Memo | None = None  # Cache aus merke(...)
 
     def __repr__(self):
-        return "LAMBDA OBJ: {" + str([self.params, *[self.varargs], *[self.defaults.items()]]) + "}"
+        text = "LAMBDA OBJ: {" + str([list(self.params), *[self.varargs], *[self.defaults.items()]]) + "}"
+        return text if self.memo is None else f"{text} {self.memo}"
+
+
+class TailCall:
+    """Aufruf in Tail-Position, wird von call_lambda in einer Schleife ausgeführt"""
+
+    __slots__ = ("lambda_obj", "pos_args", "keyword_args")
+
+    def __init__(self, lambda_obj, pos_args, keyword_args):
+        self.lambda_obj: Lambda = lambda_obj
+        self.pos_args: list = pos_args
+        self.keyword_args: dict = keyword_args
 
 
 def parse_lambda_parameters(parameter, eval_func, env):
@@ -21,7 +66,6 @@ def parse_lambda_parameters(parameter, eval_func, env):
     params = []
     defaults = {}
     varargs = None
-    print("DEBUG -- Parse Lambda Parameter") if DEBUG else 0
     # ('parameter', [('pos', 'x'), ('keyword', 'y', ('num', '3')), ('keyword', 'z', ('num', '5')), ('infty', 'c')])
     for param in parameter[1]:
         match param:
@@ -39,9 +83,6 @@ def parse_call_arguments(args_expr, eval_func, env):
     """Parst Aufruf-Argumente in positionelle und Keyword-Argumente"""
     pos_args = []
     keyword_args = {}
-    print("DEBUG -- Parse Call Argumente") if DEBUG else 0
-    print("Diese Argumente sollen gecallt werden: ", args_expr, end="") if DEBUG else 0
-
     for param in args_expr[1]: # [('pos', ('num', '2')), ('keyword', ('var', 'x'), ('num', '3'))]
         match param:
             case 'pos', expr:
@@ -50,53 +91,119 @@ def parse_call_arguments(args_expr, eval_func, env):
             case 'keyword', var, expr:
                 val = eval_func(expr, env)
                 keyword_args[var[1]] = val
-    print(" und diese kamen raus : ", pos_args, keyword_args) if DEBUG else 0
     return pos_args, keyword_args # [[2], {x:3}]
 
 # f := lambda (x,y:3) -> x-y
-def call_lambda(lambda_obj: Lambda, pos_args, keyword_args, eval_func, env):
-    """Führt einen Lambda-Ausdruck aus oder erstellt Partial Application"""
-    # Lokales Environment mit den Definitions Variblen erstellen mit Wert
-    print("DEBUG -- Lokales Environment erstellen") if DEBUG else 0
-    print("Das Lambda-Objekt  das gecallt wird : ", lambda_obj) if DEBUG else 0
-    # f(y:5)
+def bind_arguments(lambda_obj: Lambda, pos_args, keyword_args):
+    """Bindet die Argumente: lokales Environment oder Lambda bei Partial Application"""
+    sig = lambda_obj.signature
     lokal_env = Environment(parent=lambda_obj.closure_env)
-    lokal_env.put(lambda_obj.params)
+    lokal_env.vars = local_vars = sig.template.copy()
+    if lambda_obj.defaults:
+        local_vars.update(lambda_obj.defaults)
+    params = sig.params
+    if not keyword_args and len(pos_args) == len(params):
+        # Häufigster Fall: alle Parameter positionell, keine Keywords
+        local_vars.update(zip(params, pos_args))
+        return lokal_env
+    return _bind_rest(lambda_obj, lokal_env, pos_args, keyword_args)
+
+
+def bind_frame(lambda_obj: Lambda, pos_args, keyword_args):
+    """Wie bind_arguments, aber in einen Frame mit der Slot-Tabelle des Lambdas"""
+    sig = lambda_obj.signature
+    names = lambda_obj.names
+    closure = lambda_obj.closure_env
+    if isinstance(closure, Frame) and closure.names is names:
+        # Partial Application desselben Lambdas: schon gebundene Slots übernehmen
+        slots = closure.slots.copy()
+        closure = closure.parent
+    else:
+        slots = [None] * sig.slot_count
     for k, v in lambda_obj.defaults.items():
-        lokal_env.put(k)
-        lokal_env[k] = v
-    if lambda_obj.varargs is not None:
-        lokal_env.put([lambda_obj.varargs])
-    print("Das Environment von dem Lambda : ", lokal_env) if DEBUG else 0
-
-    print("DEBUG -- Argumente binden") if DEBUG else 0
-    new_params = lambda_obj.params.copy()
-    new_defaults = lambda_obj.defaults.copy()
-    print("NEW PARAMS ", new_params, "NEW DEFAULTS", new_defaults) if DEBUG else 0
-
-    # Zuerst Keyword Args auf lambda env binden
-    bound_keys = []
-    for k, v in keyword_args.items():
-        lokal_env[k] = v
-        new_defaults[k] = v
-        bound_keys.append(k)
-    print("Gebundene Keyword Args: ", new_defaults) if DEBUG else 0
-
-    # Dann Pos Args auf restliche lambda env binden
-    for key, val in zip(new_params, pos_args):
+        slots[names[k]] = v
+    frame = Frame(names, slots, closure)
+    if not keyword_args and len(pos_args) == len(sig.params):
+        if sig.prefix:
+            slots[: len(pos_args)] = pos_args
+        else:
+            for slot, val in zip(sig.param_slots, pos_args):
+                slots[slot] = val
+        return frame
+    return _bind_rest(lambda_obj, frame, pos_args, keyword_args)
+
+
+def _bind_rest(lambda_obj: Lambda, lokal_env, pos_args, keyword_args):
+    """Allgemeiner Fall mit Keywords, zu wenigen oder zu vielen Argumenten
+
+    Keywords zuerst, dann die positionellen Argumente der Reihe nach auf die
+    Parameter. Fehlen danach noch Parameter, gibt es ein neues Lambda.
+    """
+    names = lambda_obj.names
+    defaults = lambda_obj.defaults
+    bound = set()
+    if keyword_args:
+        defaults = defaults.copy()
+        for k, v in keyword_args.items():
+            if names is None or k in names:
+                defaults[k] = v
+            lokal_env[k] = v  # unbekannte Namen landen wie bisher weiter außen
+            bound.add(k)
+    for key, val in zip(lambda_obj.params, pos_args):
         lokal_env[key] = val
-        bound_keys.append(key)
-    print("Gebundene Positionale Args: ", new_params) if DEBUG else 0
-
-    for key in bound_keys:
-        if key in new_params:
-            new_params.remove(key)
-    # Checken ob Positionale Args alle gebunden sind
-    # Wenn nein, return Lambda mit neuem Environment und Parameter
-    if new_params: # ist nicht leer
-        return Lambda(new_params, lambda_obj.varargs, new_defaults, lambda_obj.body, lokal_env)
+        bound.add(key)
+
+    new_params = [p for p in lambda_obj.params if p not in bound]
+    if new_params:
+        partial = Lambda(new_params, lambda_obj.varargs, defaults, lambda_obj.body, lokal_env, names)
+        partial.memo = lambda_obj.memo  # Schlüssel enthält alle gebundenen Werte
+        return partial
+    return lokal_env
+
+
+def memoize(lambda_obj, maxsize=DEFAULT_SIZE):
+    """merke(f, größe): Kopie von f mit eigenem LRU-Cache"""
+    if not isinstance(lambda_obj, Lambda):
+        raise TypeError(f"merke erwartet ein Lambda, nicht {type(lambda_obj)}")
+    if not isinstance(maxsize, int) or maxsize < 1:
+        raise ValueError("merke: Größe muss eine positive Zahl sein")
+    memoized = Lambda(
+        lambda_obj.params,
+        lambda_obj.varargs,
+        lambda_obj.defaults,
+        lambda_obj.body,
+        lambda_obj.closure_env,
+        lambda_obj.names,
+        lambda_obj.signature,
+    )
+    memoized.memo = Memo(lambda_obj.signature.template, maxsize)
+    return memoized
 
-    # Wenn ja, execute Lambda
-    print("DEBUG -- Execute Lambda") if DEBUG else 0
-    return eval_func(lambda_obj.body, lokal_env)
 
+def call_lambda(lambda_obj: Lambda, pos_args, keyword_args, eval_func, env):
+    """Führt einen Lambda-Ausdruck aus oder erstellt Partial Application
+
+    Der Body wird mit tail=True ausgewertet. Endet er in einem Aufruf, kommt
+    ein TailCall zurück und die Schleife ruft das nächste Lambda auf, ohne
+    dass der Python-Stack wächst.
+    """
+    pending = []  # (memo, key) der gemerkten Lambdas in dieser TailCall-Kette
+    while True:
+        lokal_env = bind_arguments(lambda_obj, pos_args, keyword_args)
+        if isinstance(lokal_env, Lambda):
+            result = lokal_env
+            break
+        memo = lambda_obj.memo
+        if memo is not None and (key := memo.key(lokal_env)) is not None:
+            result = memo.lookup(key)
+            if result is not MISSING:
+                break
+            pending.append((memo, key))
+
+        result = eval_func(lambda_obj.body, lokal_env, tail=True)
+        if not isinstance(result, TailCall):
+            break
+        lambda_obj, pos_args, keyword_args = result.lambda_obj, result.pos_args, result.keyword_args
+    if pending:
+        store_all(pending, result)
+    return result
@@ -1,11 +1,77 @@
+from _array import scalar, tail_view
+
 
 class Cons:
+    """Unveränderliche Liste aus Zellen, leere ist None
+
+    a & l, l[.], l[*] und länge(l) sind O(1), die Länge steht in jeder Zelle.
+    Alles, was die ganze Liste anfasst, läuft iterativ, auch bei 100k Elementen.
+    """
+
+    __slots__ = ("head", "tail", "length")
+
     def __init__(self, head, tail):
         self.head = head
         self.tail = tail
+        self.length = tail.length + 1 if isinstance(tail, Cons) else 1
 
     def __iter__(self):
         current = self
         while isinstance(current, Cons):
             yield current.head
             current = current.tail
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.length:
+            raise IndexError(i)
+        current = self
+        for _ in range(i):
+            current = current.tail
+        return current.head
+
+    def __eq__(self, other):
+        if not isinstance(other, Cons) or other.length != self.length:
+            return False
+        a, b = self, other
+        while isinstance(a, Cons) and isinstance(b, Cons):
+            if a is b:
+                return True
+            if a.head != b.head:
+                return False
+            a, b = a.tail, b.tail
+        return a == b
+
+    def __repr__(self):
+        current = self
+        while isinstance(current, Cons):
+            current = current.tail
+        if current is not None:  # z.B. 1 & 2 ohne leere am Ende
+            return " & ".join(map(repr, [*self, current]))
+        return f"list({', '.join(map(repr, self))})"
+
+
+def from_values(values):
+    """list(a, b, c) == a & (b & (c & leere)), von hinten aufgebaut"""
+    result = None
+    for value in reversed(values):
+        result = Cons(value, result)
+    return result
+
+
+def list_head(arr):
+    """arr[.]"""
+    if isinstance(arr, Cons):
+        return arr.head
+    return scalar(arr[0])
+
+
+def list_tail(arr):
+    """arr[*]"""
+    if isinstance(arr, Cons):
+        return arr.tail
+    if len(arr) == 2:
+        return scalar(arr[1])
+    return tail_view(arr)
@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from environment import Frame
+
+# merke(f) bzw. merke(f, größe): Ergebnisse eines Lambdas in einem LRU-Cache
+# merken. Schlüssel sind die Werte aller Parameter nach dem vollständigen
+# Binden, also inklusive Defaults und der Argumente aus Partial Applications.
+# Partials eines gemerkten Lambdas teilen sich deshalb gefahrlos den Cache.
+# Neben jedem Wert steht sein Typ, sonst wären 1, 1.0 und True derselbe Schlüssel.
+
+DEFAULT_SIZE = 1024
+MISSING = object()
+
+
+class Memo:
+    """Begrenzter LRU-Cache eines Lambdas mit Treffer-Statistik"""
+
+    __slots__ = ("names", "maxsize", "entries", "hits", "misses")
+
+    def __init__(self, names, maxsize=DEFAULT_SIZE):
+        self.names: tuple = tuple(names)  # alle Namen der Signatur
+        self.maxsize: int = maxsize
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, env):
+        """Schlüssel aus dem gebundenen Environment/Frame, None wenn nicht hashbar"""
+        if isinstance(env, Frame):
+            values = tuple((type(v), v) for v in env.slots)
+        else:
+            values = tuple((type(env[name]), env[name]) for name in self.names)
+        try:
+            hash(values)
+        except TypeError:  # z.B. Arrays als Argument
+            return None
+        return values
+
+    def lookup(self, key):
+        value = self.entries.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return value
+
+    def store(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "maxsize": self.maxsize}
+
+    def __repr__(self):
+        return f"merke(hits={self.hits}, misses={self.misses}, size={len(self.entries)}/{self.maxsize})"
+
+
+def store_all(pending, result):
+    """Ergebnis für alle offenen (memo, key) einer TailCall-Kette merken"""
+    for memo, key in pending:
+        memo.store(key, result)
@@ -0,0 +1,133 @@
+import numpy
+
+from _array import INT64_MAX, ArrayView, make_array
+
+# Unterklasse von numpy.ndarray für die Arrays der Sprache. int64 läuft
+# nicht still über: vor add/subtract/multiply/power/... wird aus den
+# Beträgen der Operanden abgeschätzt, ob das Ergebnis über int64 hinaus
+# gehen kann. Dann wird mit Python-ints (dtype=object) gerechnet und das
+# Ergebnis wieder auf int64 verkleinert, wenn es passt. Sonst bleibt es ein
+# object-Array. Der Normalfall bleibt vektorisiert. Negative ganzzahlige
+# Exponenten rechnen ebenso mit Python-ints, 2 ** -1 ist dann 0.5.
+# Sonst gelten die Regeln der Listen: + hängt zwei Arrays (oder Array und
+# Liste) aneinander, = und != vergleichen als Ganzes (mit einer Zahl also
+# immer ungleich) und ein Array ist wahr, wenn es nicht leer ist. Nur die
+# übrigen Operatoren rechnen elementweise.
+
+
+def _magnitude(x):
+    """größter Betrag eines int-Operanden als Python-int"""
+    if isinstance(x, numpy.ndarray):
+        return max(-int(x.min()), int(x.max())) if x.size else 0
+    return abs(int(x))
+
+
+def _is_int(x):
+    if isinstance(x, numpy.ndarray):
+        return x.dtype.kind in "iu"
+    return isinstance(x, (int, numpy.integer))
+
+
+def _power_overflows(base, exponent):
+    return base > 1 and base.bit_length() * exponent > 63
+
+
+# Schranke fürs Ergebnis je ufunc, aus den Beträgen der Operanden
+_BOUNDS = {
+    numpy.add: lambda m: m[0] + m[1] > INT64_MAX,
+    numpy.subtract: lambda m: m[0] + m[1] > INT64_MAX,
+    numpy.multiply: lambda m: m[0] * m[1] > INT64_MAX,
+    numpy.power: lambda m: _power_overflows(m[0], m[1]),
+    numpy.floor_divide: lambda m: m[0] > INT64_MAX,  # INT64_MIN // -1
+    numpy.negative: lambda m: m[0] > INT64_MAX,
+    numpy.absolute: lambda m: m[0] > INT64_MAX,
+}
+
+
+def _may_overflow(ufunc, method, inputs):
+    if ufunc not in _BOUNDS or not all(_is_int(x) for x in inputs):
+        return False
+    if method == "reduce":  # summe
+        (arr,) = inputs
+        return ufunc is not numpy.add or arr.size * _magnitude(arr) > INT64_MAX
+    return method == "__call__" and _BOUNDS[ufunc]([_magnitude(x) for x in inputs])
+
+
+def _negative_power(ufunc, method, inputs):
+    """int ** negativer int, das kann numpy nicht, Python liefert floats"""
+    if ufunc is not numpy.power or method != "__call__" or not all(_is_int(x) for x in inputs):
+        return False
+    exponent = inputs[1]
+    if isinstance(exponent, numpy.ndarray):
+        return exponent.size > 0 and int(exponent.min()) < 0
+    return exponent < 0
+
+
+def _objects(x):
+    return x.astype(object) if isinstance(x, numpy.ndarray) else int(x)
+
+
+def _wrap(result):
+    """Ergebnis wieder als Array, object-Arrays aus lauter ints bzw. floats
+    wenn möglich als int64 bzw. float64"""
+    if not isinstance(result, numpy.ndarray):
+        return result
+    if result.dtype == object and result.size:
+        values = result.tolist()
+        if all(type(v) is int for v in values) and _magnitude(result) <= INT64_MAX:
+            result = numpy.array(values, dtype="int64")
+        elif all(type(v) is float for v in values):
+            result = numpy.array(values, dtype="float64")
+    return result.view(Array)
+
+
+def _same(a, b):
+    """Ganzer Vergleich, verschiedene Längen sind einfach ungleich"""
+    if len(a) != len(b):
+        return False
+    if isinstance(b, numpy.ndarray):
+        return bool(numpy.equal(a.view(numpy.ndarray), b.view(numpy.ndarray)).all())
+    return all(x == y for x, y in zip(a.tolist(), b))
+
+
+class Array(numpy.ndarray):
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = [x.view(numpy.ndarray) if isinstance(x, Array) else x for x in inputs]
+        if _may_overflow(ufunc, method, inputs) or _negative_power(ufunc, method, inputs):
+            inputs = [_objects(x) for x in inputs]
+        return _wrap(getattr(ufunc, method)(*inputs, **kwargs))
+
+    def __add__(self, other):
+        if isinstance(other, _SEQUENCES):
+            return _concat(self.tolist(), other)
+        return super().__add__(other)
+
+    def __radd__(self, other):
+        if isinstance(other, _SEQUENCES):
+            return _concat(list(other), self)
+        return super().__radd__(other)
+
+    def __eq__(self, other):
+        return isinstance(other, _SEQUENCES) and _same(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __bool__(self):
+        return self.size > 0
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.view(numpy.ndarray))
+
+
+_SEQUENCES = (numpy.ndarray, list, ArrayView)
+
+
+def _concat(values: list, other):
+    return make_array(values + (other.tolist() if isinstance(other, numpy.ndarray) else list(other)))
+
+
+def array(values: list, dtype):
+    return numpy.array(values, dtype=dtype).view(Array)
@@ -0,0 +1,64 @@
+# Kleine Analyse für den Schnellweg der für-Schleife: wie benutzt der
+# Rumpf den Zähler? Funktioniert auf dem AST aus dem Parser und auf dem
+# aufgelösten AST aus resolver.py (Adressen statt ("var", name)).
+
+ASSIGNED = "assigned"  # Zähler kann im Rumpf geändert werden
+READ = "read"  # Zähler wird gelesen, aber nie geschrieben
+UNUSED = "unused"  # Rumpf sieht den Zähler gar nicht
+
+MAX_CACHED = 1024  # so viele Schleifenrümpfe merkt sich cached_counter_usage
+
+_cache = {}  # id(body) -> (body, counter, usage), body hält die id gültig
+
+
+def _name(node):
+    match node:
+        case ("var", n) | ("global", n) | ("local", _, _, n):
+            return n
+        case str(n):
+            return n
+    return None
+
+
+def counter_usage(counter, body):
+    """ASSIGNED, READ oder UNUSED für den Zähler counter im Rumpf body
+
+    Aufrufe zählen als ASSIGNED, weil ein Lambda den Zähler über seine
+    Closure oder als globale Variable ändern kann. Ein sei mit demselben
+    Namen zählt ebenfalls als ASSIGNED, das ist sicher, aber nicht optimal.
+    """
+    counter = _name(counter)
+    usage = UNUSED
+    todo = list(body)
+    while todo:
+        node = todo.pop()
+        if isinstance(node, list):
+            todo.extend(node)
+            continue
+        if not isinstance(node, tuple) or not node:
+            continue
+        match node:
+            case ("call", _, _):
+                return ASSIGNED
+            case ("assign", _, var, _) | ("loop", var, _, _) if _name(var) == counter:
+                return ASSIGNED
+            case ("var", _) | ("global", _) | ("local", _, _, _):
+                if _name(node) == counter:
+                    usage = READ
+                continue
+        todo.extend(x for x in node if isinstance(x, (tuple, list)))
+    return usage
+
+
+def cached_counter_usage(counter, body):
+    """counter_usage mit Cache für eval, das die Schleife bei jedem Durchlauf sieht"""
+    entry = _cache.get(id(body))
+    if entry is not None and entry[0] is body and entry[1] == counter:
+        return entry[2]
+    usage = counter_usage(counter, body)
+    if len(_cache) >= MAX_CACHED:
+        # ältesten Eintrag verwerfen, sonst bleibt in REPL und stream.py
+        # jeder je ausgewertete Rumpf am Leben
+        del _cache[next(iter(_cache))]
+    _cache[id(body)] = (body, counter, usage)
+    return usage
@@ -0,0 +1,14 @@
+from interpreter import eval
+from compiler import run as run_closure
+from quicken import run as run_quick
+from transpiler import run as run_python
+from vm import run as run_vm
+
+# Auswählbare Ausführungs-Backends, alle mit der Signatur f(ast, env)
+BACKENDS = {
+    "eval": eval,
+    "closure": run_closure,
+    "quick": run_quick,
+    "python": run_python,
+    "vm": run_vm,
+}
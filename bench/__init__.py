@@ -0,0 +1 @@
+# Benchmarks für den Interpreter, Aufruf z.B. mit python3 -m bench.startup
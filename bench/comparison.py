@@ -0,0 +1,79 @@
+import sys
+import time
+
+import interpreter
+from backend import BACKENDS
+from environment import Environment
+from parser import parser
+
+# Vergleichsketten a < f(x) < b: gemessen wird jedes Backend und zum
+# Vergleich die alte Auswertung im Interpreter, die jedes Glied komplett
+# ausgewertet hat (mittlere Operanden doppelt, kein Abbruch).
+
+PROGRAM = """{
+n := 0;
+treffer := 0;
+f := lambda x -> {n +:= 1; x mod 7};
+für i in ]0, %d] wiederhole
+  wenn 2 < f(i) < 5 gilt, treffer +:= 1 .;
+  wenn 9 < f(i) < f(i + 1) < 20 gilt, treffer +:= 1 .
+.;
+n
+}"""
+
+
+def _old_eval(expression, env, tail=False):
+    """Alte Auswertung der Vergleichsketten, alles andere wie interpreter.eval"""
+    if expression[0] == "comparison":
+        _, f, x, y = expression
+        ops, expr1, expr2 = [f], [x], []
+        tmp = y
+        while tmp[0] == "comparison":
+            ops.append(tmp[1])
+            expr2.append(tmp[2])
+            expr1.append(tmp[2])
+            tmp = tmp[3]
+        expr2.append(tmp)
+        ops = [interpreter.bin_operations[op] for op in ops]
+        return int(all([op(_old_eval(a, env), _old_eval(b, env)) for op, a, b in zip(ops, expr1, expr2)]))
+    return _new_eval(expression, env, tail)
+
+
+def _same_eval(expression, env, tail=False):
+    """Gleicher Umweg über eine Python-Funktion wie bei _old_eval, aber neue Ketten"""
+    return _new_eval(expression, env, tail)
+
+
+_new_eval = interpreter.eval
+
+
+def measure(run, ast):
+    env = Environment()
+    start = time.perf_counter()
+    calls = run(ast, env)
+    return time.perf_counter() - start, calls
+
+
+def _patched(evaluator):
+    # eval ruft sich über den Modulnamen rekursiv auf, so läuft jeder
+    # Knoten im Programm über evaluator
+    def run(ast, env):
+        interpreter.eval = evaluator
+        try:
+            return evaluator(ast, env)
+        finally:
+            interpreter.eval = _new_eval
+
+    return run
+
+
+def main(n=3000):
+    ast = parser.parse(PROGRAM % n)
+    runs = {"eval (alt)": _patched(_old_eval), "eval (neu)": _patched(_same_eval), **BACKENDS}
+    for name, run in runs.items():
+        seconds, calls = measure(run, ast)
+        print(f"{name:<12} {seconds * 1000:8.1f} ms  {calls:6} Aufrufe von f")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
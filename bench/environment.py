@@ -0,0 +1,55 @@
+import sys
+import time
+
+from environment import Environment, PersistentEnvironment
+
+# Schnappschuss vor jeder REPL-Eingabe: dict-Kopie gegen persistente
+# Hash-Map, bei n globalen Variablen. Dazu die Kosten einzelner Lese- und
+# Schreibzugriffe, die bei der Hash-Map etwas höher sind.
+
+STATEMENTS = 1000
+
+
+def fill(env, n):
+    for i in range(n):
+        env[f"v{i}"] = i
+    return env
+
+
+def per_op(f, count):
+    start = time.perf_counter()
+    f()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def measure(env_class, n):
+    env = fill(env_class(), n)
+
+    def statements():
+        # je Eingabe: Schnappschuss, eine Zuweisung, zurücksetzen
+        for i in range(STATEMENTS):
+            snapshot = env.snapshot()
+            env["v0"] = i
+            env.restore(snapshot)
+
+    def reads():
+        for i in range(STATEMENTS):
+            env[f"v{i % n}"]
+
+    def writes():
+        for i in range(STATEMENTS):
+            env[f"v{i % n}"] = i
+
+    return per_op(statements, STATEMENTS), per_op(reads, STATEMENTS), per_op(writes, STATEMENTS)
+
+
+def main(sizes=(100, 10000, 100000)):
+    print(f"{'':<32} {'Eingabe':>10} {'lesen':>10} {'schreiben':>10}   (µs)")
+    for n in sizes:
+        for env_class in (Environment, PersistentEnvironment):
+            statement, read, write = measure(env_class, n)
+            print(f"{env_class.__name__ + ' n=' + str(n):<32} {statement:10.2f} {read:10.2f} {write:10.2f}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(a) for a in sys.argv[1:]) or (100, 10000, 100000))
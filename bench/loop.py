@@ -0,0 +1,37 @@
+import sys
+import time
+
+from backend import BACKENDS
+from environment import Environment
+from parser import parser
+
+# für-Schleifen in allen Backends gegen eine reine Python-Schleife.
+# "zähler" liest den Zähler im Rumpf, "leer" benutzt ihn gar nicht.
+
+PROGRAMS = {
+    "zähler": "{s := 0; für i in [1, %d] wiederhole s +:= i .; s}",
+    "leer": "{s := 0; für i in [1, %d] wiederhole s +:= 1 .; s}",
+}
+
+
+def python_loop(n):
+    s = 0
+    for i in range(2, n + 1):
+        s += i
+    return s
+
+
+def main(n=100000):
+    start = time.perf_counter()
+    python_loop(n)
+    print(f"{'python':<16} {(time.perf_counter() - start) * 1000:8.1f} ms")
+    for name, program in PROGRAMS.items():
+        ast = parser.parse(program % n)
+        for backend, run in BACKENDS.items():
+            start = time.perf_counter()
+            run(ast, Environment())
+            print(f"{backend + ' ' + name:<16} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,42 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Kaltstart-Zeit: jeder Lauf ist ein frischer Python-Prozess, der Lexer,
+# Parser und Interpreter lädt und ein kleines Programm ausführt.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PROGRAM = "from parser import parser; from interpreter import eval; from environment import Environment; eval(parser.parse('{x := 1 + 2}'), Environment())"
+MODES = {
+    "production": {},
+    "dev": {"INCC25_DEV": "1"},
+}
+
+
+def measure_command(program, runs, extra_env=None):
+    env = {**os.environ, **(extra_env or {})}
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", program], cwd=BASE_DIR, env=env, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def measure(extra_env, runs):
+    return measure_command(PROGRAM, runs, extra_env)
+
+
+def main(runs=10):
+    measure({}, 1)  # Dateisystem-Cache aufwärmen
+    python_only = statistics.median(measure_command("pass", runs))
+    print(f"{'python -c pass':<14} {python_only * 1000:8.1f} ms")
+    for mode, extra_env in MODES.items():
+        times = measure(extra_env, runs)
+        print(f"{mode:<14} {statistics.median(times) * 1000:8.1f} ms  (min {min(times) * 1000:.1f} ms, {runs} Läufe)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
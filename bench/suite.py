@@ -0,0 +1,191 @@
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from backend import BACKENDS
+from environment import Environment
+from lexer import GRAMMAR_VERSION, lexer
+from parser import parser
+
+# Benchmark-Suite mit typischen Programmen. Gemessen werden die Phasen
+# einzeln: Lexen (alle Tokens holen), Parsen (aus den fertigen Tokens, also
+# ohne Lexen) und Ausführen in jedem Backend. Je Phase gibt es Aufwärmläufe
+# und Wiederholungen, festgehalten werden Minimum und Median.
+#
+# Ergebnisse lassen sich als JSON speichern und gegen eine Baseline
+# vergleichen: ist das Minimum einer Phase um mehr als die Schwelle
+# langsamer, schlägt der Lauf fehl (Exit-Code 1).
+#
+#   python3 -m bench.suite -speichern            Baseline anlegen
+#   python3 -m bench.suite [-schwelle 0.2]       gegen die Baseline prüfen
+#   python3 -m bench.suite -json ergebnis.json   Ergebnisse zusätzlich speichern
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+THRESHOLD = 0.25  # 25 % langsamer als die Baseline gilt als Regression
+
+PROGRAMS = {
+    "fizzbuzz": """{
+y := 0;
+für i in ]0, 3000] wiederhole
+  wenn (i mod 3 = 0 and i mod 5 = 0) gilt, y +:= 15
+  ,aber wenn (i mod 3 = 0) gilt, y +:= 3
+  ,aber wenn (i mod 5 = 0) gilt, y +:= 5
+  sonst y +:= 1
+  .
+.;
+y
+}""",
+    "fakultät": "{x := 1; für i in [1, 1500] wiederhole x := x * i .; x mod 1000003}",
+    "rekursion": "{sei fib = lambda n -> wenn n < 2 gilt, n sonst fib(n - 1) + fib(n - 2) . in fib(17) .}",
+    "solange": """{
+x1 := 100000; x2 := 7; x0 := 0; s := 0; i := 0;
+solange x1 >= x2 gilt, x1 := x1 - x2; x0 := x0 + 1 .;
+solange i < 3000 gilt, i := i + 1; s := s + i * i mod 11 .;
+x0 + s
+}""",
+    "listen": """{
+l := leere;
+für i in [1, 500] wiederhole l := i & l .;
+a := [1, 2, 3, 4, 5, 6, 7, 8];
+s := 0;
+für i in [1, 300] wiederhole s +:= summe(a) + länge(l) + (l[.]) .;
+s
+}""",
+    "partial": """{
+mul := lambda (x, y) -> x * y;
+fancy := lambda (x, y, z) -> x + 10*y + 100*z;
+s := 0;
+für i in [1, 1500] wiederhole
+  d := mul(i);
+  s +:= d(3) + mul(y: 2)(i) + fancy(y: 2, z: 3)(i)
+.;
+s
+}""",
+}
+
+
+def lex(source):
+    lex = lexer.clone()
+    lex.input(source)
+    return list(iter(lex.token, None))
+
+
+def parse(tokens):
+    it = iter(tokens)
+    return parser.parse(lexer=lexer, tokenfunc=lambda: next(it, None))
+
+
+def _timed(f, loops):
+    start = time.perf_counter()
+    for _ in range(loops):
+        f()
+    return time.perf_counter() - start
+
+
+def measure(f, warmup, repeats, min_sample=0.02):
+    """Sekunden je Lauf: (min, median)
+
+    Kurze Phasen (Lexen, Parsen) laufen pro Messung so oft, dass eine Messung
+    mindestens min_sample Sekunden dauert, sonst misst man nur Rauschen.
+    """
+    for _ in range(warmup):
+        f()
+    loops = 1
+    while _timed(f, loops) < min_sample:
+        loops *= 2
+    times = [_timed(f, loops) / loops for _ in range(repeats)]
+    return min(times), statistics.median(times)
+
+
+def run(programs=PROGRAMS, backends=tuple(BACKENDS), warmup=1, repeats=5):
+    """{programm: {phase: {"min": s, "median": s}}}"""
+    results = {}
+    for name, source in programs.items():
+        tokens = lex(source)
+        ast = parse(tokens)
+        phases = {
+            "lex": lambda: lex(source),
+            "parse": lambda: parse(tokens),
+            **{backend: (lambda f=BACKENDS[backend]: f(ast, Environment())) for backend in backends},
+        }
+        results[name] = {}
+        for phase, f in phases.items():
+            best, median = measure(f, warmup, repeats)
+            results[name][phase] = {"min": best, "median": median}
+    return results
+
+
+def to_json(results):
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "grammar_version": GRAMMAR_VERSION,
+            "zeit": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def regressions(results, baseline, threshold=THRESHOLD):
+    """[(programm, phase, alt, neu)] für alle Phasen, die langsamer geworden sind"""
+    slower = []
+    for name, phases in results.items():
+        for phase, t in phases.items():
+            old = baseline.get(name, {}).get(phase)
+            if old is not None and t["min"] > old["min"] * (1 + threshold):
+                slower.append((name, phase, old["min"], t["min"]))
+    return slower
+
+
+def report(results, baseline=None):
+    phases = list(next(iter(results.values())))
+    print(f"{'':<12}" + "".join(f"{p:>10}" for p in phases) + "   (ms, Minimum)")
+    for name, times in results.items():
+        print(f"{name:<12}" + "".join(f"{times[p]['min'] * 1000:10.2f}" for p in phases))
+        if baseline and name in baseline:
+            ratios = [times[p]["min"] / baseline[name][p]["min"] if p in baseline[name] else None for p in phases]
+            print(f"{'  vs. Basis':<12}" + "".join(f"{r:9.2f}x" if r else f"{'-':>10}" for r in ratios))
+
+
+def main(argv):
+    threshold, save, json_path, repeats = THRESHOLD, False, None, 5
+    baseline_path = BASELINE
+    args = iter(argv)
+    for arg in args:
+        if arg == "-schwelle":
+            threshold = float(next(args))
+        elif arg == "-speichern":
+            save = True
+        elif arg == "-json":
+            json_path = Path(next(args))
+        elif arg == "-basis":
+            baseline_path = Path(next(args))
+        elif arg == "-n":
+            repeats = int(next(args))
+
+    results = run(repeats=repeats)
+    baseline = None
+    if baseline_path.is_file() and not save:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+    report(results, baseline)
+    if json_path:
+        json_path.write_text(json.dumps(to_json(results), indent=2, ensure_ascii=False), encoding="utf-8")
+    if save:
+        baseline_path.write_text(json.dumps(to_json(results), indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Baseline gespeichert: {baseline_path}")
+        return True
+    if baseline is None:
+        print(f"keine Baseline unter {baseline_path}, anlegen mit -speichern")
+        return True
+    slower = regressions(results, baseline, threshold)
+    for name, phase, old, new in slower:
+        print(f"REGRESSION {name} {phase}: {old * 1000:.2f} ms -> {new * 1000:.2f} ms (Schwelle {threshold:.0%})")
+    return not slower
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(sys.argv[1:]) else 1)
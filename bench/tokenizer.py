@@ -0,0 +1,71 @@
+import sys
+import time
+from pathlib import Path
+
+from lexer import LineIndex, lexer
+from tokenizer import Tokenizer
+from bench.suite import PROGRAMS
+
+# PLY-Lexer gegen tokenizer.Tokenizer auf mehreren MB Quelltext (die
+# Programme aus bench.suite und test/ so oft hintereinander, bis die Größe
+# erreicht ist). Dazu die Kosten, Zeile und Spalte für einen Fehler zu
+# finden: alte Variante (ganzen Text zerlegen und Zeilenlängen summieren)
+# gegen den LineIndex.
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def make_source(megabytes):
+    pieces = list(PROGRAMS.values()) + [p.read_text(encoding="utf-8") for p in sorted((BASE_DIR / "test").rglob("*.incc25"))]
+    block = "\n".join(pieces) + "\n"
+    return block * max(1, int(megabytes * 2**20 / len(block)))
+
+
+def ply_tokens(source):
+    lex = lexer.clone()
+    lex.input(source)
+    return list(iter(lex.token, None))
+
+
+def fast_tokens(source):
+    tokenizer = Tokenizer()
+    tokenizer.input(source)
+    return list(iter(tokenizer.token, None))
+
+
+def old_locate(text, lexpos):
+    """Wie print_error_with_caret vorher: Text zerlegen, Zeilenlängen summieren"""
+    lines = text.split("\n")
+    line_start = 0
+    for lineno, line in enumerate(lines, 1):
+        if lexpos <= line_start + len(line):
+            return lineno, lexpos - line_start
+        line_start += len(line) + 1
+    return len(lines), 0
+
+
+def timed(f, *args):
+    start = time.perf_counter()
+    result = f(*args)
+    return result, time.perf_counter() - start
+
+
+def main(megabytes=4.0, errors=20):
+    source = make_source(megabytes)
+    print(f"{len(source) / 2**20:.1f} MB, {source.count(chr(10))} Zeilen")
+    ply, ply_time = timed(ply_tokens, source)
+    fast, fast_time = timed(fast_tokens, source)
+    assert [(t.type, t.value, t.lexpos) for t in ply] == [(t.type, t.value, t.lexpos) for t in fast]
+    print(f"{'PLY-Lexer':<12} {ply_time:8.2f} s  {len(ply) / ply_time / 1e6:6.2f} M Tokens/s")
+    print(f"{'Tokenizer':<12} {fast_time:8.2f} s  {len(fast) / fast_time / 1e6:6.2f} M Tokens/s  ({ply_time / fast_time:.1f}x)")
+
+    positions = [len(source) * i // errors for i in range(errors)]
+    _, old_time = timed(lambda: [old_locate(source, p) for p in positions])
+    index = LineIndex(source)
+    _, build_time = timed(index.locate, 0)
+    _, index_time = timed(lambda: [index.locate(p) for p in positions])
+    print(f"{errors} Fehlerstellen: alt {old_time * 1000:.1f} ms, LineIndex {build_time * 1000:.1f} ms Aufbau + {index_time * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*(float(a) for a in sys.argv[1:2]))
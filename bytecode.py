@@ -0,0 +1,278 @@
+from analysis import ASSIGNED, READ, counter_usage
+from _lambda import Signature
+from interpreter import bin_operations, unary_operations, func_list
+
+# Kompakter Bytecode für die VM in vm.py. Eine Instruktion besteht immer
+# aus zwei Ints [opcode, arg] in einer flachen Liste, alles was mehr als ein
+# Argument braucht, liegt als Tupel in der Konstantentabelle.
+
+CONST = 0  # push consts[arg]
+LOAD = 1  # push env[consts[arg]]
+STORE = 2  # env[name] = pop, push env[name]
+STORE_OP = 3  # consts[arg] = (name, op): env[name] = op(env[name], pop)
+BINOP = 4  # b = pop, a = pop, push consts[arg](a, b)
+UNARY = 5  # push consts[arg](pop)
+POP = 6
+JUMP = 7
+JUMP_IF_FALSE = 8  # pop, springen wenn falsy
+JUMP_IF_NOT_ONE = 9  # pop, springen wenn != 1
+COMPARE_CHAIN = 10  # consts[arg] = [op, ziel]: Kettenglied, bei falsch 0 und springen
+LOOP_INIT = 11  # consts[arg] = (counter, left, right): b = pop, a = pop
+LOOP_NEXT = 12  # Zähler consts[arg] erhöhen und folgenden JUMP überspringen
+LOOP_EXIT = 13  # Ergebnis über die Schleifengrenze schieben
+MAKE_LAMBDA = 14  # consts[arg] = (signature, keywords, varargs, body_code)
+CALL = 15  # consts[arg] = Liste von ("pos",) / ("keyword", name)
+RETURN = 16
+LET_ENTER = 17  # neues Environment mit consts[arg]
+LET_EXIT = 18
+BUILTIN = 19  # consts[arg] = (builtin, anzahl)
+BUILD_ARRAY = 20  # pop arg Werte als Liste
+INDEX = 21  # i = pop, arr = pop
+INDEX_HEAD = 22  # arr[.]
+INDEX_TAIL = 23  # arr[*]
+CONS = 24  # b = pop, a = pop, push Cons(a, b)
+UNKNOWN = 25  # print unknown expression consts[arg], push -1
+RANGE_INIT = 26  # wie LOOP_INIT, Endwert sofort schreiben, push iter(range(...))
+RANGE_NEXT = 27  # nächster Wert, env[consts[arg]] nur wenn Name nicht None
+
+opnames = {v: k for k, v in dict(globals()).items() if k.isupper() and isinstance(v, int)}
+
+
+class Code:
+    """Kompilierter Bytecode mit Konstantentabelle"""
+
+    __slots__ = ("ops", "consts")
+
+    def __init__(self):
+        self.ops: list = []  # [opcode, arg, opcode, arg, ...]
+        self.consts: list = []
+
+    def emit(self, op, arg=0):
+        self.ops += (op, arg)
+        return len(self.ops) - 2
+
+    def const(self, value):
+        self.consts.append(value)
+        return len(self.consts) - 1
+
+    def patch(self, pos, target=None):
+        """Sprungziel einer Instruktion nachträglich setzen"""
+        self.ops[pos + 1] = len(self.ops) if target is None else target
+
+    def __repr__(self):
+        return "\n".join(
+            f"{i:4} {opnames[self.ops[i]]:16} {self.ops[i + 1]}"
+            for i in range(0, len(self.ops), 2)
+        )
+
+
+def _truth(x):
+    return int(bool(x))
+
+
+def _compile_seq(body, code):
+    for expr in body[:-1]:
+        _compile(expr, code)
+        code.emit(POP)
+    _compile(body[-1], code)
+
+
+def _compile(expression, code: Code):
+    match expression:
+        case ("num", n) | ("float", n) | ("const", n):
+            code.emit(CONST, code.const(n))
+        case ("str", n):
+            code.emit(CONST, code.const(str(n)))
+        case ("complex", imag):
+            _compile(imag, code)
+            code.emit(UNARY, code.const(unary_operations["imag"]))
+        case ("var", n):
+            code.emit(LOAD, code.const(n))
+
+        case ("binop", ("and" | "or") as op, expr1, expr2):
+            # Kurzschluss über Sprünge, Ergebnis ist immer 0 oder 1
+            _compile(expr1, code)
+            right = code.emit(JUMP_IF_FALSE)
+            if op == "and":
+                _compile(expr2, code)
+                code.emit(UNARY, code.const(_truth))
+                end = code.emit(JUMP)
+                code.patch(right)
+                code.emit(CONST, code.const(0))
+            else:
+                code.emit(CONST, code.const(1))
+                end = code.emit(JUMP)
+                code.patch(right)
+                _compile(expr2, code)
+                code.emit(UNARY, code.const(_truth))
+            code.patch(end)
+
+        case ("binop", op, expr1, expr2):
+            _compile(expr1, code)
+            _compile(expr2, code)
+            code.emit(BINOP, code.const(bin_operations[op]))
+
+        case ("comparison", op, x, y):
+            # Mittlere Operanden bleiben für das nächste Glied auf dem Stack
+            _compile(x, code)
+            links = []
+            while y[0] == "comparison":
+                _compile(y[2], code)
+                link = [bin_operations[op], None]
+                code.emit(COMPARE_CHAIN, code.const(link))
+                links.append(link)
+                op, y = y[1], y[3]
+            _compile(y, code)
+            code.emit(BINOP, code.const(bin_operations[op]))
+            for link in links:
+                link[1] = len(code.ops)
+
+        case ("assign", op, var, val):
+            _compile(val, code)
+            if op is None:
+                code.emit(STORE, code.const(var))
+            else:
+                code.emit(STORE_OP, code.const((var, bin_operations[op])))
+
+        case ("unary", op, expr):
+            _compile(expr, code)
+            code.emit(UNARY, code.const(unary_operations[op]))
+
+        case ("seq", body):
+            _compile_seq(body, code)
+
+        case ("if", condition, then_body, else_body):
+            ends = []
+            _compile(condition, code)
+            skip = code.emit(JUMP_IF_NOT_ONE)
+            _compile_seq(then_body, code)
+            ends.append(code.emit(JUMP))
+            code.patch(skip)
+            for cond, statement in else_body or ():
+                if cond == "None":
+                    _compile_seq(statement, code)
+                    break
+                _compile(cond, code)
+                skip = code.emit(JUMP_IF_FALSE)
+                _compile_seq(statement, code)
+                ends.append(code.emit(JUMP))
+                code.patch(skip)
+            else:
+                code.emit(CONST, code.const(None))
+            for pos in ends:
+                code.patch(pos)
+
+        case ("while", condition, body):
+            code.emit(CONST, code.const(None))
+            top = len(code.ops)
+            _compile(condition, code)
+            exit = code.emit(JUMP_IF_FALSE)
+            code.emit(POP)
+            _compile_seq(body, code)
+            code.emit(JUMP, top)
+            code.patch(exit)
+
+        case ("loop", counter, interval, body):
+            left_interval, expr1, expr2, right_interval = interval
+            _compile(expr1, code)
+            _compile(expr2, code)
+            left = 1 if left_interval == "]" else 0
+            right = 1 if right_interval == "[" else 0
+            usage = counter_usage(counter, body)
+            if usage == ASSIGNED:
+                code.emit(LOOP_INIT, code.const((counter, left, right)))
+                code.emit(CONST, code.const(None))
+                top = code.emit(LOOP_NEXT, code.const(counter))
+            else:
+                # Zähler läuft als range-Iterator auf dem Stack
+                code.emit(RANGE_INIT, code.const((counter, left, right)))
+                code.emit(CONST, code.const(None))
+                top = code.emit(RANGE_NEXT, code.const(counter if usage == READ else None))
+            exit = code.emit(JUMP)
+            code.emit(POP)
+            _compile_seq(body, code)
+            code.emit(JUMP, top)
+            code.patch(exit)
+            code.emit(LOOP_EXIT)
+
+        case ("lambda", parameter, body):
+            # Defaults werden wie in parse_lambda_parameters beim Erzeugen ausgewertet
+            params, keywords, varargs = [], [], None
+            for param in parameter[1]:
+                match param:
+                    case "keyword", var, expr:
+                        _compile(expr, code)
+                        keywords.append(var)
+                    case "infty", var:
+                        varargs = var
+                    case "pos", var:
+                        params.append(var)
+            signature = Signature(params, keywords, varargs)
+            code.emit(MAKE_LAMBDA, code.const((signature, keywords, varargs, compile_code(body))))
+
+        case ("call", func, args_expr):
+            _compile(func, code)
+            kinds = []
+            for param in args_expr[1]:
+                match param:
+                    case "pos", expr:
+                        _compile(expr, code)
+                        kinds.append(("pos",))
+                    case "keyword", var, expr:
+                        _compile(expr, code)
+                        kinds.append(("keyword", var[1]))
+            code.emit(CALL, code.const(kinds))
+
+        case ("let", ("assign", op, var, val) as asgn, body):
+            code.emit(LET_ENTER, code.const(var))
+            _compile(asgn, code)
+            code.emit(POP)
+            _compile(body, code)
+            code.emit(LET_EXIT)
+
+        case ("function", func, params):
+            for expr in params:
+                _compile(expr, code)
+            code.emit(BUILTIN, code.const((func_list[func], len(params))))
+
+        case ("array", list_elements):
+            for elem in list_elements:
+                _compile(elem, code)
+            code.emit(BUILD_ARRAY, len(list_elements))
+
+        case ("array_access", array_ptr, index):
+            _compile(array_ptr, code)
+            if index == ".":
+                code.emit(INDEX_HEAD)
+            elif index == "*":
+                code.emit(INDEX_TAIL)
+            else:
+                _compile(index, code)
+                code.emit(INDEX)
+
+        case ("list", list_elements):
+            # list(a, b, c) == a & (b & (c & leere))
+            for elem in list_elements:
+                _compile(elem, code)
+            code.emit(CONST, code.const(None))
+            for _ in list_elements:
+                code.emit(CONS)
+
+        case ("cons", expr1, expr2):
+            _compile(expr1, code)
+            _compile(expr2, code)
+            code.emit(CONS)
+
+        case ("leere"):
+            code.emit(CONST, code.const(None))
+
+        case _:
+            code.emit(UNKNOWN, code.const(expression))
+
+
+def compile_code(expression) -> Code:
+    """Übersetzt einen AST in Bytecode, der Wert bleibt oben auf dem Stack"""
+    code = Code()
+    _compile(expression, code)
+    code.emit(RETURN)
+    return code
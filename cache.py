@@ -0,0 +1,101 @@
+import hashlib
+import marshal
+import os
+import shutil
+from pathlib import Path
+from lexer import GRAMMAR_VERSION
+import positions
+
+# AST-Cache auf der Platte: Schlüssel ist ein Hash aus Quelltext und
+# GRAMMAR_VERSION, gespeichert wird der AST aus parser.parse zusammen mit den
+# Offsets seiner SourceMap (positions.py) mit marshal.
+# Einträge liegen in CACHE_DIR/v<GRAMMAR_VERSION>/, Verzeichnisse anderer
+# Versionen werden beim ersten Schreiben gelöscht.
+
+CACHE_DIR = Path(os.environ.get("INCC25_CACHE", Path(__file__).resolve().parent / ".incc25_cache"))
+CACHE_FORMAT = 2  # 2: (ast, offsets) statt nur ast
+_evicted = False
+
+
+def _version_dir():
+    return Path(CACHE_DIR) / f"v{GRAMMAR_VERSION}"
+
+
+def cache_key(source: str):
+    return hashlib.sha256(f"{GRAMMAR_VERSION}\0{CACHE_FORMAT}\0{source}".encode()).hexdigest()
+
+
+def evict_stale():
+    """Cache-Verzeichnisse anderer Grammatik-Versionen entfernen"""
+    global _evicted
+    _evicted = True
+    if not Path(CACHE_DIR).is_dir():
+        return
+    current = _version_dir().name
+    for d in Path(CACHE_DIR).iterdir():
+        if d.is_dir() and d.name.startswith("v") and d.name != current:
+            shutil.rmtree(d, ignore_errors=True)
+
+
+def load_entry(source: str):
+    """(ast, offsets) aus dem Cache oder None"""
+    try:
+        data = (_version_dir() / f"{cache_key(source)}.ast").read_bytes()
+        ast, offsets = marshal.loads(data)
+        return ast, offsets
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def load(source: str):
+    """AST aus dem Cache oder None"""
+    entry = load_entry(source)
+    return None if entry is None else entry[0]
+
+
+def store(source: str, ast, offsets=b""):
+    if not _evicted:
+        evict_stale()
+    d = _version_dir()
+    path = d / f"{cache_key(source)}.ast"
+    try:
+        d.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        data = marshal.dumps((ast, offsets))
+        # numpy-Werte (z.B. gefaltete Konstanten) schreibt marshal still als bytes
+        if marshal.loads(data) != (ast, offsets):
+            raise ValueError("AST nicht mit marshal speicherbar")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)  # atomar, parallele Läufe sehen nie halbe Dateien
+    except (OSError, ValueError):  # ValueError: Wert, den marshal nicht kann
+        pass  # ohne Cache geht es auch
+
+
+def parse_cached(source: str, filename=None):
+    """Wie parser.parse, aber Lexen und Parsen entfallen bei einem Cache-Treffer"""
+    entry = load_entry(source)
+    if entry is not None:
+        ast, offsets = entry
+        positions.register(positions.SourceMap.from_bytes(ast, offsets, source, filename))
+        return ast
+    # Parser-Tabellen werden erst hier, bei einem Cache-Fehlschlag, geladen
+    ast, source_map = positions.parse_with_map(source, filename)
+    if ast is not None:  # Syntaxfehler nicht cachen
+        store(source, ast, source_map.offsets.tobytes())
+    return ast
+
+
+def read_source(path):
+    """Quelltext einer .incc25-Datei, bei Bedarf in { ... } eingeschlossen
+
+    Die Zeilen bleiben dabei, wo sie sind, damit Positionen zur Datei passen.
+    """
+    source = Path(path).read_text(encoding="utf-8")
+    stripped = source.strip("\n")
+    if not stripped.startswith("{") or not stripped.endswith("}"):
+        source = "{" + source + "\n}"
+    return source
+
+
+def parse_file(path):
+    return parse_cached(read_source(path), str(path))
@@ -0,0 +1,384 @@
+from environment import Environment, Frame
+from _array import make_array, scalar
+from _memo import MISSING, store_all
+from _list import Cons, from_values, list_head, list_tail
+from interpreter import bin_operations, unary_operations, func_list, eval
+from analysis import ASSIGNED, READ, counter_usage
+from resolver import resolve
+from _lambda import (
+    Lambda,
+    Signature,
+    TailCall,
+    bind_frame,
+    parse_call_arguments,
+)
+
+# Übersetzt den Tupel-AST aus parser.parse einmalig in einen Baum aus
+# Python-Closures. Jede Closure nimmt nur noch den aktuellen Frame entgegen,
+# das match auf die Knoten passiert also nur einmal beim Kompilieren und
+# nicht mehr bei jedem Schleifendurchlauf. Variablen sind vorher von
+# resolver.resolve auf (depth, slot)-Adressen abgebildet worden.
+
+
+# Während quicken.compile die Fabrik für sich spezialisierende Stellen
+# (binop, Vergleich, Aufruf), sonst None
+sites = None
+
+
+def _run(code, env):
+    """Ausführen einer kompilierten Closure (statt eval für call_lambda)"""
+    return code(env)
+
+
+def _const(value):
+    def f(env):
+        return value
+
+    return f
+
+
+def _call(lambda_obj, pos_args, keyword_args):
+    """Lambda-Aufruf mit Trampolin für die TailCalls kompilierter Bodies"""
+    pending = []  # (memo, key) wie in call_lambda
+    while True:
+        frame = bind_frame(lambda_obj, pos_args, keyword_args)
+        if isinstance(frame, Lambda):  # Partial Application
+            result = frame
+            break
+        memo = lambda_obj.memo
+        if memo is not None and (key := memo.key(frame)) is not None:
+            result = memo.lookup(key)
+            if result is not MISSING:
+                break
+            pending.append((memo, key))
+        result = lambda_obj.body(frame)
+        if type(result) is not TailCall:
+            break
+        lambda_obj, pos_args, keyword_args = result.lambda_obj, result.pos_args, result.keyword_args
+    if pending:
+        store_all(pending, result)
+    return result
+
+
+def _compile_seq(body, tail=False):
+    codes = [compile_ast(expr) for expr in body[:-1]]
+    codes.append(compile_ast(body[-1], tail))
+    if len(codes) == 1:
+        return codes[0]
+    init, last = codes[:-1], codes[-1]
+
+    def f(env):
+        for code in init:
+            code(env)
+        return last(env)
+
+    return f
+
+
+def _getter(address):
+    match address:
+        case ("local", 0, slot, _):
+            return lambda env: env.slots[slot]
+        case ("local", 1, slot, _):
+            return lambda env: env.parent.slots[slot]
+        case ("local", depth, slot, _):
+
+            def f(env):
+                for _ in range(depth):
+                    env = env.parent
+                return env.slots[slot]
+
+            return f
+        case ("global", n):
+
+            def f(env):
+                try:
+                    return env.globals[n]
+                except KeyError:
+                    raise Exception(f"variable {n} not found in environment {env.globals}")
+
+            return f
+
+
+def _setter(address):
+    match address:
+        case ("local", 0, slot, _):
+
+            def f(env, value):
+                env.slots[slot] = value
+
+            return f
+        case ("local", depth, slot, _):
+
+            def f(env, value):
+                for _ in range(depth):
+                    env = env.parent
+                env.slots[slot] = value
+
+            return f
+        case ("global", n):
+
+            def f(env, value):
+                env.globals[n] = value
+
+            return f
+
+
+def compile_ast(expression, tail=False):
+    """Übersetzt einen aufgelösten AST-Knoten in eine Closure f(frame)
+
+    Mit tail=True (Lambda-Body, letzte Anweisung, wenn-Zweige, sei-Body)
+    liefert ein Aufruf einen TailCall statt selbst zu rekursieren.
+    """
+    match expression:
+        case ("num", n) | ("float", n) | ("const", n):
+            return _const(n)
+        case ("str", n):
+            return _const(str(n))
+        case ("complex", imag):
+            a = compile_ast(imag)
+            op = unary_operations["imag"]
+            return lambda env: op(a(env))
+        case ("local", _, _, _) | ("global", _):
+            return _getter(expression)
+
+        case ("binop", "and", expr1, expr2):
+            a = compile_ast(expr1)
+            b = compile_ast(expr2)
+            return lambda env: int(bool(b(env))) if a(env) else 0
+        case ("binop", "or", expr1, expr2):
+            a = compile_ast(expr1)
+            b = compile_ast(expr2)
+            return lambda env: 1 if a(env) else int(bool(b(env)))
+
+        case ("binop", op, expr1, expr2):
+            a = compile_ast(expr1)
+            b = compile_ast(expr2)
+            if sites is not None:
+                return sites.binop(op, a, b)
+            op = bin_operations[op]
+            return lambda env: op(a(env), b(env))
+
+        case ("comparison", op, x, y):
+            # Kette a < b < c ... einmal flach machen, jeder Operand wird
+            # zur Laufzeit genau einmal ausgewertet
+            first = compile_ast(x)
+            links = []
+            while y[0] == "comparison":
+                links.append((bin_operations[op], compile_ast(y[2])))
+                op, y = y[1], y[3]
+            last_op, last = bin_operations[op], compile_ast(y)
+            if not links and sites is not None:
+                return sites.binop(op, first, last)
+            if not links:
+                return lambda env: last_op(first(env), last(env))
+
+            def f(env):
+                left = first(env)
+                for op, b in links:
+                    right = b(env)
+                    if not op(left, right):
+                        return 0
+                    left = right
+                return last_op(left, last(env))
+
+            return f
+
+        case ("assign", op, var, val):
+            y = compile_ast(val)
+            get, put = _getter(var), _setter(var)
+            if op is None:
+
+                def f(env):
+                    v = y(env)
+                    put(env, v)
+                    return v
+
+                return f
+            op = bin_operations[op]
+
+            def f(env):
+                v = y(env)
+                v = op(get(env), v)
+                put(env, v)
+                return v
+
+            return f
+
+        case ("unary", op, expr):
+            a = compile_ast(expr)
+            op = unary_operations[op]
+            return lambda env: op(a(env))
+
+        case ("seq", body):
+            return _compile_seq(body, tail)
+
+        case ("if", condition, then_body, else_body):
+            cond = compile_ast(condition)
+            then = _compile_seq(then_body, tail)
+            branches = [
+                (None if c == "None" else compile_ast(c), _compile_seq(statement, tail))
+                for c, statement in else_body or ()
+            ]
+
+            def f(env):
+                if cond(env) == 1:
+                    return then(env)
+                for c, statement in branches:
+                    if c is None or c(env):
+                        return statement(env)
+                return None
+
+            return f
+
+        case ("while", condition, body):
+            cond = compile_ast(condition)
+            body = _compile_seq(body)
+
+            def f(env):
+                result = None
+                while cond(env):
+                    result = body(env)
+                return result
+
+            return f
+
+        case ("loop", counter, interval, body):
+            left_interval, expr1, expr2, right_interval = interval
+            a_code = compile_ast(expr1)
+            b_code = compile_ast(expr2)
+            left = 1 if left_interval == "]" else 0
+            right = 1 if right_interval == "[" else 0
+            usage = counter_usage(counter, body)
+            body = _compile_seq(body)
+            get, put = _getter(counter), _setter(counter)
+
+            def f(env):
+                a = a_code(env)
+                b = b_code(env)
+                if not isinstance(a, int) or not isinstance(b, int):
+                    raise TypeError("Non-Int Type is not supported!")
+                a += left
+                b -= right
+                result = None
+                if usage == ASSIGNED:
+                    put(env, a)
+                    while get(env) < b:
+                        put(env, get(env) + 1)
+                        result = body(env)
+                    return result
+                if usage == READ:
+                    for i in range(a + 1, b + 1):
+                        put(env, i)
+                        result = body(env)
+                else:
+                    for _ in range(a + 1, b + 1):
+                        result = body(env)
+                put(env, max(a, b))
+                return result
+
+            return f
+
+        case ("lambda", parameter, body, names):
+            # Signatur einmal beim Kompilieren, Defaults bei jedem Erzeugen
+            params, defaults, varargs = [], [], None
+            for param in parameter[1]:
+                match param:
+                    case "keyword", var, expr:
+                        defaults.append((var, compile_ast(expr)))
+                    case "infty", var:
+                        varargs = var
+                    case "pos", var:
+                        params.append(var)
+            signature = Signature(params, [var for var, _ in defaults], varargs, names)
+            body = compile_ast(body, tail=True)
+
+            def f(env):
+                values = {var: code(env) for var, code in defaults}
+                return Lambda(params, varargs, values, body, env, names, signature)
+
+            return f
+
+        case ("call", func, args_expr):
+            func_code = compile_ast(func)
+            args_expr = (
+                args_expr[0],
+                [
+                    ("pos", compile_ast(p[1])) if p[0] == "pos"
+                    else ("keyword", p[1], compile_ast(p[2]))
+                    for p in args_expr[1]
+                ],
+            )
+            if sites is not None and all(p[0] == "pos" for p in args_expr[1]):
+                return sites.call(func_code, [code for _, code in args_expr[1]], tail)
+
+            def f(env):
+                func_obj = func_code(env)
+                if isinstance(func_obj, Lambda):
+                    pos_arg, key_arg = parse_call_arguments(args_expr, _run, env)
+                    if tail:
+                        return TailCall(func_obj, pos_arg, key_arg)
+                    return _call(func_obj, pos_arg, key_arg)
+                raise TypeError(f"Cannot call object of type {type(func_obj)}")
+
+            return f
+
+        case ("let", asgn, body, names):
+            asgn = compile_ast(asgn)
+            body = compile_ast(body, tail)
+
+            def f(env):
+                env2 = Frame(names, [None], env)
+                asgn(env2)
+                return body(env2)
+
+            return f
+
+        case ("function", func, params):
+            builtin = func_list[func]
+            codes = [compile_ast(expr) for expr in params]
+
+            def f(env):
+                # Builtins liefern einen kleinen AST zurück
+                return eval(builtin([code(env) for code in codes]), env)
+
+            return f
+
+        case ("array", list_elements):
+            codes = [compile_ast(elem) for elem in list_elements]
+            return lambda env: make_array([code(env) for code in codes])
+
+        case ("array_access", array_ptr, index):
+            arr_code = compile_ast(array_ptr)
+            if index == ".":
+                return lambda env: list_head(arr_code(env))
+            if index == "*":
+                return lambda env: list_tail(arr_code(env))
+            i_code = compile_ast(index)
+            return lambda env: scalar(arr_code(env)[i_code(env)])
+
+        case ("list", list_elements):
+            codes = [compile_ast(elem) for elem in list_elements]
+            return lambda env: from_values([code(env) for code in codes])
+
+        case ("cons", expr1, expr2):
+            a = compile_ast(expr1)
+            b = compile_ast(expr2)
+            return lambda env: Cons(a(env), b(env))
+
+        case ("leere"):
+            return _const(None)
+
+        case _:
+
+            def f(env):
+                print(f"unknown expression {expression}")
+                return -1
+
+            return f
+
+
+def run(expression, env: Environment):
+    """Kompiliert den AST und führt ihn direkt aus"""
+    # Oberster Frame ohne Slots, alle globalen Zugriffe gehen an env
+    return compile_ast(resolve(expression))(Frame({}, [], env, env))
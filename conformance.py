@@ -0,0 +1,145 @@
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Konformitäts-Läufer: führt .incc25-Programme parallel aus und vergleicht
+# das Ergebnis (wie von main.py ausgegeben) mit dem erwarteten Wert. Der
+# steht entweder als Kommentar in der Datei
+#
+#     # ergebnis: 23 #
+#
+# oder in einer Datei daneben (test1.incc25 -> test1.expected). Programme
+# ohne Erwartung müssen nur fehlerfrei durchlaufen. Programme, die scheitern
+# sollen, tragen stattdessen
+#
+#     # fehler: variable fac not found #
+#
+# und bestehen nur, wenn sie mit einer Meldung abbrechen, die den Text enthält.
+
+BASE_DIR = Path(__file__).resolve().parent
+EXPECTED_MARKER = re.compile(r"#\s*ergebnis:\s*(.*?)\s*#")
+ERROR_MARKER = re.compile(r"#\s*fehler:\s*(.*?)\s*#")
+IGNORE_DIRS = {"__pycache__", ".incc25_cache"}
+
+PASS, FAIL, ERROR = "ok", "FALSCH", "FEHLER"
+
+
+def discover(paths):
+    """Alle .incc25-Dateien unter den Pfaden, sortiert"""
+    files = []
+    for p in map(Path, paths):
+        if p.is_dir():
+            files += [f for f in p.rglob("*.incc25") if not IGNORE_DIRS & set(f.parts)]
+        else:
+            files.append(p)
+    return sorted(files)
+
+
+def expected_result(path):
+    """Erwartetes Ergebnis als Text aus Kommentar oder .expected-Datei, sonst None"""
+    path = Path(path)
+    sidecar = path.with_suffix(".expected")
+    if sidecar.is_file():
+        return sidecar.read_text(encoding="utf-8").strip()
+    match = EXPECTED_MARKER.search(path.read_text(encoding="utf-8"))
+    return match.group(1) if match else None
+
+
+def expected_error(path):
+    """Text der erwarteten Fehlermeldung aus dem Kommentar, sonst None"""
+    match = ERROR_MARKER.search(Path(path).read_text(encoding="utf-8"))
+    return match.group(1) if match else None
+
+
+def run_one(job):
+    """(pfad, backend) -> (pfad, backend, status, ergebnis, erwartet, sekunden)
+
+    Läuft im Worker-Prozess, Parser und Backends werden dort nur einmal
+    geladen und für alle Dateien des Workers wiederverwendet.
+    """
+    from backend import BACKENDS
+    from cache import parse_file
+    from environment import Environment
+    from positions import failing_location
+
+    path, backend = job
+    expected = expected_result(path)
+    error = expected_error(path)
+    start = time.perf_counter()
+    try:
+        ast = parse_file(path)
+        if ast is None:
+            raise Exception("Syntaxfehler")
+        result = str(BACKENDS[backend](ast, Environment()))
+    except Exception as e:  # alles, was main.py abbrechen würde
+        message = f"{type(e).__name__}: {e}"
+        if where := failing_location(e):
+            message += f" (bei {where})"
+        status = PASS if error is not None and error in message else ERROR
+        return path, backend, status, message, expected, time.perf_counter() - start
+    seconds = time.perf_counter() - start
+    if error is not None:
+        return path, backend, FAIL, result, f"{ERROR}: {error}", seconds
+    status = PASS if expected is None or result == expected else FAIL
+    return path, backend, status, result, expected, seconds
+
+
+def run(paths, backends=("eval",), workers=None):
+    """Alle Dateien auf allen Backends, Ergebnisse in Datei-Reihenfolge"""
+    jobs = [(path, backend) for path in discover(paths) for backend in backends]
+    if not jobs:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        return [run_one(job) for job in jobs]
+    with ProcessPoolExecutor(workers) as pool:
+        # größere Häppchen sparen Rundreisen, wenn es Hunderte Dateien werden
+        return list(pool.map(run_one, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+
+
+def report(results, wall_time, out=sys.stdout):
+    for path, backend, status, result, expected, seconds in results:
+        try:
+            name = Path(path).resolve().relative_to(BASE_DIR)
+        except ValueError:
+            name = path
+        line = f"{status:<6} {seconds * 1000:8.1f} ms  {backend:<7} {name}"
+        if status == FAIL:
+            line += f"\n       erwartet {expected}, erhalten {result}"
+        elif status == ERROR:
+            line += f"\n       {result}"
+        print(line, file=out)
+    counts = {s: sum(r[2] == s for r in results) for s in (PASS, FAIL, ERROR)}
+    cpu_time = sum(r[5] for r in results)
+    print(
+        f"{len(results)} Läufe: {counts[PASS]} ok, {counts[FAIL]} falsch, {counts[ERROR]} Fehler"
+        f" in {wall_time:.2f} s (Summe der Läufe {cpu_time:.2f} s)",
+        file=out,
+    )
+    return counts[FAIL] + counts[ERROR] == 0
+
+
+def main(argv):
+    from backend import BACKENDS
+
+    backends, workers, paths = [], None, []
+    args = iter(argv)
+    for arg in args:
+        if arg == "-j":
+            workers = int(next(args))
+        elif arg == "-alle":
+            backends = list(BACKENDS)
+        elif arg[1:] in BACKENDS:
+            backends.append(arg[1:])
+        else:
+            paths.append(arg)
+    start = time.perf_counter()
+    results = run(paths or [BASE_DIR / "test"], backends or ["eval"], workers)
+    return report(results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(sys.argv[1:]) else 1)
@@ -1,3 +1,6 @@
+from hamt import HamtDict
+
+
 class Environment(dict):
     def __init__(self, parent=None):
         self.parent = parent
@@ -38,5 +41,71 @@ class Environment(dict):
         else:
             self.parent[name] = value
 
+    def snapshot(self):
+        """Zustand der eigenen Variablen, für restore, hier O(n)"""
+        return self.vars.copy()
+
+    def restore(self, snapshot):
+        self.vars = snapshot.copy()
+
     def __str__(self):
         return str(self.vars) + "\n" + str(self.parent)
+
+
+class PersistentEnvironment(Environment):
+    """Environment auf einer persistenten Hash-Map aus hamt.py
+
+    snapshot, restore und copy sind O(1), eine Zuweisung kopiert nur einen
+    Pfad im Trie. Gedacht für die globalen Variablen der REPL, die vor
+    jeder Eingabe gesichert und bei einem Fehler zurückgesetzt werden.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.vars = HamtDict()
+
+    def copy(self):
+        new_env = PersistentEnvironment(parent=self.parent)
+        new_env.vars = self.vars.copy()
+        return new_env
+
+    def snapshot(self):
+        return self.vars.map
+
+    def restore(self, snapshot):
+        self.vars.map = snapshot
+
+
+class Frame:
+    """Array-basiertes Environment für die (depth, slot)-Adressen aus resolver.py
+
+    names bildet Namen auf Slots ab und wird von allen Frames desselben
+    Lambdas geteilt. Über die Namen funktioniert der Frame auch wie ein
+    Environment (z.B. für Builtins), der schnelle Weg geht aber direkt
+    über slots und parent.
+    """
+
+    __slots__ = ("names", "slots", "parent", "globals")
+
+    def __init__(self, names: dict, slots: list, parent, globals=None):
+        self.names = names
+        self.slots = slots
+        self.parent = parent
+        self.globals = parent.globals if globals is None else globals
+
+    def __contains__(self, name):
+        return name in self.names or name in self.parent
+
+    def __getitem__(self, name):
+        if name in self.names:
+            return self.slots[self.names[name]]
+        return self.parent[name]
+
+    def __setitem__(self, name, value):
+        if name in self.names:
+            self.slots[self.names[name]] = value
+        else:
+            self.parent[name] = value
+
+    def __str__(self):
+        return str(dict(zip(self.names, self.slots))) + "\n" + str(self.parent)
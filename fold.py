@@ -0,0 +1,113 @@
+from interpreter import bin_operations, unary_operations
+
+# Optionaler Pass vor der Ausführung: konstante binop-, unary-, complex- und
+# Vergleichs-Teilbäume werden einmal ausgerechnet, z.B. 2 e 10 oder
+# 10 ** (4 | 2 + 3). Fehler wie Division durch 0 bleiben im Baum stehen und
+# treten wie bisher erst bei der Ausführung auf.
+
+MAX_EXPONENT = 4096  # größere Potenzen nicht schon beim Kompilieren ausrechnen
+
+
+def _literal(value):
+    """Knoten für einen ausgerechneten Wert"""
+    if type(value) is int:
+        return ("num", value)
+    if type(value) is float:
+        return ("float", value)
+    return ("const", value)  # z.B. numpy-Werte aus imag und uplus
+
+
+def _constant(node):
+    return isinstance(node, tuple) and len(node) == 2 and node[0] in ("num", "float", "const")
+
+
+def _apply(f, *args):
+    try:
+        return _literal(f(*args))
+    except Exception:
+        return None
+
+
+def _fold_all(body):
+    return [fold(expr) for expr in body]
+
+
+def fold(expression):
+    """Faltet konstante Teilbäume, der Rest des AST bleibt unverändert"""
+    match expression:
+        case ("binop", op, expr1, expr2):
+            a, b = fold(expr1), fold(expr2)
+            if _constant(a) and _constant(b):
+                too_big = op in ("power", "exp") and isinstance(b[1], int) and abs(b[1]) > MAX_EXPONENT
+                folded = None if too_big else _apply(bin_operations[op], a[1], b[1])
+                if folded is not None:
+                    return folded
+            return ("binop", op, a, b)
+        case ("unary", op, expr):
+            a = fold(expr)
+            if _constant(a):
+                return _apply(unary_operations[op], a[1]) or ("unary", op, a)
+            return ("unary", op, a)
+        case ("complex", imag):
+            a = fold(imag)
+            if _constant(a):
+                return _apply(unary_operations["imag"], a[1]) or ("complex", a)
+            return ("complex", a)
+        case ("comparison", _, _, _):
+            # Die Kette a < b < c ist rechts geschachtelt, die inneren
+            # comparison-Knoten sind Kettenglieder und nicht einzeln faltbar
+            ops, operands = [], []
+            tmp = expression
+            while tmp[0] == "comparison":
+                ops.append(tmp[1])
+                operands.append(fold(tmp[2]))
+                tmp = tmp[3]
+            operands.append(fold(tmp))
+            node = operands[-1]
+            for op, operand in zip(reversed(ops), reversed(operands[:-1])):
+                node = ("comparison", op, operand, node)
+            if not all(_constant(o) for o in operands):
+                return node
+
+            def chain():
+                funcs = [bin_operations[op] for op in ops]
+                return int(all(f(a[1], b[1]) for f, a, b in zip(funcs, operands, operands[1:])))
+
+            return _apply(chain) or node
+        case ("assign", op, var, val):
+            return ("assign", op, var, fold(val))
+        case ("seq", body):
+            return ("seq", _fold_all(body))
+        case ("if", condition, then_body, else_body):
+            if else_body is not None:
+                else_body = [
+                    (cond if cond == "None" else fold(cond), _fold_all(statement))
+                    for cond, statement in else_body
+                ]
+            return ("if", fold(condition), _fold_all(then_body), else_body)
+        case ("while", condition, body):
+            return ("while", fold(condition), _fold_all(body))
+        case ("loop", counter, (left, expr1, expr2, right), body):
+            return ("loop", counter, (left, fold(expr1), fold(expr2), right), _fold_all(body))
+        case ("lambda", (kind, params), body):
+            params = [("keyword", p[1], fold(p[2])) if p[0] == "keyword" else p for p in params]
+            return ("lambda", (kind, params), fold(body))
+        case ("call", func, (kind, args)):
+            args = [("pos", fold(p[1])) if p[0] == "pos" else ("keyword", p[1], fold(p[2])) for p in args]
+            return ("call", fold(func), (kind, args))
+        case ("let", asgn, body):
+            return ("let", fold(asgn), fold(body))
+        case ("function", func, params):
+            return ("function", func, _fold_all(params))
+        case ("array", list_elements):
+            return ("array", _fold_all(list_elements))
+        case ("array_access", array_ptr, index):
+            if index not in (".", "*"):
+                index = fold(index)
+            return ("array_access", fold(array_ptr), index)
+        case ("list", list_elements):
+            return ("list", _fold_all(list_elements))
+        case ("cons", expr1, expr2):
+            return ("cons", fold(expr1), fold(expr2))
+        case _:
+            return expression
@@ -0,0 +1,185 @@
+# Persistente Hash-Map (HAMT, hash array mapped trie): jede Änderung
+# kopiert nur den Pfad von der Wurzel zum Blatt (höchstens 13 Knoten mit je
+# bis zu 32 Einträgen), alles andere wird mit der alten Version geteilt.
+# Eine alte Version aufzuheben kostet also nichts, siehe
+# PersistentEnvironment in environment.py.
+
+BITS = 5
+MASK = (1 << BITS) - 1
+_NODE = object()  # Schlüssel-Markierung: der Wert daneben ist ein Unterknoten
+
+
+class _BitmapNode:
+    """Bis zu 32 Einträge, array = (k0, v0, k1, v1, ...) nur für belegte Bits"""
+
+    __slots__ = ("bitmap", "array")
+
+    def __init__(self, bitmap, array):
+        self.bitmap = bitmap
+        self.array = array
+
+    def get(self, shift, h, key, default):
+        bit = 1 << ((h >> shift) & MASK)
+        if not self.bitmap & bit:
+            return default
+        i = 2 * (self.bitmap & (bit - 1)).bit_count()
+        k, v = self.array[i], self.array[i + 1]
+        if k is _NODE:
+            return v.get(shift + BITS, h, key, default)
+        if k is key or k == key:
+            return v
+        return default
+
+    def assoc(self, shift, h, key, value):
+        """(neuer Knoten, ob ein Schlüssel dazugekommen ist)"""
+        bit = 1 << ((h >> shift) & MASK)
+        i = 2 * (self.bitmap & (bit - 1)).bit_count()
+        array = self.array
+        if not self.bitmap & bit:
+            return _BitmapNode(self.bitmap | bit, array[:i] + (key, value) + array[i:]), True
+        k, v = array[i], array[i + 1]
+        if k is _NODE:
+            child, added = v.assoc(shift + BITS, h, key, value)
+            if child is v:
+                return self, False
+            return _BitmapNode(self.bitmap, array[: i + 1] + (child,) + array[i + 2 :]), added
+        if k is key or k == key:
+            if v is value:
+                return self, False
+            return _BitmapNode(self.bitmap, array[: i + 1] + (value,) + array[i + 2 :]), False
+        # Anderer Schlüssel im selben Fach: beide eine Ebene tiefer
+        child = _pair(shift + BITS, hash(k), k, v, h, key, value)
+        return _BitmapNode(self.bitmap, array[:i] + (_NODE, child) + array[i + 2 :]), True
+
+    def items(self):
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] is _NODE:
+                yield from array[i + 1].items()
+            else:
+                yield array[i], array[i + 1]
+
+
+class _CollisionNode:
+    """Schlüssel mit exakt gleichem Hash"""
+
+    __slots__ = ("hash", "pairs")
+
+    def __init__(self, h, pairs):
+        self.hash = h
+        self.pairs = pairs
+
+    def get(self, shift, h, key, default):
+        for k, v in self.pairs:
+            if k is key or k == key:
+                return v
+        return default
+
+    def assoc(self, shift, h, key, value):
+        if h != self.hash:
+            node = _BitmapNode(1 << ((self.hash >> shift) & MASK), (_NODE, self))
+            return node.assoc(shift, h, key, value)
+        for i, (k, v) in enumerate(self.pairs):
+            if k is key or k == key:
+                if v is value:
+                    return self, False
+                return _CollisionNode(h, self.pairs[:i] + ((key, value),) + self.pairs[i + 1 :]), False
+        return _CollisionNode(h, self.pairs + ((key, value),)), True
+
+    def items(self):
+        return iter(self.pairs)
+
+
+def _pair(shift, h1, k1, v1, h2, k2, v2):
+    if h1 == h2:
+        return _CollisionNode(h1, ((k1, v1), (k2, v2)))
+    node, _ = _EMPTY.assoc(shift, h1, k1, v1)
+    node, _ = node.assoc(shift, h2, k2, v2)
+    return node
+
+
+_EMPTY = _BitmapNode(0, ())
+_MISSING = object()
+
+
+class HamtMap:
+    """Unveränderliche Map, set liefert eine neue Version"""
+
+    __slots__ = ("root", "size")
+
+    def __init__(self, root=_EMPTY, size=0):
+        self.root = root
+        self.size = size
+
+    def get(self, key, default=None):
+        return self.root.get(0, hash(key), key, default)
+
+    def set(self, key, value):
+        root, added = self.root.assoc(0, hash(key), key, value)
+        if root is self.root:
+            return self
+        return HamtMap(root, self.size + added)
+
+    def __getitem__(self, key):
+        value = self.root.get(0, hash(key), key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.root.get(0, hash(key), key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return (k for k, _ in self.root.items())
+
+    def items(self):
+        return self.root.items()
+
+    def __repr__(self):
+        return "{" + ", ".join(f"{k!r}: {v!r}" for k, v in self.items()) + "}"
+
+
+class HamtDict:
+    """Veränderlicher Griff auf eine HamtMap, verhält sich wie das vars-dict
+
+    map ist die aktuelle Version, Schnappschuss und Zurücksetzen sind nur
+    das Lesen bzw. Setzen dieses Attributs.
+    """
+
+    __slots__ = ("map",)
+
+    def __init__(self, hamt_map=None):
+        self.map: HamtMap = HamtMap() if hamt_map is None else hamt_map
+
+    def __getitem__(self, key):
+        return self.map[key]
+
+    def __setitem__(self, key, value):
+        self.map = self.map.set(key, value)
+
+    def __contains__(self, key):
+        return key in self.map
+
+    def __len__(self):
+        return len(self.map)
+
+    def __iter__(self):
+        return iter(self.map)
+
+    def get(self, key, default=None):
+        return self.map.get(key, default)
+
+    def items(self):
+        return self.map.items()
+
+    def keys(self):
+        return iter(self.map)
+
+    def copy(self):
+        return HamtDict(self.map)  # O(1), die Map selbst ändert sich nie
+
+    def __repr__(self):
+        return repr(self.map)
@@ -0,0 +1,99 @@
+from array import array
+
+import positions
+from positions import NO_POSITION, SourceMap, walk
+from lexer import lexer
+from stream import parse_tokens, split_statements
+
+# Inkrementelles Parsen für REPL und Editor: die Quelle wird mit dem
+# PLY-Lexer gelext, also mit denselben Tokens wie bei parser.parse, und an
+# den ; der obersten Ebene in Anweisungen zerlegt. Der AST jeder Anweisung
+# wird unter ihrem Text gemerkt, neu geparst werden nur Anweisungen, deren
+# Text es in der letzten Version nicht gab. Heraus kommt
+# derselbe ("seq", [...])-AST wie bei parser.parse, mit einer SourceMap, die
+# auch für wiederverwendete Anweisungen auf die aktuelle Stelle zeigt.
+
+
+class IncrementalParser:
+    """parse(quelltext) immer wieder aufrufen, nach jeder Änderung"""
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        # Text -> [(anweisung, Offsets relativ zum Anfang), ...], eine je Vorkommen
+        self._statements: dict = {}
+        self.reused = 0  # Statistik des letzten Aufrufs
+        self.parsed = 0
+
+    def parse(self, source):
+        """Wie positions.parse(source), None bei Syntaxfehler"""
+        lex = lexer.clone()
+        lex.input(source)
+        tokens = list(iter(lex.token, None))
+        if not _one_sequence(tokens):
+            # z.B. { a } ; b oder kein { ... }: der Parser soll den Fehler melden
+            self._statements = {}
+            return positions.parse(source, self.filename)
+
+        previous, current = self._statements, {}
+        statements, table = [], {}
+        self.reused = self.parsed = 0
+        for statement_tokens in split_statements(tokens):
+            start = statement_tokens[0].lexpos
+            last = statement_tokens[-1]
+            text = source[start : last.lexpos + len(last.value)]
+            seen = current.setdefault(text, [])
+            cached = previous.get(text, ())
+            if len(seen) < len(cached):
+                entry = cached[len(seen)]  # jedes Vorkommen bekommt eigene Knoten
+                self.reused += 1
+            else:
+                entry = self._parse_statement(statement_tokens, start)
+                if entry is None:
+                    self._statements = {}
+                    return None
+                self.parsed += 1
+            seen.append(entry)
+            statement, offsets = entry
+            statements.append(statement)
+            for node, offset in zip(walk(statement), offsets):
+                if offset != NO_POSITION:
+                    table[id(node)] = node, offset + start
+        self._statements = current  # nur die aktuelle Version behalten
+
+        ast = ("seq", statements)
+        table[id(ast)] = ast, tokens[0].lexpos
+        positions.register(SourceMap.build(ast, table, source, self.filename))
+        return ast
+
+    def _parse_statement(self, tokens, start):
+        seq, source_map = parse_tokens(tokens, register_map=False)
+        if seq is None:
+            return None
+        statement = seq[1][0]
+        offsets = array("q")
+        for node in walk(statement):
+            offset = source_map.offset(node)
+            offsets.append(NO_POSITION if offset is None else offset - start)
+        return statement, offsets
+
+
+def _one_sequence(tokens):
+    """Ist die Quelle genau ein { ... } ohne leere Anweisungen?
+
+    split_statements überspringt ;; stillschweigend, der Parser nicht.
+    """
+    if not tokens or tokens[0].type != "BEGIN" or tokens[-1].type != "END":
+        return False
+    depth = 0
+    previous = None
+    for i, tok in enumerate(tokens):
+        if tok.type == "BEGIN":
+            depth += 1
+        elif tok.type == "END":
+            depth -= 1
+            if depth == 0:
+                return i == len(tokens) - 1
+        elif tok.type == "SEMICOLON" and depth == 1 and previous in ("BEGIN", "SEMICOLON"):
+            return False
+        previous = tok.type
+    return False
@@ -1,8 +1,22 @@
-import numpy as np
+from analysis import ASSIGNED, READ, cached_counter_usage
 from environment import Environment
+from _array import (
+    ArrayView,
+    as_int,
+    is_array,
+    lazy_numpy,
+    make_array,
+    maximum,
+    minimum,
+    scalar,
+    summe,
+)
+from _list import Cons, from_values, list_head, list_tail
 from _lambda import (
     Lambda,
+    TailCall,
     call_lambda,
+    memoize,
     parse_call_arguments,
     parse_lambda_parameters,
 )
@@ -17,35 +31,41 @@ bin_operations = {
     "divide_ceil": lambda x, y: -(-x // y),
     "mod": lambda x, y: x % y,
     "exp": lambda x, y: x * 10**y,
-    "and": lambda x, y: bool(x) * bool(y),
-    "or": lambda x, y: bool(x) + bool(y),
+    "and": lambda x, y: int(bool(x) and bool(y)),
+    "or": lambda x, y: int(bool(x) or bool(y)),
     "xor": lambda x, y: +bool(bool(x) - bool(y)),
-    "equals": lambda x, y: int(x == y),
-    "greater_than": lambda x, y: int(x > y),
-    "smaller_than": lambda x, y: int(x < y),
-    "greater_equals": lambda x, y: int(x >= y),
-    "smaller_equals": lambda x, y: int(x <= y),
-    "unequals": lambda x, y: int(x != y),
+    "equals": lambda x, y: as_int(x == y),
+    "greater_than": lambda x, y: as_int(x > y),
+    "smaller_than": lambda x, y: as_int(x < y),
+    "greater_equals": lambda x, y: as_int(x >= y),
+    "smaller_equals": lambda x, y: as_int(x <= y),
+    "unequals": lambda x, y: as_int(x != y),
 }
 
 unary_operations = {
     "not": lambda x: int(not x),
-    "uplus": lambda x: np.abs(x),
+    "uplus": lambda x: lazy_numpy().abs(x),
     "uminus": lambda x: -x,
-    "imag": lambda x: np.complex64(0, x),
+    "imag": lambda x: lazy_numpy().complex64(0, x),
 }
 
 
-def eval(expression, env: Environment):
+def _scope_of(env, name):
+    """Das dict, in das env[name] = ... schreiben würde"""
+    while isinstance(env, Environment):
+        if name in env.vars or env.parent is None:
+            return env.vars
+        env = env.parent
+    return env
+
+
+def eval(expression, env: Environment, tail=False):
+    # tail=True nur aus call_lambda: ein Aufruf in Tail-Position wird dann
+    # nicht ausgeführt, sondern als TailCall an call_lambda zurückgegeben
     match expression:
-        case ("num", n):
-            if n.startswith("0b"):
-                return int(n, 2)
-            if n.startswith("0x"):
-                return int(n, 16)
-            return int(n)
-        case ("float", n):
-            return float(n)
+        case ("num", n) | ("float", n) | ("const", n):
+            # Literale sind schon beim Parsen umgewandelt (parser.p_number)
+            return n
         case ("str", n):
             return str(n)
         case ("complex", imag):
@@ -56,25 +76,27 @@ def eval(expression, env: Environment):
                 raise Exception(f"variable {n} not found in environment {env}")
             return env[n]
 
+        case ("binop", "and", expr1, expr2):
+            # Kurzschluss: rechte Seite nur auswerten, wenn sie noch zählt
+            return int(bool(eval(expr2, env))) if eval(expr1, env) else 0
+        case ("binop", "or", expr1, expr2):
+            return 1 if eval(expr1, env) else int(bool(eval(expr2, env)))
+
         case ("binop", op, expr1, expr2):
             x = eval(expr1, env)
             y = eval(expr2, env)
             return bin_operations[op](x, y)
 
-        case ("comparison", f, x, y):
-            ops = []
-            expr1 = []
-            expr2 = []
-            ops.append(f)
-            expr1.append(x)
-            tmp = y
-            while tmp[0] == 'comparison':
-                ops.append(tmp[1])
-                expr2.append(tmp[2])
-                expr1.append(tmp[2])
-                tmp = tmp[3]
-            expr2.append(tmp)
-            return int(all([bin_operations[ops[i]](eval(expr1[i], env), eval(expr2[i], env)) for i in range(len(ops))]))
+        case ("comparison", op, x, y):
+            # Kette a < b < c ist rechts geschachtelt: jeder Operand wird
+            # genau einmal ausgewertet, beim ersten falschen Glied ist Schluss
+            left = eval(x, env)
+            while y[0] == "comparison":
+                right = eval(y[2], env)
+                if not bin_operations[op](left, right):
+                    return 0
+                op, left, y = y[1], right, y[3]
+            return bin_operations[op](left, eval(y, env))
 
         case ("assign", op, var, val):
             y = eval(val, env)
@@ -91,31 +113,16 @@ def eval(expression, env: Environment):
         case ("seq", body):
             for expr in body[:-1]:
                 eval(expr, env)
-            return eval(body[-1], env)
+            return eval(body[-1], env, tail)
 
         case ("if", condition, then_body, else_body):
-            if else_body is None:  # Fall kein else
-                if eval(condition, env) == 1:
-                    # statements handling
-                    return eval(("seq", then_body), env)
-                    for expr in then_body[:-1]:
-                        eval(expr, env)
-                    return eval(then_body[-1], env)
-                else:
-                    return None
-            else:
-                for cond, statement in else_body:
-                    if cond == "None":
-                        return eval(("seq", statement), env)
-                        for expr in statement[:-1]:
-                            eval(expr, env)
-                        return eval(statement[-1], env)
-                    elif eval(cond, env):
-                        return eval(("seq", statement), env)
-                        for expr in statement[:-1]:
-                            eval(expr, env)
-                        return eval(statement[-1], env)
-                return None
+            if eval(condition, env) == 1:
+                return eval(("seq", then_body), env, tail)
+            # ,aber wenn ... / sonst: Bedingung "None" steht für den sonst-Zweig
+            for cond, statement in else_body or ():
+                if cond == "None" or eval(cond, env):
+                    return eval(("seq", statement), env, tail)
+            return None
 
         case ("while", condition, body):
             result = None
@@ -133,13 +140,30 @@ def eval(expression, env: Environment):
             a += 1 if left_interval == "]" else 0
             b -= 1 if right_interval == "[" else 0
 
-            env[counter] = a
             result = None
-            while env[counter] < b:
-                env[counter] += 1
-                result = eval(("seq", body), env)
-                # for _b in body:
-                #     result = eval(_b, env)
+            usage = cached_counter_usage(counter, body)
+            if usage == ASSIGNED:
+                # Rumpf kann den Zähler ändern, also jedes Mal neu lesen
+                env[counter] = a
+                while env[counter] < b:
+                    env[counter] += 1
+                    for expr in body:
+                        result = eval(expr, env)
+                return result
+
+            # Zähler als Python-int, ins Environment nur schreiben, wenn der
+            # Rumpf ihn liest, danach steht wie bisher der letzte Wert drin
+            scope = _scope_of(env, counter)
+            if usage == READ:
+                for i in range(a + 1, b + 1):
+                    scope[counter] = i
+                    for expr in body:
+                        result = eval(expr, env)
+            else:
+                for _ in range(a + 1, b + 1):
+                    for expr in body:
+                        result = eval(expr, env)
+            scope[counter] = max(a, b)
             return result
 
         case ("lambda", parameter, body):
@@ -154,6 +178,8 @@ def eval(expression, env: Environment):
             if isinstance(func_obj, Lambda):
                 pos_arg, key_arg = parse_call_arguments(args_expr, eval, env)
                 # print("Diese Argumenten wurden geparst", pos_arg, key_arg)
+                if tail:
+                    return TailCall(func_obj, pos_arg, key_arg)
                 return call_lambda(func_obj, pos_arg, key_arg, eval, env)
 
             else:
@@ -162,9 +188,9 @@ def eval(expression, env: Environment):
 
         case ("let", ("assign", op, var, val) as asgn, body):
             env2 = Environment(env)
-            env2.put(var)
+            env2.put([var])
             eval(asgn, env2)
-            return eval(body, env2)
+            return eval(body, env2, tail)
 
         case ("function", func, params):
             a = []
@@ -177,28 +203,23 @@ def eval(expression, env: Environment):
             for elem in list_elements:
                 a = eval(elem, env)
                 arr.append(a)
-            return arr
+            return make_array(arr)
 
         case ("array_access", array_ptr, index):
             arr = eval(array_ptr, env)
             if index == ".":
-                return arr[0]
+                return list_head(arr)
             elif index == "*":
-                if len(arr) == 2:
-                    return arr[1]
-                return arr[1:]
+                return list_tail(arr)
             else:
                 i = eval(index, env)
-                return arr[i]
+                return scalar(arr[i])
 
         case ("list", list_elements):
-            # anonyme lambda func
-            return eval(
-                    ("cons", list_elements[0], ("list", list_elements[1:])) if len(list_elements) > 0 else ("leere"), env
-            )
+            return from_values([eval(elem, env) for elem in list_elements])
 
         case ("cons", expr1, expr2):
-            return eval(expr1, env), eval(expr2, env)
+            return Cons(eval(expr1, env), eval(expr2, env))
 
         case ("leere"):
             return None
@@ -212,9 +233,11 @@ def __länge(lst):
     """ Länge einer Liste/Array bestimmen"""
     if len(lst) != 1: 
         raise Exception("")
-    if not isinstance(lst[0], list):
+    if lst[0] is None:  # leere
+        return ("num", 0)
+    if not isinstance(lst[0], (list, Cons, ArrayView)) and not is_array(lst[0]):
         raise Exception("")
-    return ("num", str(len(lst[0])))
+    return ("num", len(lst[0]))
 
 
 def __echo(*lst):
@@ -223,11 +246,17 @@ def __echo(*lst):
 
 
 def __list(param):
-   return ("list", param)
+    # param sind schon ausgewertete Werte, kein AST mehr
+    return ("const", from_values(param))
 
 
 func_list = {
     "echo": __echo,
     "länge": __länge,
     "list": __list,
+    # Reduktionen, bei numpy-Arrays vektorisiert
+    "summe": lambda param: ("const", summe(param)),
+    "minimum": lambda param: ("const", minimum(param)),
+    "maximum": lambda param: ("const", maximum(param)),
+    "merke": lambda param: ("const", memoize(*param)),
 }
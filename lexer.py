@@ -1,7 +1,19 @@
+import os
+import re
+from bisect import bisect_right
 from ply.lex import Lexer, lex
 
 module = __import__(__name__)
 
+# Version von Tokens und Grammatik: bei jeder Änderung an lexer.py oder
+# parser.py erhöhen, dann werden Tabellen (make tables) und AST-Cache neu gebaut
+GRAMMAR_VERSION = 5
+# INCC25_DEV=1 prüft alle Regeln und schreibt die Tabellen neu,
+# sonst werden nur die eingefrorenen Tabellen geladen
+DEV = os.environ.get("INCC25_DEV") == "1"
+TABLE_DIR = os.path.dirname(os.path.abspath(__file__))
+LEXTAB = f"lextab_v{GRAMMAR_VERSION}"
+
 
 def rule_lexer(doc, name):
     def f(t):
@@ -64,6 +76,10 @@ table = {
     "echo": "ECHO",
     "länge": "LENGTH",
     "list": "LIST",
+    "summe": "SUM",
+    "minimum": "MIN",
+    "maximum": "MAX",
+    "merke": "MEMO",
     "&": "CONS",
     "leere": "NULL",
     "sei": "LET",  # Ist schon ein Letrec
@@ -86,22 +102,52 @@ for rule, func_name in table.items():
     rule_lexer(rule, func_name)
 
 
-def print_error_with_caret(text, lineno, lexpos):
-    # Zeile ermitteln
-    lines = text.split("\n")
-    if lineno - 1 >= len(lines):
-        print("Ungültige Zeilennummer.")
-        return
+class LineIndex:
+    """Zeilenanfänge eines Textes, beim ersten locate einmal berechnet
+
+    Danach kostet jede Abfrage nur eine binäre Suche.
+    """
+
+    __slots__ = ("text", "_starts")
+
+    def __init__(self, text):
+        self.text = text
+        self._starts = None
+
+    def locate(self, pos):
+        """(zeile ab 1, spalte ab 0) eines Offsets"""
+        if self._starts is None:
+            self._starts = [0] + [m.end() for m in re.finditer("\n", self.text)]
+        line = bisect_right(self._starts, pos)
+        return line, pos - self._starts[line - 1]
 
-    error_line = lines[lineno - 1]
+    def line(self, lineno):
+        """Text der Zeile lineno ohne Zeilenumbruch"""
+        start = self._starts[lineno - 1]
+        end = self.text.find("\n", start)
+        return self.text[start:] if end < 0 else self.text[start:end]
 
-    # Position in Zeile berechnen
-    line_start = sum(len(line) + 1 for line in lines[: lineno - 1])  # +1 für \n
-    column = max(0, lexpos - line_start)
+
+_line_index = None
+
+
+def line_index(text):
+    """LineIndex für text, für denselben Text (z.B. bei mehreren Fehlern) wiederverwendet"""
+    global _line_index
+    if _line_index is None or _line_index.text is not text:
+        _line_index = LineIndex(text)
+    return _line_index
+
+
+def print_error_with_caret(text, lineno, lexpos):
+    # Zeile und Spalte aus lexpos, lineno wird von t_newline nicht
+    # weitergezählt und ist deshalb nur ein Hinweis
+    index = line_index(text)
+    lineno, column = index.locate(max(0, min(lexpos, len(text))))
 
     # Ausgabe mit ^ unter dem Fehler
     print(f"Syntaxfehler in Zeile {lineno}:")
-    print(error_line)
+    print(index.line(lineno))
     print(" " * column + "^")
 
 
@@ -120,7 +166,11 @@ def t_error(t):
     return t
 
 
-lexer: Lexer = lex()
+if DEV:
+    lexer: Lexer = lex()
+    lexer.writetab(LEXTAB, TABLE_DIR)
+else:
+    lexer: Lexer = lex(optimize=True, lextab=LEXTAB, outputdir=TABLE_DIR)
 
 if __name__ == "__main__":
     while True:
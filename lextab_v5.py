@@ -0,0 +1,10 @@
+# lextab_v5.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'AND_ASSIGN', 'ASSIGN', 'BEGIN', 'CLOSED_BRACKETS', 'COLON', 'COMMA', 'CONS', 'DIVIDE', 'DIVIDE_ASSIGN', 'DIVIDE_CEIL', 'DIVIDE_CEIL_ASSIGN', 'DIVIDE_FLOOR', 'DIVIDE_FLOOR_ASSIGN', 'DOT', 'DOTS', 'ECHO', 'ELIF', 'ELSE', 'END', 'EQUALS', 'EQUALS_ASSIGN', 'EXP', 'EXP_ASSIGN', 'FLOAT', 'GREATER_EQUALS', 'GREATER_EQUALS_ASSIGN', 'GREATER_THAN', 'GREATER_THAN_ASSIGN', 'IDENTIFIER', 'IF', 'IMAG', 'IN', 'LAMBDA', 'LAMBDA_ARROW', 'LENGTH', 'LET', 'LIST', 'LOOP', 'LOOPTHEN', 'LPAREN', 'MAX', 'MEMO', 'MIN', 'MINUS', 'MINUS_ASSIGN', 'MOD', 'MOD_ASSIGN', 'NOT', 'NULL', 'NUMBER', 'OPEN_BRACKETS', 'OR', 'OR_ASSIGN', 'PLUS', 'PLUS_ASSIGN', 'POWER', 'POWER_ASSIGN', 'RPAREN', 'SEMICOLON', 'SMALLER_EQUALS', 'SMALLER_EQUALS_ASSIGN', 'SMALLER_THAN', 'SMALLER_THAN_ASSIGN', 'STRING', 'SUM', 'THEN', 'TIMES', 'TIMES_ASSIGN', 'UNEQUALS', 'UNEQUALS_ASSIGN', 'WHILE', 'XOR', 'XOR_ASSIGN'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_FLOAT>(\\d+\\.\\d*|\\.\\d+))|(?P<t_NUMBER>0x[0-9a-fA-F]+|0b(0|1[01]*)|\\d+)|(?P<t_STRING>"(?:\\\\.|[^"\\\\])*"|\\\'(?:\\\\.|[^\\\'\\\\])*\\\')|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_ASSIGN>:=)|(?P<t_SEMICOLON>;)|(?P<t_COLON>:)|(?P<t_CLOSED_BRACKETS>\\])|(?P<t_OPEN_BRACKETS>\\[)|(?P<t_BEGIN>\\{)|(?P<t_END>\\})|(?P<t_LAMBDA_ARROW>->)|(?P<t_DOTS>\\.\\.\\.)|(?P<t_DOT>\\.)|(?P<t_IF>wenn)|(?P<t_THEN>gilt,)|(?P<t_ELIF>,aber)|(?P<t_ELSE>sonst)|(?P<t_WHILE>solange)|(?P<t_LOOP>für)|(?P<t_LOOPTHEN>wiederhole)|(?P<t_IN>in)|(?P<t_LAMBDA>lambda)|(?P<t_ECHO>echo)|(?P<t_LENGTH>länge)|(?P<t_LIST>list)|(?P<t_SUM>summe)|(?P<t_MIN>minimum)|(?P<t_MAX>maximum)|(?P<t_MEMO>merke)|(?P<t_CONS>&)|(?P<t_NULL>leere)|(?P<t_LET>sei)|(?P<t_COMMA>,)|(?P<t_PLUS_ASSIGN>\\+:=)|(?P<t_MINUS_ASSIGN>-:=)|(?P<t_POWER_ASSIGN>\\*\\*:=)|(?P<t_TIMES_ASSIGN>\\*:=)|(?P<t_DIVIDE_CEIL_ASSIGN>/:=)|(?P<t_DIVIDE_FLOOR_ASSIGN>\\\\:=)|(?P<t_DIVIDE_ASSIGN>\\|:=)|(?P<t_EQUALS_ASSIGN>=:=)|(?P<t_UNEQUALS_ASSIGN>!=:=)|(?P<t_GREATER_EQUALS_ASSIGN>>=:=)|(?P<t_SMALLER_EQUALS_ASSIGN><=:=)|(?P<t_GREATER_THAN_ASSIGN>>:=)|(?P<t_SMALLER_THAN_ASSIGN><:=)|(?P<t_AND_ASSIGN>and:=)|(?P<t_OR_ASSIGN>or:=)|(?P<t_XOR_ASSIGN>xor:=)|(?P<t_MOD_ASSIGN>mod:=)|(?P<t_EXP_ASSIGN>e:=)|(?P<t_PLUS>\\+)|(?P<t_MINUS>-)|(?P<t_POWER>\\*\\*)|(?P<t_TIMES>\\*)|(?P<t_DIVIDE_CEIL>/)|(?P<t_DIVIDE_FLOOR>\\\\)|(?P<t_DIVIDE>\\|)|(?P<t_EQUALS>=)|(?P<t_UNEQUALS>!=)|(?P<t_GREATER_EQUALS>>=)|(?P<t_SMALLER_EQUALS><=)|(?P<t_GREATER_THAN>>)|(?P<t_SMALLER_THAN><)|(?P<t_AND>and)|(?P<t_OR>or)|(?P<t_XOR>xor)|(?P<t_MOD>mod)|(?P<t_EXP>e)|(?P<t_NOT>not)|(?P<t_IMAG>imag)|(?P<t_IDENTIFIER>(?:[^\\W\\d_]|[\\U0001F300-\\U0001FAFF_])(?:[^\\W_]|[\\d_]|[\\U0001F300-\\U0001FAFF])*)|(?P<t_newline>\\n+)|(?P<t_ignore_comment>\\#[^\\#]*\\#)', [None, ('t_FLOAT', 'FLOAT'), None, ('t_NUMBER', 'NUMBER'), None, ('t_STRING', 'STRING'), ('t_LPAREN', 'LPAREN'), ('t_RPAREN', 'RPAREN'), ('t_ASSIGN', 'ASSIGN'), ('t_SEMICOLON', 'SEMICOLON'), ('t_COLON', 'COLON'), ('t_CLOSED_BRACKETS', 'CLOSED_BRACKETS'), ('t_OPEN_BRACKETS', 'OPEN_BRACKETS'), ('t_BEGIN', 'BEGIN'), ('t_END', 'END'), ('t_LAMBDA_ARROW', 'LAMBDA_ARROW'), ('t_DOTS', 'DOTS'), ('t_DOT', 'DOT'), ('t_IF', 'IF'), ('t_THEN', 'THEN'), ('t_ELIF', 'ELIF'), ('t_ELSE', 'ELSE'), ('t_WHILE', 'WHILE'), ('t_LOOP', 'LOOP'), ('t_LOOPTHEN', 'LOOPTHEN'), ('t_IN', 'IN'), ('t_LAMBDA', 'LAMBDA'), ('t_ECHO', 'ECHO'), ('t_LENGTH', 'LENGTH'), ('t_LIST', 'LIST'), ('t_SUM', 'SUM'), ('t_MIN', 'MIN'), ('t_MAX', 'MAX'), ('t_MEMO', 'MEMO'), ('t_CONS', 'CONS'), ('t_NULL', 'NULL'), ('t_LET', 'LET'), ('t_COMMA', 'COMMA'), ('t_PLUS_ASSIGN', 'PLUS_ASSIGN'), ('t_MINUS_ASSIGN', 'MINUS_ASSIGN'), ('t_POWER_ASSIGN', 'POWER_ASSIGN'), ('t_TIMES_ASSIGN', 'TIMES_ASSIGN'), ('t_DIVIDE_CEIL_ASSIGN', 'DIVIDE_CEIL_ASSIGN'), ('t_DIVIDE_FLOOR_ASSIGN', 'DIVIDE_FLOOR_ASSIGN'), ('t_DIVIDE_ASSIGN', 'DIVIDE_ASSIGN'), ('t_EQUALS_ASSIGN', 'EQUALS_ASSIGN'), ('t_UNEQUALS_ASSIGN', 'UNEQUALS_ASSIGN'), ('t_GREATER_EQUALS_ASSIGN', 'GREATER_EQUALS_ASSIGN'), ('t_SMALLER_EQUALS_ASSIGN', 'SMALLER_EQUALS_ASSIGN'), ('t_GREATER_THAN_ASSIGN', 'GREATER_THAN_ASSIGN'), ('t_SMALLER_THAN_ASSIGN', 'SMALLER_THAN_ASSIGN'), ('t_AND_ASSIGN', 'AND_ASSIGN'), ('t_OR_ASSIGN', 'OR_ASSIGN'), ('t_XOR_ASSIGN', 'XOR_ASSIGN'), ('t_MOD_ASSIGN', 'MOD_ASSIGN'), ('t_EXP_ASSIGN', 'EXP_ASSIGN'), ('t_PLUS', 'PLUS'), ('t_MINUS', 'MINUS'), ('t_POWER', 'POWER'), ('t_TIMES', 'TIMES'), ('t_DIVIDE_CEIL', 'DIVIDE_CEIL'), ('t_DIVIDE_FLOOR', 'DIVIDE_FLOOR'), ('t_DIVIDE', 'DIVIDE'), ('t_EQUALS', 'EQUALS'), ('t_UNEQUALS', 'UNEQUALS'), ('t_GREATER_EQUALS', 'GREATER_EQUALS'), ('t_SMALLER_EQUALS', 'SMALLER_EQUALS'), ('t_GREATER_THAN', 'GREATER_THAN'), ('t_SMALLER_THAN', 'SMALLER_THAN'), ('t_AND', 'AND'), ('t_OR', 'OR'), ('t_XOR', 'XOR'), ('t_MOD', 'MOD'), ('t_EXP', 'EXP'), ('t_NOT', 'NOT'), ('t_IMAG', 'IMAG'), ('t_IDENTIFIER', 'IDENTIFIER'), ('t_newline', 'newline'), (None, None)])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
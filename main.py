@@ -1,13 +1,22 @@
-from parser import parser
-from environment import Environment
-from interpreter import eval
+from environment import Environment, PersistentEnvironment
+from backend import BACKENDS
+from cache import parse_file, read_source
+from fold import fold
+from incremental import IncrementalParser
 from lexer import lexer
+from stream import run_stream
+import positions
 import sys
+import transpiler
 
-env = Environment()
+env = PersistentEnvironment()  # Schnappschuss vor jeder Eingabe kostet O(1)
 
 
-def test_code(debug=False):
+def test_code(debug=False, backend="eval", fold_constants=False):
+    run = BACKENDS[backend]
+    # wiederholte oder nur teilweise geänderte Eingaben aus der History
+    # parst die Sitzung nur für die geänderten Anweisungen neu
+    session = IncrementalParser("<eingabe>")
     while True:
         i = input(">>> ")
         if i in " \t\n":
@@ -16,24 +25,91 @@ def test_code(debug=False):
             break
         i = "{" + i + "}"
         # try:
-        result = parser.parse(i, debug=debug)
+        result = positions.parse(i, debug=debug) if debug else session.parse(i)
+        if fold_constants and result is not None:
+            result = fold(result)
         if debug:
             print(result)
 
+        snapshot = env.snapshot()
         try:
-            r = eval(result, env)
+            r = run(result, env)
             print(r)
         except Exception as e:
+            # halbe Zuweisungen der fehlerhaften Eingabe zurücknehmen
+            env.restore(snapshot)
             print(e)
+            if where := positions.failing_location(e):
+                print("bei", where)
             print("Fehler bei der Eingabe: ", i)
 
 
+def run_file(path, backend="eval", use_cache=True, fold_constants=False, profiler=None):
+    """Führt eine .incc25-Datei aus, der AST kommt wenn möglich aus dem Cache
+
+    Mit profiler läuft immer interpreter.eval, siehe profiler.py. Beim
+    Backend python kommt das Code-Objekt aus datei.incc25c (transpiler.py).
+    """
+    if backend == "python" and use_cache and not fold_constants and profiler is None:
+        return transpiler.run_file(path)
+    if use_cache:
+        ast = parse_file(path)
+    else:
+        ast = positions.parse(read_source(path), str(path))
+    if ast is None:
+        return None
+    if fold_constants:
+        ast = fold(ast)
+    try:
+        if profiler is not None:
+            return profiler.run(ast, Environment())
+        return BACKENDS[backend](ast, Environment())
+    except Exception as e:
+        if where := positions.failing_location(e):
+            e.add_note(f"bei {where}")
+        raise
+
+
 if __name__ == "__main__":
     debug = False
+    backend = "eval"
+    use_cache = True
+    fold_constants = False
+    streaming = False
+    profile = None  # None, "" (ausgeben) oder Pfad für JSON
+    files = []
 
-    for eachArg in sys.argv:
+    for eachArg in sys.argv[1:]:
         if eachArg == "-debug":
             debug = True
+        elif eachArg == "-nocache":
+            use_cache = False
+        elif eachArg == "-fold":
+            fold_constants = True
+        elif eachArg == "-stream":
+            streaming = True
+        elif eachArg == "-profile" or eachArg.startswith("-profile="):
+            profile = eachArg.partition("=")[2]
+        elif eachArg[1:] in BACKENDS:  # -eval, -closure, -vm
+            backend = eachArg[1:]
+        elif not eachArg.startswith("-"):
+            files.append(eachArg)
+
+    if files:
+        for f in files:
+            if streaming:
+                print(run_stream(f, backend))
+            elif profile is not None:
+                from profiler import Profiler
 
-    env.put(["x", "y", "z"])
-    test_code(debug)
+                profiler = Profiler()
+                print(run_file(f, backend, use_cache, fold_constants, profiler))
+                if profile:
+                    profiler.dump(profile)
+                else:
+                    profiler.report()
+            else:
+                print(run_file(f, backend, use_cache, fold_constants))
+    else:
+        env.put(["x", "y", "z"])
+        test_code(debug, backend, fold_constants)
@@ -1,5 +1,6 @@
-from ply.yacc import yacc
-from lexer import tokens, print_error_with_caret, assigns
+from ply.yacc import yacc, ParserReflect
+from lexer import tokens, print_error_with_caret, assigns, GRAMMAR_VERSION, DEV, TABLE_DIR
+import positions
 
 look_up_table = {
     "+": "plus",
@@ -32,27 +33,42 @@ unary = {
     "+": "uplus",
 }
 
+
+def _at(p, i, node):
+    """node mit der Position des i-ten Symbols, nur während positions.parse gemerkt"""
+    if positions.pending is not None:
+        positions.pending[id(node)] = node, p.lexpos(i)
+    return node
+
+
 ################ ATOMIC ################
 
 
 def p_number(p):
     "atomar : NUMBER"
-    p[0] = ("num", p[1])
+    # Literale einmal beim Parsen umwandeln, nicht bei jeder Auswertung
+    n = p[1]
+    if n.startswith("0b"):
+        p[0] = _at(p, 1, ("num", int(n, 2)))
+    elif n.startswith("0x"):
+        p[0] = _at(p, 1, ("num", int(n, 16)))
+    else:
+        p[0] = _at(p, 1, ("num", int(n)))
 
 
 def p_float(p):
     "atomar : FLOAT"
-    p[0] = ("float", p[1])
+    p[0] = _at(p, 1, ("float", float(p[1])))
 
 
 def p_string(p):
     "atomar : STRING"
-    p[0] = ("str", p[1])
+    p[0] = _at(p, 1, ("str", p[1]))
 
 
 def p_var(p):
     "atomar : IDENTIFIER"
-    p[0] = ("var", p[1])
+    p[0] = _at(p, 1, ("var", p[1]))
 
 
 def p_paran(p):
@@ -77,19 +93,19 @@ def p_arithmetic_expression(p):
     | expression XOR expression
     | expression POWER expression
     """
-    p[0] = ("binop", look_up_table[p[2]], p[1], p[3])
+    p[0] = _at(p, 2, ("binop", look_up_table[p[2]], p[1], p[3]))
 
 
 def p_unary(p):
     """expression : NOT   expression
     | MINUS expression %prec UMINUS
     | PLUS  expression %prec UPLUS"""
-    p[0] = ("unary", unary[p[1]], p[2])
+    p[0] = _at(p, 1, ("unary", unary[p[1]], p[2]))
 
 
 def p_complex(p):
     """expression : expression IMAG"""
-    p[0] = ("complex", p[1])
+    p[0] = _at(p, 2, ("complex", p[1]))
 
 
 def p_expression(p):
@@ -106,6 +122,7 @@ def p_expression_comparison_chain1(p):
     """
     # TODO: SHIFT-REDUCE STATE 117
     p[0] = [p[2], p[1], p[3]]
+    p.set_lexpos(0, p.lexpos(2))  # Position des ersten Vergleichsoperators
 
 
 def p_expression_comparison_chain2(p):
@@ -113,11 +130,12 @@ def p_expression_comparison_chain2(p):
     comparison : comparison comparison_op expression %prec CMP2
     """
     p[0] = [p[1][0] + [p[2]], p[1][1] + [p[3]]]
+    p.set_lexpos(0, p.lexpos(1))
 
 
 def p_expression1(p):
     """expression : comparison %prec CLS"""
-    p[0] = ("comparison", *p[1])
+    p[0] = _at(p, 1, ("comparison", *p[1]))
 
 
 def p_comparison_op(p):
@@ -128,6 +146,7 @@ def p_comparison_op(p):
     | SMALLER_EQUALS
     | GREATER_EQUALS"""
     p[0] = look_up_table[p[1]]
+    p.set_lexpos(0, p.lexpos(1))
 
 
 ################ ASSIGNMENTS ################
@@ -135,7 +154,7 @@ def p_comparison_op(p):
 
 def p_assignment1(p):
     "expression : IDENTIFIER ASSIGN expression %prec ASSIGN"
-    p[0] = ("assign", None, p[1], p[3])
+    p[0] = _at(p, 2, ("assign", None, p[1], p[3]))
 
 
 def p_assignment2(p):
@@ -159,7 +178,7 @@ def p_assignment2(p):
                | IDENTIFIER EXP_ASSIGN expression
                | IDENTIFIER MOD_ASSIGN expression
     """
-    p[0] = ("assign", look_up_assignments[p[2]], p[1], p[3])
+    p[0] = _at(p, 2, ("assign", look_up_assignments[p[2]], p[1], p[3]))
 
 
 ################ SEQUENCE ################
@@ -170,7 +189,7 @@ def p_sequence(p):
     sequence : BEGIN statements END
              | BEGIN statements SEMICOLON END
     """
-    p[0] = ("seq", p[2])
+    p[0] = _at(p, 1, ("seq", p[2]))
 
 
 def p_expression2(p):
@@ -211,9 +230,9 @@ def p_if_statements1(p):
                  | IF expression THEN statements else_elif_body DOT
     """
     if len(p) == 6:
-        p[0] = ("if", p[2], p[4], None)
+        p[0] = _at(p, 1, ("if", p[2], p[4], None))
     else:
-        p[0] = ("if", p[2], p[4], p[5])  # elif
+        p[0] = _at(p, 1, ("if", p[2], p[4], p[5]))  # elif
 
 
 def p_if_statements2(p):
@@ -241,7 +260,7 @@ def p_while_statement0(p):
     """
     while_statement : WHILE expression THEN statements DOT
     """
-    p[0] = ("while", p[2], p[4])
+    p[0] = _at(p, 1, ("while", p[2], p[4]))
 
 
 def p_while_statement1(p):
@@ -258,7 +277,7 @@ def p_loop_statement0(p):
     """
     loop_statement : LOOP IDENTIFIER IN interval LOOPTHEN statements DOT
     """
-    p[0] = ("loop", p[2], p[4], p[6])
+    p[0] = _at(p, 1, ("loop", p[2], p[4], p[6]))
 
 
 def p_interval(p):
@@ -283,7 +302,7 @@ def p_loop_statement1(p):
 
 def p_lambda0(p):
     "lambda : LAMBDA parameter LAMBDA_ARROW expression %prec LAMBDA"
-    p[0] = ("lambda", p[2], p[4])
+    p[0] = _at(p, 1, ("lambda", p[2], p[4]))
 
 
 def p_lambda1(p):
@@ -394,7 +413,7 @@ def p_empty(p):
 
 def p_call(p):
     """expression : expression LPAREN parameter_expr RPAREN"""
-    p[0] = ("call", p[1], p[3])
+    p[0] = _at(p, 2, ("call", p[1], p[3]))
 
 
 ######################### LET #########################
@@ -403,7 +422,7 @@ def p_call(p):
 
 def p_let(p):
     "expression : LET IDENTIFIER EQUALS expression IN expression DOT"
-    p[0] = ("let", ("assign", None, p[2], p[4]), p[6])
+    p[0] = _at(p, 1, ("let", _at(p, 2, ("assign", None, p[2], p[4])), p[6]))
 
 
 ######################### BUILTIN #########################
@@ -414,8 +433,12 @@ def p_builtin_func(p):
     expression : ECHO   LPAREN param_list RPAREN
                | LENGTH LPAREN param_list RPAREN
                | LIST   LPAREN param_list RPAREN
+               | SUM    LPAREN param_list RPAREN
+               | MIN    LPAREN param_list RPAREN
+               | MAX    LPAREN param_list RPAREN
+               | MEMO   LPAREN param_list RPAREN
     """
-    p[0] = ("function", p[1], p[3])
+    p[0] = _at(p, 1, ("function", p[1], p[3]))
 
 
 def p_paramlist1(p):
@@ -452,7 +475,7 @@ def p_list_zugriff(p):
                   | expression OPEN_BRACKETS expression CLOSED_BRACKETS
     """
     # TIMES == ASTRIKS
-    p[0] = ("array_access", p[1], p[3])
+    p[0] = _at(p, 2, ("array_access", p[1], p[3]))
 
 
 def p_leere_liste(p):
@@ -462,7 +485,7 @@ def p_leere_liste(p):
 
 def p_cons(p):
     "expression : expression CONS expression"
-    p[0] = ("cons", p[1], p[3])
+    p[0] = _at(p, 2, ("cons", p[1], p[3]))
 
 
 ######################### ARRAY #########################
@@ -472,7 +495,7 @@ def p_array(p):
     """expression : OPEN_BRACKETS param_list CLOSED_BRACKETS
                   | OPEN_BRACKETS empty      CLOSED_BRACKETS
     """
-    p[0] = ("array", p[2])
+    p[0] = _at(p, 1, ("array", p[2]))
 
 
 ######################### STRUCTS #########################
@@ -492,7 +515,8 @@ def p_error(p):
 
 precedence = (
     tuple(["right", "ASSIGN"] + [a for a in assigns.values()]),
-    ("left", "CONS", "LAMBDA"),
+    ("right", "CONS"),  # 1 & 2 & leere == 1 & (2 & leere)
+    ("left", "LAMBDA"),
     ("left", "OR"),
     ("left", "XOR"),
     ("left", "AND"),
@@ -515,7 +539,32 @@ precedence = (
 
 ########################################################
 
-parser = yacc(start="sequence")
+TABMODULE = f"parsetab_v{GRAMMAR_VERSION}"
+
+if DEV:
+    # Tabellen bei geänderter Grammatik neu erzeugen, ohne parser.out
+    parser = yacc(start="sequence", tabmodule=TABMODULE, outputdir=TABLE_DIR, debug=False)
+else:
+    # Eingefrorene Tabellen laden, ohne Signaturprüfung und ohne Dateien zu schreiben
+    parser = yacc(
+        start="sequence",
+        tabmodule=TABMODULE,
+        outputdir=TABLE_DIR,
+        debug=False,
+        write_tables=False,
+        optimize=True,
+    )
+
+
+def tables_up_to_date():
+    """Passen die eingefrorenen Tabellen noch zur Grammatik in dieser Datei?"""
+    import importlib
+
+    pinfo = ParserReflect({**globals(), "start": "sequence"})
+    pinfo.get_all()
+    table = importlib.import_module(TABMODULE)
+    # Docstrings werden je nach Python-Version anders eingerückt
+    return table._lr_signature.split() == pinfo.signature().split()
 
 if __name__ == "__main__":
     # Eigene Cases
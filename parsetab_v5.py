@@ -0,0 +1,139 @@
+
+# parsetab_v5.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'sequencerightASSIGNPLUS_ASSIGNMINUS_ASSIGNPOWER_ASSIGNTIMES_ASSIGNDIVIDE_CEIL_ASSIGNDIVIDE_FLOOR_ASSIGNDIVIDE_ASSIGNEQUALS_ASSIGNUNEQUALS_ASSIGNGREATER_EQUALS_ASSIGNSMALLER_EQUALS_ASSIGNGREATER_THAN_ASSIGNSMALLER_THAN_ASSIGNAND_ASSIGNOR_ASSIGNXOR_ASSIGNMOD_ASSIGNEXP_ASSIGNrightCONSleftLAMBDAleftORleftXORleftANDleftCLSCMPCMP2leftEQUALSUNEQUALSleftGREATER_THANSMALLER_THANSMALLER_EQUALSGREATER_EQUALSleftPLUSMINUSleftTIMESDIVIDEDIVIDE_CEILDIVIDE_FLOORMODrightPOWEREXPleftIMAGrightNOTUPLUSUMINUSrightLPARENRPARENAND AND_ASSIGN ASSIGN BEGIN CLOSED_BRACKETS COLON COMMA CONS DIVIDE DIVIDE_ASSIGN DIVIDE_CEIL DIVIDE_CEIL_ASSIGN DIVIDE_FLOOR DIVIDE_FLOOR_ASSIGN DOT DOTS ECHO ELIF ELSE END EQUALS EQUALS_ASSIGN EXP EXP_ASSIGN FLOAT GREATER_EQUALS GREATER_EQUALS_ASSIGN GREATER_THAN GREATER_THAN_ASSIGN IDENTIFIER IF IMAG IN LAMBDA LAMBDA_ARROW LENGTH LET LIST LOOP LOOPTHEN LPAREN MAX MEMO MIN MINUS MINUS_ASSIGN MOD MOD_ASSIGN NOT NULL NUMBER OPEN_BRACKETS OR OR_ASSIGN PLUS PLUS_ASSIGN POWER POWER_ASSIGN RPAREN SEMICOLON SMALLER_EQUALS SMALLER_EQUALS_ASSIGN SMALLER_THAN SMALLER_THAN_ASSIGN STRING SUM THEN TIMES TIMES_ASSIGN UNEQUALS UNEQUALS_ASSIGN WHILE XOR XOR_ASSIGNatomar : NUMBERatomar : FLOATatomar : STRINGatomar : IDENTIFIERatomar : LPAREN expression RPARENexpression : expression PLUS expression\n    | expression MINUS expression\n    | expression TIMES expression\n    | expression DIVIDE expression\n    | expression DIVIDE_CEIL expression\n    | expression DIVIDE_FLOOR expression\n    | expression MOD expression\n    | expression EXP expression\n    | expression AND expression\n    | expression OR expression\n    | expression XOR expression\n    | expression POWER expression\n    expression : NOT   expression\n    | MINUS expression %prec UMINUS\n    | PLUS  expression %prec UPLUSexpression : expression IMAGexpression : atomar\n    comparison : expression comparison_op expression %prec CMP\n    \n    comparison : comparison comparison_op expression %prec CMP2\n    expression : comparison %prec CLScomparison_op : GREATER_THAN\n    | SMALLER_THAN\n    | UNEQUALS\n    | EQUALS\n    | SMALLER_EQUALS\n    | GREATER_EQUALSexpression : IDENTIFIER ASSIGN expression %prec ASSIGN\n    expression : IDENTIFIER PLUS_ASSIGN expression\n               | IDENTIFIER MINUS_ASSIGN expression\n               | IDENTIFIER TIMES_ASSIGN expression\n               | IDENTIFIER POWER_ASSIGN expression\n               | IDENTIFIER DIVIDE_ASSIGN expression\n               | IDENTIFIER DIVIDE_FLOOR_ASSIGN expression\n               | IDENTIFIER DIVIDE_CEIL_ASSIGN expression\n               | IDENTIFIER GREATER_THAN_ASSIGN expression\n               | IDENTIFIER SMALLER_THAN_ASSIGN expression\n               | IDENTIFIER GREATER_EQUALS_ASSIGN expression\n               | IDENTIFIER SMALLER_EQUALS_ASSIGN expression\n               | IDENTIFIER EQUALS_ASSIGN expression\n               | IDENTIFIER UNEQUALS_ASSIGN expression\n               | IDENTIFIER AND_ASSIGN expression\n               | IDENTIFIER OR_ASSIGN expression\n               | IDENTIFIER XOR_ASSIGN expression\n               | IDENTIFIER EXP_ASSIGN expression\n               | IDENTIFIER MOD_ASSIGN expression\n    \n    sequence : BEGIN statements END\n             | BEGIN statements SEMICOLON END\n    expression : sequence\n    statement : expression\n    \n    statements : statements SEMICOLON statement\n    \n    statements : statement\n    \n    if_statement : IF expression THEN statements DOT\n                 | IF expression THEN statements else_elif_body DOT\n    \n    else_elif_body : ELIF IF expression THEN statements else_elif_body\n                   | ELSE statements\n    \n    expression : if_statement\n    \n    while_statement : WHILE expression THEN statements DOT\n    \n    expression : while_statement\n    \n    loop_statement : LOOP IDENTIFIER IN interval LOOPTHEN statements DOT\n    \n    interval : OPEN_BRACKETS   expression COMMA expression CLOSED_BRACKETS\n             | CLOSED_BRACKETS expression COMMA expression CLOSED_BRACKETS\n             | OPEN_BRACKETS   expression COMMA expression OPEN_BRACKETS\n             | CLOSED_BRACKETS expression COMMA expression OPEN_BRACKETS\n    \n    expression : loop_statement\n    lambda : LAMBDA parameter LAMBDA_ARROW expression %prec LAMBDAexpression : lambda\n    parameter : LPAREN parameter_pos RPAREN\n              | IDENTIFIER\n              | empty\n    \n    parameter_pos : parameter_pos_list\n    \n    parameter_pos_list : IDENTIFIER COMMA parameter_pos_list\n                       | IDENTIFIER\n                       | parameter_keywords\n    \n    parameter_keywords : parameter_kw_list\n    \n    parameter_kw_list : IDENTIFIER COLON expression COMMA parameter_kw_list\n                      | IDENTIFIER COLON expression\n                      | parameter_infty\n    \n    parameter_infty : IDENTIFIER DOTS\n    \n    parameter_expr : parameter_pos_expr\n                   | empty\n    \n    parameter_pos_expr : expression COMMA parameter_pos_expr\n                       | expression\n                       | parameter_keywords_expr\n    \n    parameter_keywords_expr : expression COLON expression COMMA parameter_keywords_expr\n                            | expression COLON expression\n    empty :expression : expression LPAREN parameter_expr RPARENexpression : LET IDENTIFIER EQUALS expression IN expression DOT\n    expression : ECHO   LPAREN param_list RPAREN\n               | LENGTH LPAREN param_list RPAREN\n               | LIST   LPAREN param_list RPAREN\n               | SUM    LPAREN param_list RPAREN\n               | MIN    LPAREN param_list RPAREN\n               | MAX    LPAREN param_list RPAREN\n               | MEMO   LPAREN param_list RPAREN\n    param_list : expression COMMA param_listparam_list : expressionexpression : expression OPEN_BRACKETS DOT CLOSED_BRACKETS\n                  | expression OPEN_BRACKETS TIMES CLOSED_BRACKETS\n                  | expression OPEN_BRACKETS expression CLOSED_BRACKETS\n    expression : NULLexpression : expression CONS expressionexpression : OPEN_BRACKETS param_list CLOSED_BRACKETS\n                  | OPEN_BRACKETS empty      CLOSED_BRACKETS\n    '
+    
+_lr_action_items = {'BEGIN':([0,2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,-26,-27,-28,-29,-30,-31,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'$end':([1,35,102,],[0,-51,-52,]),'NOT':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,-26,-27,-28,-29,-30,-31,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'MINUS':([2,5,6,7,8,9,10,11,12,13,14,15,16,17,26,27,28,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,155,156,157,158,159,161,168,169,170,171,172,173,174,175,176,177,178,179,180,181,186,187,188,191,194,195,196,198,200,201,202,203,204,206,207,208,209,210,213,214,216,218,219,220,221,222,225,226,229,],[7,38,7,7,7,-22,-25,-4,-53,-61,-63,-69,-71,7,7,-106,-1,-2,-3,7,7,-51,7,7,7,7,7,7,7,7,7,7,7,7,7,-21,7,7,7,7,-26,-27,-28,-29,-30,-31,-20,-19,-18,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,38,7,7,7,7,7,7,7,38,38,38,-52,-6,-7,-8,-9,-10,-11,-12,-13,38,38,38,-17,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-5,7,-108,-109,7,7,7,7,7,7,-92,-105,-103,-104,38,-94,-95,-96,-97,-98,-99,-100,7,7,38,7,38,7,-57,7,7,-62,7,38,38,38,7,38,-58,7,7,7,38,-93,38,-64,38,38,7,7,7,]),'PLUS':([2,5,6,7,8,9,10,11,12,13,14,15,16,17,26,27,28,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,155,156,157,158,159,161,168,169,170,171,172,173,174,175,176,177,178,179,180,181,186,187,188,191,194,195,196,198,200,201,202,203,204,206,207,208,209,210,213,214,216,218,219,220,221,222,225,226,229,],[6,37,6,6,6,-22,-25,-4,-53,-61,-63,-69,-71,6,6,-106,-1,-2,-3,6,6,-51,6,6,6,6,6,6,6,6,6,6,6,6,6,-21,6,6,6,6,-26,-27,-28,-29,-30,-31,-20,-19,-18,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,37,6,6,6,6,6,6,6,37,37,37,-52,-6,-7,-8,-9,-10,-11,-12,-13,37,37,37,-17,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,-5,6,-108,-109,6,6,6,6,6,6,-92,-105,-103,-104,37,-94,-95,-96,-97,-98,-99,-100,6,6,37,6,37,6,-57,6,6,-62,6,37,37,37,6,37,-58,6,6,6,37,-93,37,-64,37,37,6,6,6,]),'IDENTIFIER':([2,6,7,8,17,18,26,31,32,33,34,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,99,147,157,158,159,161,168,169,186,187,190,191,195,198,200,202,207,210,213,214,215,225,226,229,],[11,11,11,11,11,84,11,11,11,97,100,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,-26,-27,-28,-29,-30,-31,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,164,11,11,11,11,11,11,11,11,11,164,11,11,11,11,11,11,11,11,11,223,11,11,11,]),'LET':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-26,-27,-28,-29,-30,-31,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'ECHO':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-26,-27,-28,-29,-30,-31,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'LENGTH':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-26,-27,-28,-29,-30,-31,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'LIST':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-26,-27,-28,-29,-30,-31,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'SUM':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-26,-27,-28,-29,-30,-31,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,]),'MIN':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,-26,-27,-28,-29,-30,-31,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'MAX':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-26,-27,-28,-29,-30,-31,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'MEMO':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-26,-27,-28,-29,-30,-31,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'NULL':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-26,-27,-28,-29,-30,-31,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,]),'OPEN_BRACKETS':([2,5,6,7,8,9,10,11,12,13,14,15,16,17,26,27,28,29,30,31,32,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,155,156,157,158,159,160,161,168,169,170,171,172,173,174,175,176,177,178,179,180,181,186,187,188,191,194,195,196,198,200,201,202,203,204,206,207,208,209,210,213,214,216,218,219,220,221,222,225,226,229,],[26,51,26,26,26,-22,-25,-4,-53,-61,-63,-69,-71,26,26,-106,-1,-2,-3,26,26,-51,26,26,26,26,26,26,26,26,26,26,26,26,26,-21,26,26,26,26,-26,-27,-28,-29,-30,-31,-20,-19,-18,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,51,26,26,26,26,26,26,26,51,51,51,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,51,51,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,26,-108,-109,26,26,26,186,26,26,26,-92,-105,-103,-104,51,-94,-95,-96,-97,-98,-99,-100,26,26,-70,26,51,26,-57,26,26,-62,26,51,51,51,26,51,-58,26,26,26,51,-93,51,-64,226,229,26,26,26,]),'NUMBER':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-26,-27,-28,-29,-30,-31,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,]),'FLOAT':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-26,-27,-28,-29,-30,-31,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'STRING':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-26,-27,-28,-29,-30,-31,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'LPAREN':([2,5,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,25,26,27,28,29,30,31,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,85,86,87,88,89,90,91,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,155,156,157,158,159,161,168,169,170,171,172,173,174,175,176,177,178,179,180,181,186,187,188,191,194,195,196,198,200,201,202,203,204,206,207,208,209,210,213,214,216,218,219,220,221,222,225,226,229,],[17,50,17,17,17,-22,-25,-4,-53,-61,-63,-69,-71,17,85,86,87,88,89,90,91,17,-106,-1,-2,-3,17,17,99,-51,17,17,17,17,17,17,17,17,17,17,17,17,17,-21,17,17,17,17,-26,-27,-28,-29,-30,-31,50,50,50,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,50,17,17,17,17,17,17,17,50,50,50,-52,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,-5,17,-108,-109,17,17,17,17,17,17,-92,-105,-103,-104,50,-94,-95,-96,-97,-98,-99,-100,17,17,50,17,50,17,-57,17,17,-62,17,50,50,50,17,50,-58,17,17,17,50,-93,50,-64,50,50,17,17,17,]),'IF':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,199,200,202,207,210,213,214,225,226,229,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,-26,-27,-28,-29,-30,-31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,210,31,31,31,31,31,31,31,31,31,]),'WHILE':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-26,-27,-28,-29,-30,-31,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'LOOP':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-26,-27,-28,-29,-30,-31,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'LAMBDA':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,54,55,56,57,58,59,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-26,-27,-28,-29,-30,-31,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'END':([3,4,5,9,10,11,12,13,14,15,16,27,28,29,30,35,36,49,60,61,62,102,103,104,105,106,107,108,109,110,111,112,113,114,115,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,175,176,177,178,179,180,181,188,196,201,209,218,220,],[35,-56,-54,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,102,-21,-20,-19,-18,-52,-55,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,-70,-57,-62,-58,-93,-64,]),'SEMICOLON':([3,4,5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,102,103,104,105,106,107,108,109,110,111,112,113,114,115,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,175,176,177,178,179,180,181,183,184,188,196,201,209,211,212,218,220,230,],[36,-56,-54,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,-52,-55,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,198,198,-70,-57,-62,-58,198,198,-93,-64,198,]),'DOT':([4,5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,51,60,61,62,102,103,104,105,106,107,108,109,110,111,112,113,114,115,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,175,176,177,178,179,180,181,183,184,188,196,197,201,208,209,211,212,218,220,226,229,231,],[-56,-54,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,122,-20,-19,-18,-52,-55,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,196,201,-70,-57,209,-62,218,-58,-60,220,-93,-64,122,122,-59,]),'ELIF':([4,5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,102,103,104,105,106,107,108,109,110,111,112,113,114,115,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,175,176,177,178,179,180,181,183,188,196,201,209,218,220,230,],[-56,-54,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,-52,-55,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,199,-70,-57,-62,-58,-93,-64,199,]),'ELSE':([4,5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,102,103,104,105,106,107,108,109,110,111,112,113,114,115,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,175,176,177,178,179,180,181,183,188,196,201,209,218,220,230,],[-56,-54,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,-52,-55,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,200,-70,-57,-62,-58,-93,-64,200,]),'TIMES':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,51,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,226,229,],[39,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,123,-20,-19,-18,39,39,39,39,-52,39,39,-8,-9,-10,-11,-12,-13,39,39,39,-17,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,-5,-108,-109,-92,-105,-103,-104,39,-94,-95,-96,-97,-98,-99,-100,39,39,-57,-62,39,39,39,39,-58,39,-93,39,-64,39,39,123,123,]),'DIVIDE':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[40,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,40,40,40,40,-52,40,40,-8,-9,-10,-11,-12,-13,40,40,40,-17,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,-5,-108,-109,-92,-105,-103,-104,40,-94,-95,-96,-97,-98,-99,-100,40,40,-57,-62,40,40,40,40,-58,40,-93,40,-64,40,40,]),'DIVIDE_CEIL':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[41,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,41,41,41,41,-52,41,41,-8,-9,-10,-11,-12,-13,41,41,41,-17,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,-5,-108,-109,-92,-105,-103,-104,41,-94,-95,-96,-97,-98,-99,-100,41,41,-57,-62,41,41,41,41,-58,41,-93,41,-64,41,41,]),'DIVIDE_FLOOR':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[42,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,42,42,42,42,-52,42,42,-8,-9,-10,-11,-12,-13,42,42,42,-17,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,-5,-108,-109,-92,-105,-103,-104,42,-94,-95,-96,-97,-98,-99,-100,42,42,-57,-62,42,42,42,42,-58,42,-93,42,-64,42,42,]),'MOD':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[43,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,43,43,43,43,-52,43,43,-8,-9,-10,-11,-12,-13,43,43,43,-17,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-5,-108,-109,-92,-105,-103,-104,43,-94,-95,-96,-97,-98,-99,-100,43,43,-57,-62,43,43,43,43,-58,43,-93,43,-64,43,43,]),'EXP':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[44,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,44,44,44,44,-52,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-5,-108,-109,-92,-105,-103,-104,44,-94,-95,-96,-97,-98,-99,-100,44,44,-57,-62,44,44,44,44,-58,44,-93,44,-64,44,44,]),'AND':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[45,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,45,45,45,45,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,45,45,-17,45,45,45,-23,-24,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,-5,-108,-109,-92,-105,-103,-104,45,-94,-95,-96,-97,-98,-99,-100,45,45,-57,-62,45,45,45,45,-58,45,-93,45,-64,45,45,]),'OR':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[46,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,46,46,46,46,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,46,46,46,-23,-24,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,-5,-108,-109,-92,-105,-103,-104,46,-94,-95,-96,-97,-98,-99,-100,46,46,-57,-62,46,46,46,46,-58,46,-93,46,-64,46,46,]),'XOR':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[47,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,47,47,47,47,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,47,-16,-17,47,47,47,-23,-24,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,-5,-108,-109,-92,-105,-103,-104,47,-94,-95,-96,-97,-98,-99,-100,47,47,-57,-62,47,47,47,47,-58,47,-93,47,-64,47,47,]),'POWER':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[48,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,48,48,48,48,-52,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-5,-108,-109,-92,-105,-103,-104,48,-94,-95,-96,-97,-98,-99,-100,48,48,-57,-62,48,48,48,48,-58,48,-93,48,-64,48,48,]),'IMAG':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[49,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,49,49,49,49,-52,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-5,-108,-109,-92,-105,-103,-104,49,-94,-95,-96,-97,-98,-99,-100,49,49,-57,-62,49,49,49,49,-58,49,-93,49,-64,49,49,]),'CONS':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[52,-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,52,52,52,52,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,52,52,52,-23,-24,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,-5,-108,-109,-92,-105,-103,-104,52,-94,-95,-96,-97,-98,-99,-100,-70,52,-57,-62,52,52,52,52,-58,52,-93,52,-64,52,52,]),'GREATER_THAN':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[54,-22,54,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,54,54,54,54,-52,-6,-7,-8,-9,-10,-11,-12,-13,54,54,54,-17,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,-5,-108,-109,-92,-105,-103,-104,54,-94,-95,-96,-97,-98,-99,-100,54,54,-57,-62,54,54,54,54,-58,54,-93,54,-64,54,54,]),'SMALLER_THAN':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[55,-22,55,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,55,55,55,55,-52,-6,-7,-8,-9,-10,-11,-12,-13,55,55,55,-17,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,-5,-108,-109,-92,-105,-103,-104,55,-94,-95,-96,-97,-98,-99,-100,55,55,-57,-62,55,55,55,55,-58,55,-93,55,-64,55,55,]),'UNEQUALS':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[56,-22,56,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,56,56,56,56,-52,-6,-7,-8,-9,-10,-11,-12,-13,56,56,56,-17,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-5,-108,-109,-92,-105,-103,-104,56,-94,-95,-96,-97,-98,-99,-100,56,56,-57,-62,56,56,56,56,-58,56,-93,56,-64,56,56,]),'EQUALS':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,84,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[57,-22,57,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,57,147,57,57,57,-52,-6,-7,-8,-9,-10,-11,-12,-13,57,57,57,-17,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,-5,-108,-109,-92,-105,-103,-104,57,-94,-95,-96,-97,-98,-99,-100,57,57,-57,-62,57,57,57,57,-58,57,-93,57,-64,57,57,]),'SMALLER_EQUALS':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[58,-22,58,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,58,58,58,58,-52,-6,-7,-8,-9,-10,-11,-12,-13,58,58,58,-17,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-5,-108,-109,-92,-105,-103,-104,58,-94,-95,-96,-97,-98,-99,-100,58,58,-57,-62,58,58,58,58,-58,58,-93,58,-64,58,58,]),'GREATER_EQUALS':([5,9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,83,94,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,194,196,201,203,204,206,208,209,216,218,219,220,221,222,],[59,-22,59,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,59,59,59,59,-52,-6,-7,-8,-9,-10,-11,-12,-13,59,59,59,-17,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-5,-108,-109,-92,-105,-103,-104,59,-94,-95,-96,-97,-98,-99,-100,59,59,-57,-62,59,59,59,59,-58,59,-93,59,-64,59,59,]),'RPAREN':([9,10,11,12,13,14,15,16,27,28,29,30,35,49,50,60,61,62,83,94,102,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,148,149,150,151,152,153,154,155,156,162,163,164,165,166,167,170,171,172,173,175,176,177,178,179,180,181,182,188,192,193,194,196,201,205,206,209,217,218,220,224,],[-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-91,-20,-19,-18,146,-102,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-87,170,-84,-85,-88,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,175,176,177,178,179,180,181,-108,-109,189,-75,-77,-78,-79,-82,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,-101,-70,-83,-86,-90,-57,-62,-76,-81,-58,-89,-93,-64,-80,]),'COMMA':([9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,94,102,104,105,106,107,108,109,110,111,112,113,114,115,116,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,164,170,171,172,173,175,176,177,178,179,180,181,188,194,196,201,203,204,206,209,218,220,],[-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,157,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,168,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,190,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,-70,207,-57,-62,213,214,215,-58,-93,-64,]),'CLOSED_BRACKETS':([9,10,11,12,13,14,15,16,26,27,28,29,30,35,49,60,61,62,92,93,94,102,104,105,106,107,108,109,110,111,112,113,114,115,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,160,170,171,172,173,175,176,177,178,179,180,181,182,188,196,201,209,218,220,221,222,],[-22,-25,-4,-53,-61,-63,-69,-71,-91,-106,-1,-2,-3,-51,-21,-20,-19,-18,155,156,-102,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,171,172,173,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,187,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,-101,-70,-57,-62,-58,-93,-64,227,228,]),'THEN':([9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,95,96,102,104,105,106,107,108,109,110,111,112,113,114,115,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,175,176,177,178,179,180,181,188,196,201,209,218,219,220,],[-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,158,159,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,-70,-57,-62,-58,-93,225,-64,]),'COLON':([9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,102,104,105,106,107,108,109,110,111,112,113,114,115,116,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,164,170,171,172,173,175,176,177,178,179,180,181,188,196,201,209,216,218,220,223,],[-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,169,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,191,-92,-105,-103,-104,-94,-95,-96,-97,-98,-99,-100,-70,-57,-62,-58,169,-93,-64,191,]),'IN':([9,10,11,12,13,14,15,16,27,28,29,30,35,49,60,61,62,97,102,104,105,106,107,108,109,110,111,112,113,114,115,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,155,156,170,171,172,173,174,175,176,177,178,179,180,181,188,196,201,209,218,220,],[-22,-25,-4,-53,-61,-63,-69,-71,-106,-1,-2,-3,-51,-21,-20,-19,-18,160,-52,-6,-7,-8,-9,-10,-11,-12,-13,-14,-15,-16,-17,-107,-23,-24,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-5,-108,-109,-92,-105,-103,-104,195,-94,-95,-96,-97,-98,-99,-100,-70,-57,-62,-58,-93,-64,]),'ASSIGN':([11,],[64,]),'PLUS_ASSIGN':([11,],[65,]),'MINUS_ASSIGN':([11,],[66,]),'TIMES_ASSIGN':([11,],[67,]),'POWER_ASSIGN':([11,],[68,]),'DIVIDE_ASSIGN':([11,],[69,]),'DIVIDE_FLOOR_ASSIGN':([11,],[70,]),'DIVIDE_CEIL_ASSIGN':([11,],[71,]),'GREATER_THAN_ASSIGN':([11,],[72,]),'SMALLER_THAN_ASSIGN':([11,],[73,]),'GREATER_EQUALS_ASSIGN':([11,],[74,]),'SMALLER_EQUALS_ASSIGN':([11,],[75,]),'EQUALS_ASSIGN':([11,],[76,]),'UNEQUALS_ASSIGN':([11,],[77,]),'AND_ASSIGN':([11,],[78,]),'OR_ASSIGN':([11,],[79,]),'XOR_ASSIGN':([11,],[80,]),'EXP_ASSIGN':([11,],[81,]),'MOD_ASSIGN':([11,],[82,]),'LAMBDA_ARROW':([34,98,100,101,189,],[-91,161,-73,-74,-72,]),'DOTS':([164,223,],[192,192,]),'LOOPTHEN':([185,226,227,228,229,],[202,-67,-65,-66,-68,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'sequence':([0,2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[1,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'statements':([2,158,159,200,202,225,],[3,183,184,211,212,230,]),'statement':([2,36,158,159,198,200,202,225,],[4,103,4,4,103,4,4,4,]),'expression':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[5,60,61,62,83,94,95,96,5,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,94,94,94,94,94,94,94,174,94,5,5,188,116,194,203,204,206,208,5,5,5,216,219,221,222,5,121,121,]),'atomar':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'comparison':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'if_statement':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'while_statement':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'loop_statement':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'lambda':([2,6,7,8,17,26,31,32,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,85,86,87,88,89,90,91,147,157,158,159,161,168,169,186,187,191,195,198,200,202,207,210,213,214,225,226,229,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'comparison_op':([5,10,60,61,62,83,94,95,96,104,105,106,107,108,109,110,111,112,113,114,115,116,121,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,174,188,194,203,204,206,208,216,219,221,222,],[53,63,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,]),'param_list':([26,85,86,87,88,89,90,91,157,],[92,148,149,150,151,152,153,154,182,]),'empty':([26,34,50,],[93,101,119,]),'parameter':([34,],[98,]),'parameter_expr':([50,],[117,]),'parameter_pos_expr':([50,168,],[118,193,]),'parameter_keywords_expr':([50,168,207,],[120,120,217,]),'parameter_pos':([99,],[162,]),'parameter_pos_list':([99,190,],[163,205,]),'parameter_keywords':([99,190,],[165,165,]),'parameter_kw_list':([99,190,215,],[166,166,224,]),'parameter_infty':([99,190,215,],[167,167,167,]),'interval':([160,],[185,]),'else_elif_body':([183,230,],[197,231,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> sequence","S'",1,None,None,None),
+  ('atomar -> NUMBER','atomar',1,'p_number','parser.py',39),
+  ('atomar -> FLOAT','atomar',1,'p_float','parser.py',51),
+  ('atomar -> STRING','atomar',1,'p_string','parser.py',56),
+  ('atomar -> IDENTIFIER','atomar',1,'p_var','parser.py',61),
+  ('atomar -> LPAREN expression RPAREN','atomar',3,'p_paran','parser.py',66),
+  ('expression -> expression PLUS expression','expression',3,'p_arithmetic_expression','parser.py',74),
+  ('expression -> expression MINUS expression','expression',3,'p_arithmetic_expression','parser.py',75),
+  ('expression -> expression TIMES expression','expression',3,'p_arithmetic_expression','parser.py',76),
+  ('expression -> expression DIVIDE expression','expression',3,'p_arithmetic_expression','parser.py',77),
+  ('expression -> expression DIVIDE_CEIL expression','expression',3,'p_arithmetic_expression','parser.py',78),
+  ('expression -> expression DIVIDE_FLOOR expression','expression',3,'p_arithmetic_expression','parser.py',79),
+  ('expression -> expression MOD expression','expression',3,'p_arithmetic_expression','parser.py',80),
+  ('expression -> expression EXP expression','expression',3,'p_arithmetic_expression','parser.py',81),
+  ('expression -> expression AND expression','expression',3,'p_arithmetic_expression','parser.py',82),
+  ('expression -> expression OR expression','expression',3,'p_arithmetic_expression','parser.py',83),
+  ('expression -> expression XOR expression','expression',3,'p_arithmetic_expression','parser.py',84),
+  ('expression -> expression POWER expression','expression',3,'p_arithmetic_expression','parser.py',85),
+  ('expression -> NOT expression','expression',2,'p_unary','parser.py',91),
+  ('expression -> MINUS expression','expression',2,'p_unary','parser.py',92),
+  ('expression -> PLUS expression','expression',2,'p_unary','parser.py',93),
+  ('expression -> expression IMAG','expression',2,'p_complex','parser.py',98),
+  ('expression -> atomar','expression',1,'p_expression','parser.py',103),
+  ('comparison -> expression comparison_op expression','comparison',3,'p_expression_comparison_chain1','parser.py',112),
+  ('comparison -> comparison comparison_op expression','comparison',3,'p_expression_comparison_chain2','parser.py',120),
+  ('expression -> comparison','expression',1,'p_expression1','parser.py',126),
+  ('comparison_op -> GREATER_THAN','comparison_op',1,'p_comparison_op','parser.py',131),
+  ('comparison_op -> SMALLER_THAN','comparison_op',1,'p_comparison_op','parser.py',132),
+  ('comparison_op -> UNEQUALS','comparison_op',1,'p_comparison_op','parser.py',133),
+  ('comparison_op -> EQUALS','comparison_op',1,'p_comparison_op','parser.py',134),
+  ('comparison_op -> SMALLER_EQUALS','comparison_op',1,'p_comparison_op','parser.py',135),
+  ('comparison_op -> GREATER_EQUALS','comparison_op',1,'p_comparison_op','parser.py',136),
+  ('expression -> IDENTIFIER ASSIGN expression','expression',3,'p_assignment1','parser.py',144),
+  ('expression -> IDENTIFIER PLUS_ASSIGN expression','expression',3,'p_assignment2','parser.py',150),
+  ('expression -> IDENTIFIER MINUS_ASSIGN expression','expression',3,'p_assignment2','parser.py',151),
+  ('expression -> IDENTIFIER TIMES_ASSIGN expression','expression',3,'p_assignment2','parser.py',152),
+  ('expression -> IDENTIFIER POWER_ASSIGN expression','expression',3,'p_assignment2','parser.py',153),
+  ('expression -> IDENTIFIER DIVIDE_ASSIGN expression','expression',3,'p_assignment2','parser.py',154),
+  ('expression -> IDENTIFIER DIVIDE_FLOOR_ASSIGN expression','expression',3,'p_assignment2','parser.py',155),
+  ('expression -> IDENTIFIER DIVIDE_CEIL_ASSIGN expression','expression',3,'p_assignment2','parser.py',156),
+  ('expression -> IDENTIFIER GREATER_THAN_ASSIGN expression','expression',3,'p_assignment2','parser.py',157),
+  ('expression -> IDENTIFIER SMALLER_THAN_ASSIGN expression','expression',3,'p_assignment2','parser.py',158),
+  ('expression -> IDENTIFIER GREATER_EQUALS_ASSIGN expression','expression',3,'p_assignment2','parser.py',159),
+  ('expression -> IDENTIFIER SMALLER_EQUALS_ASSIGN expression','expression',3,'p_assignment2','parser.py',160),
+  ('expression -> IDENTIFIER EQUALS_ASSIGN expression','expression',3,'p_assignment2','parser.py',161),
+  ('expression -> IDENTIFIER UNEQUALS_ASSIGN expression','expression',3,'p_assignment2','parser.py',162),
+  ('expression -> IDENTIFIER AND_ASSIGN expression','expression',3,'p_assignment2','parser.py',163),
+  ('expression -> IDENTIFIER OR_ASSIGN expression','expression',3,'p_assignment2','parser.py',164),
+  ('expression -> IDENTIFIER XOR_ASSIGN expression','expression',3,'p_assignment2','parser.py',165),
+  ('expression -> IDENTIFIER EXP_ASSIGN expression','expression',3,'p_assignment2','parser.py',166),
+  ('expression -> IDENTIFIER MOD_ASSIGN expression','expression',3,'p_assignment2','parser.py',167),
+  ('sequence -> BEGIN statements END','sequence',3,'p_sequence','parser.py',177),
+  ('sequence -> BEGIN statements SEMICOLON END','sequence',4,'p_sequence','parser.py',178),
+  ('expression -> sequence','expression',1,'p_expression2','parser.py',184),
+  ('statement -> expression','statement',1,'p_statement0','parser.py',193),
+  ('statements -> statements SEMICOLON statement','statements',3,'p_statements0','parser.py',200),
+  ('statements -> statement','statements',1,'p_statements1','parser.py',207),
+  ('if_statement -> IF expression THEN statements DOT','if_statement',5,'p_if_statements1','parser.py',217),
+  ('if_statement -> IF expression THEN statements else_elif_body DOT','if_statement',6,'p_if_statements1','parser.py',218),
+  ('else_elif_body -> ELIF IF expression THEN statements else_elif_body','else_elif_body',6,'p_if_statements2','parser.py',228),
+  ('else_elif_body -> ELSE statements','else_elif_body',2,'p_if_statements2','parser.py',229),
+  ('expression -> if_statement','expression',1,'p_if_statements3','parser.py',239),
+  ('while_statement -> WHILE expression THEN statements DOT','while_statement',5,'p_while_statement0','parser.py',249),
+  ('expression -> while_statement','expression',1,'p_while_statement1','parser.py',256),
+  ('loop_statement -> LOOP IDENTIFIER IN interval LOOPTHEN statements DOT','loop_statement',7,'p_loop_statement0','parser.py',266),
+  ('interval -> OPEN_BRACKETS expression COMMA expression CLOSED_BRACKETS','interval',5,'p_interval','parser.py',273),
+  ('interval -> CLOSED_BRACKETS expression COMMA expression CLOSED_BRACKETS','interval',5,'p_interval','parser.py',274),
+  ('interval -> OPEN_BRACKETS expression COMMA expression OPEN_BRACKETS','interval',5,'p_interval','parser.py',275),
+  ('interval -> CLOSED_BRACKETS expression COMMA expression OPEN_BRACKETS','interval',5,'p_interval','parser.py',276),
+  ('expression -> loop_statement','expression',1,'p_loop_statement1','parser.py',283),
+  ('lambda -> LAMBDA parameter LAMBDA_ARROW expression','lambda',4,'p_lambda0','parser.py',292),
+  ('expression -> lambda','expression',1,'p_lambda1','parser.py',297),
+  ('parameter -> LPAREN parameter_pos RPAREN','parameter',3,'p_parameter0','parser.py',303),
+  ('parameter -> IDENTIFIER','parameter',1,'p_parameter0','parser.py',304),
+  ('parameter -> empty','parameter',1,'p_parameter0','parser.py',305),
+  ('parameter_pos -> parameter_pos_list','parameter_pos',1,'p_parameter1','parser.py',317),
+  ('parameter_pos_list -> IDENTIFIER COMMA parameter_pos_list','parameter_pos_list',3,'p_parameter2','parser.py',324),
+  ('parameter_pos_list -> IDENTIFIER','parameter_pos_list',1,'p_parameter2','parser.py',325),
+  ('parameter_pos_list -> parameter_keywords','parameter_pos_list',1,'p_parameter2','parser.py',326),
+  ('parameter_keywords -> parameter_kw_list','parameter_keywords',1,'p_parameter3','parser.py',338),
+  ('parameter_kw_list -> IDENTIFIER COLON expression COMMA parameter_kw_list','parameter_kw_list',5,'p_parameter4','parser.py',345),
+  ('parameter_kw_list -> IDENTIFIER COLON expression','parameter_kw_list',3,'p_parameter4','parser.py',346),
+  ('parameter_kw_list -> parameter_infty','parameter_kw_list',1,'p_parameter4','parser.py',347),
+  ('parameter_infty -> IDENTIFIER DOTS','parameter_infty',2,'p_parameter5','parser.py',359),
+  ('parameter_expr -> parameter_pos_expr','parameter_expr',1,'p_parameter6','parser.py',366),
+  ('parameter_expr -> empty','parameter_expr',1,'p_parameter6','parser.py',367),
+  ('parameter_pos_expr -> expression COMMA parameter_pos_expr','parameter_pos_expr',3,'p_parameter7','parser.py',374),
+  ('parameter_pos_expr -> expression','parameter_pos_expr',1,'p_parameter7','parser.py',375),
+  ('parameter_pos_expr -> parameter_keywords_expr','parameter_pos_expr',1,'p_parameter7','parser.py',376),
+  ('parameter_keywords_expr -> expression COLON expression COMMA parameter_keywords_expr','parameter_keywords_expr',5,'p_parameter8','parser.py',388),
+  ('parameter_keywords_expr -> expression COLON expression','parameter_keywords_expr',3,'p_parameter8','parser.py',389),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',398),
+  ('expression -> expression LPAREN parameter_expr RPAREN','expression',4,'p_call','parser.py',403),
+  ('expression -> LET IDENTIFIER EQUALS expression IN expression DOT','expression',7,'p_let','parser.py',412),
+  ('expression -> ECHO LPAREN param_list RPAREN','expression',4,'p_builtin_func','parser.py',421),
+  ('expression -> LENGTH LPAREN param_list RPAREN','expression',4,'p_builtin_func','parser.py',422),
+  ('expression -> LIST LPAREN param_list RPAREN','expression',4,'p_builtin_func','parser.py',423),
+  ('expression -> SUM LPAREN param_list RPAREN','expression',4,'p_builtin_func','parser.py',424),
+  ('expression -> MIN LPAREN param_list RPAREN','expression',4,'p_builtin_func','parser.py',425),
+  ('expression -> MAX LPAREN param_list RPAREN','expression',4,'p_builtin_func','parser.py',426),
+  ('expression -> MEMO LPAREN param_list RPAREN','expression',4,'p_builtin_func','parser.py',427),
+  ('param_list -> expression COMMA param_list','param_list',3,'p_paramlist1','parser.py',433),
+  ('param_list -> expression','param_list',1,'p_paramlist2','parser.py',438),
+  ('expression -> expression OPEN_BRACKETS DOT CLOSED_BRACKETS','expression',4,'p_list_zugriff','parser.py',461),
+  ('expression -> expression OPEN_BRACKETS TIMES CLOSED_BRACKETS','expression',4,'p_list_zugriff','parser.py',462),
+  ('expression -> expression OPEN_BRACKETS expression CLOSED_BRACKETS','expression',4,'p_list_zugriff','parser.py',463),
+  ('expression -> NULL','expression',1,'p_leere_liste','parser.py',470),
+  ('expression -> expression CONS expression','expression',3,'p_cons','parser.py',475),
+  ('expression -> OPEN_BRACKETS param_list CLOSED_BRACKETS','expression',3,'p_array','parser.py',483),
+  ('expression -> OPEN_BRACKETS empty CLOSED_BRACKETS','expression',3,'p_array','parser.py',484),
+]
@@ -0,0 +1,147 @@
+import linecache
+from array import array
+from collections import deque
+from lexer import LineIndex
+
+# Quelltext-Positionen der AST-Knoten, ohne die Tupel zu vergrößern: während
+# positions.parse merken sich die Parser-Regeln für jeden neuen Knoten den
+# lexpos eines Tokens in pending (id(Knoten) -> (Knoten, Offset)). Der Knoten
+# steht mit drin, damit verworfene Zwischenknoten nicht freigegeben werden und
+# ihre id an einen neuen Knoten mit falschem Offset weitergeben. Danach wird
+# daraus eine SourceMap: die Offsets aller Knoten in Preorder als array, so
+# lässt sie sich auch zusammen mit dem AST cachen (cache.py). Zeile und Spalte
+# werden erst bei einer Abfrage aus dem Quelltext berechnet.
+#
+#   ast = positions.parse(source, "datei.incc25")
+#   positions.where(knoten)  ->  "datei.incc25:3:9"
+
+MAX_MAPS = 256  # so viele SourceMaps bleiben abfragbar, z.B. REPL-Eingaben
+NO_POSITION = -1
+
+pending: dict | None = None  # nur während parse gesetzt, sonst kostet _at nichts
+_maps: deque = deque(maxlen=MAX_MAPS)
+
+
+def walk(root):
+    """Alle Knoten (Tupel mit Namen vorne) in Preorder"""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, tuple):
+            if node and isinstance(node[0], str):
+                yield node
+            stack.extend(reversed(node))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+class SourceMap:
+    """Offsets der Knoten eines ASTs, dazu Quelltext bzw. Dateiname"""
+
+    __slots__ = ("root", "offsets", "text", "filename", "_index", "_lines")
+
+    def __init__(self, root, offsets, text=None, filename=None):
+        self.root = root  # hält die Knoten am Leben, ihre ids bleiben eindeutig
+        self.offsets: array = offsets
+        self.text: str | None = text  # None: bei Bedarf aus filename lesen
+        self.filename: str | None = filename
+        self._index = None  # id(Knoten) -> Preorder-Index, erst bei der ersten Abfrage
+        self._lines = None
+
+    @classmethod
+    def build(cls, root, table, text=None, filename=None):
+        offsets = array("q", (table.get(id(node), (None, NO_POSITION))[1] for node in walk(root)))
+        return cls(root, offsets, text, filename)
+
+    @classmethod
+    def from_bytes(cls, root, data, text=None, filename=None):
+        """Gegenstück zu offsets.tobytes(), für den AST-Cache"""
+        offsets = array("q")
+        offsets.frombytes(data)
+        return cls(root, offsets, text, filename)
+
+    def offset(self, node):
+        if self._index is None:
+            self._index = {id(node): i for i, node in enumerate(walk(self.root))}
+        i = self._index.get(id(node))
+        if i is None or i >= len(self.offsets) or self.offsets[i] == NO_POSITION:
+            return None
+        return self.offsets[i]
+
+    def locate(self, node):
+        """(zeile, spalte), beide ab 1, oder None"""
+        offset = self.offset(node)
+        if offset is None:
+            return None
+        if self._lines is None:
+            text = self.text
+            if text is None:
+                text = "".join(linecache.getlines(str(self.filename)))
+            self._lines = LineIndex(text)
+        line, column = self._lines.locate(offset)
+        return line, column + 1
+
+    def describe(self, node):
+        position = self.locate(node)
+        if position is None:
+            return None
+        return f"{self.filename or '<eingabe>'}:{position[0]}:{position[1]}"
+
+
+def register(source_map):
+    _maps.append(source_map)
+    return source_map
+
+
+def where(node):
+    """"datei:zeile:spalte" eines Knotens aus einem der letzten ASTs, sonst None"""
+    for source_map in reversed(_maps):
+        description = source_map.describe(node)
+        if description is not None:
+            return description
+    return None
+
+
+def failing_location(exc):
+    """Position des innersten ausgewerteten Knotens im Traceback einer Exception
+
+    Liest nur die Frames von interpreter.eval (lokale Variable expression),
+    kostet also erst etwas, wenn wirklich ein Fehler aufgetreten ist.
+    """
+    frames = []
+    tb = exc.__traceback__
+    while tb is not None:
+        frames.append(tb.tb_frame)
+        tb = tb.tb_next
+    for frame in reversed(frames):
+        node = frame.f_locals.get("expression") if frame.f_code.co_name == "eval" else None
+        if isinstance(node, tuple):
+            description = where(node)
+            if description is not None:
+                return description
+    return None
+
+
+def parse_with_map(source=None, filename=None, register_map=True, **kwargs):
+    """(ast, SourceMap) bzw. (None, None) bei einem Syntaxfehler
+
+    register_map=False, wenn die SourceMap nur ein Zwischenergebnis ist
+    (incremental.py), sonst ist sie über where abfragbar.
+    """
+    global pending
+    from parser import parser
+
+    pending = {}
+    try:
+        ast = parser.parse(source, **kwargs)
+    finally:
+        table, pending = pending, None
+    if ast is None:
+        return None, None
+    source_map = SourceMap.build(ast, table, source, filename)
+    return ast, register(source_map) if register_map else source_map
+
+
+def parse(source=None, filename=None, **kwargs):
+    """parser.parse mit SourceMap, Argumente wie dort (lexer, tokenfunc, debug)"""
+    return parse_with_map(source, filename, **kwargs)[0]
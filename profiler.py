@@ -0,0 +1,136 @@
+import json
+import sys
+import time
+
+import interpreter
+import positions
+
+# Profiler für interpreter.eval: solange er aktiv ist, steht in
+# interpreter.eval eine Hülle, die jeden Knoten zählt und stoppt. eval ruft
+# sich selbst über den globalen Namen auf (call_lambda über eval_func), also
+# läuft jede Rekursion durch die Hülle. Ist er aus, ist eval unverändert.
+#
+#   with Profiler() as p:
+#       interpreter.eval(ast, env)
+#   p.report()
+#
+# Je Knotenart (binop:plus, call, var, loop, ...) gibt es Aufrufe, Gesamtzeit
+# (bei Rekursion nur der äußerste Aufruf) und eigene Zeit (ohne Kindknoten),
+# je Lambda Aufrufe und Gesamtzeit seines Bodys, mit Stelle im Quelltext,
+# wenn der AST über positions.parse entstanden ist.
+
+# Bei diesen Knoten gehört der Operator bzw. Name mit zur Knotenart
+_WITH_OPERATOR = {"binop", "unary", "comparison", "function"}
+
+
+def node_kind(expression):
+    if isinstance(expression, tuple):
+        kind = expression[0]
+        if kind in _WITH_OPERATOR:
+            return f"{kind}:{expression[1]}"
+        if kind == "assign" and expression[1] is not None:
+            return f"assign:{expression[1]}"
+        return kind
+    return str(expression)  # z.B. "leere"
+
+
+class Profiler:
+    """Zeiten je Knotenart und je Lambda, aktiv nur innerhalb von with"""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.nodes: dict = {}  # Knotenart -> [Aufrufe, gesamt, eigen]
+        self.lambdas: dict = {}  # id(body) -> [Name, Aufrufe, gesamt]
+        self.names: dict = {}  # id(body) -> Variablenname aus der Zuweisung
+        self._original = None
+
+    def __enter__(self):
+        self._original = interpreter.eval
+        interpreter.eval = self._wrap(self._original)
+        return self
+
+    def __exit__(self, *exc):
+        interpreter.eval = self._original
+        return False
+
+    def run(self, ast, env):
+        with self:
+            return interpreter.eval(ast, env)
+
+    def _wrap(self, original):
+        clock, nodes, lambdas, names = self.clock, self.nodes, self.lambdas, self.names
+        children = [0.0]  # Zeit der Kindknoten, je offenem Knoten
+        active = {}  # offene Aufrufe je Knotenart bzw. Lambda-Body
+
+        def eval(expression, env, tail=False):
+            kind = node_kind(expression)
+            stats = nodes.get(kind)
+            if stats is None:
+                stats = nodes[kind] = [0, 0.0, 0.0]
+            if kind == "assign" and expression[3][0] == "lambda":
+                names[id(expression[3][2])] = expression[2]
+            body = id(expression) if id(expression) in lambdas else None
+            outermost = not active.get(kind)
+            active[kind] = active.get(kind, 0) + 1
+            if body is not None:
+                outermost_body = not active.get(body)
+                active[body] = active.get(body, 0) + 1
+            children.append(0.0)
+            start = clock()
+            try:
+                result = original(expression, env, tail)
+            finally:
+                elapsed = clock() - start
+                child = children.pop()
+                children[-1] += elapsed
+                stats[0] += 1
+                stats[2] += elapsed - child
+                active[kind] -= 1
+                if outermost:
+                    stats[1] += elapsed
+                if body is not None:
+                    active[body] -= 1
+                    entry = lambdas[body]
+                    entry[1] += 1
+                    if outermost_body:
+                        entry[2] += elapsed
+            if kind == "lambda" and id(expression[2]) not in lambdas:
+                lambdas[id(expression[2])] = [self._lambda_name(expression), 0, 0.0]
+            return result
+
+        return eval
+
+    def _lambda_name(self, expression):
+        name = self.names.get(id(expression[2]))
+        if name is None:
+            params = ", ".join(p[1] + ("..." if p[0] == "infty" else "") for p in expression[1][1])
+            name = f"lambda ({params})"
+        where = positions.where(expression)
+        return name if where is None else f"{name} ({where})"
+
+    def to_dict(self):
+        return {
+            "nodes": {
+                kind: {"calls": calls, "cumulative": total, "self": own}
+                for kind, (calls, total, own) in self.nodes.items()
+            },
+            "lambdas": [
+                {"name": name, "calls": calls, "cumulative": total}
+                for name, calls, total in sorted(self.lambdas.values(), key=lambda e: -e[2])
+                if calls
+            ],
+        }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+    def report(self, out=sys.stderr, top=10):
+        print(f"{'Knoten':<24} {'Aufrufe':>10} {'gesamt ms':>11} {'eigen ms':>10}", file=out)
+        for kind, (calls, total, own) in sorted(self.nodes.items(), key=lambda e: -e[1][2]):
+            print(f"{kind:<24} {calls:>10} {total * 1000:11.2f} {own * 1000:10.2f}", file=out)
+        lambdas = self.to_dict()["lambdas"][:top]
+        if lambdas:
+            print(f"\n{'Lambda':<40} {'Aufrufe':>10} {'gesamt ms':>11}", file=out)
+            for entry in lambdas:
+                print(f"{entry['name']:<40} {entry['calls']:>10} {entry['cumulative'] * 1000:11.2f}", file=out)
@@ -0,0 +1,178 @@
+import compiler
+from compiler import _call, compile_ast
+from environment import Environment, Frame
+from interpreter import bin_operations
+from resolver import resolve
+from _lambda import Lambda, TailCall
+
+# Closure-Compiler mit sich selbst spezialisierenden Stellen ("quickening").
+# Jede binop-, Vergleichs- und Aufrufstelle beobachtet beim Ausführen, was
+# bei ihr ankommt: beim ersten Mal merkt sie sich die Typen der Operanden
+# (z.B. int, int) bzw. die Signatur des aufgerufenen Lambdas und nimmt ab
+# dann einen schnellen Weg. Der Operator steht dort direkt im Code statt
+# über bin_operations[op], Vergleiche sparen as_int, Aufrufe bauen den Frame
+# ohne parse_call_arguments und bind_frame. Ein Guard prüft bei jedem
+# Durchlauf, ob die Typen noch passen. Tut er es einmal nicht, fällt die
+# Stelle auf den allgemeinen Weg zurück und bleibt dort.
+
+UNSEEN, MONO, GENERIC = "neu", "spezialisiert", "allgemein"
+NUMBERS = {int, float}
+
+# Schneller Weg je Operator, nur für int und float
+_INLINE = {
+    "plus": "x + y",
+    "minus": "x - y",
+    "times": "x * y",
+    "divide": "x / y",
+    "divide_floor": "x // y",
+    "divide_ceil": "-(-x // y)",
+    "mod": "x % y",
+    "power": "x ** y",
+    "equals": "1 if x == y else 0",
+    "unequals": "1 if x != y else 0",
+    "smaller_than": "1 if x < y else 0",
+    "greater_than": "1 if x > y else 0",
+    "smaller_equals": "1 if x <= y else 0",
+    "greater_equals": "1 if x >= y else 0",
+}
+
+# Der Operator muss im Code stehen, ein Aufruf von operator.add wäre
+# langsamer als die Lambdas aus bin_operations. Deshalb wird je Operator
+# einmal beim Import eine eigene Fabrik aus dieser Vorlage erzeugt.
+_TEMPLATE = """
+def make(a, b, generic, site):
+    left = right = None  # noch nichts beobachtet, der Guard schlägt fehl
+
+    def f(env):
+        x = a(env)
+        y = b(env)
+        if type(x) is left and type(y) is right:
+            return {expression}
+        return miss(x, y)
+
+    def miss(x, y):
+        nonlocal left, right
+        if site.state is UNSEEN and type(x) in NUMBERS and type(y) in NUMBERS:
+            left, right = type(x), type(y)
+            site.specialize((left, right))
+        elif site.state is not GENERIC:
+            left = right = None
+            site.deoptimize()
+        return generic(x, y)
+
+    return f
+"""
+
+
+def _factory(expression):
+    namespace = {"UNSEEN": UNSEEN, "GENERIC": GENERIC, "NUMBERS": NUMBERS}
+    exec(_TEMPLATE.format(expression=expression), namespace)
+    return namespace["make"]
+
+
+_FACTORIES = {op: _factory(expression) for op, expression in _INLINE.items()}
+
+
+class Site:
+    """Typ-Rückmeldung einer Stelle: Zustand, beobachtete Typen, Rückfälle"""
+
+    __slots__ = ("kind", "state", "types", "deopts")
+
+    def __init__(self, kind):
+        self.kind = kind  # Operator bzw. "call"
+        self.state = UNSEEN
+        self.types = None  # (int, int) bzw. Signatur des Lambdas
+        self.deopts = 0
+
+    def specialize(self, types):
+        self.state, self.types = MONO, types
+
+    def deoptimize(self):
+        if self.state is MONO:
+            self.deopts += 1
+        self.state, self.types = GENERIC, None
+
+    def __repr__(self):
+        return f"Site({self.kind}, {self.state}, {self.types})"
+
+
+def _simple(lambda_obj, argc):
+    """Reicht für das Lambda ein Frame mit den Argumenten vorne in den Slots?"""
+    sig = lambda_obj.signature
+    return (
+        lambda_obj.names is not None
+        and lambda_obj.memo is None
+        and sig.varargs is None
+        and sig.prefix
+        and len(sig.params) == len(sig.template) == argc
+    )
+
+
+class Quickener:
+    """Erzeugt die Stellen für compiler.compile_ast, solange compiler.sites gesetzt ist"""
+
+    def __init__(self):
+        self.sites: list = []
+
+    def _site(self, kind):
+        site = Site(kind)
+        self.sites.append(site)
+        return site
+
+    def binop(self, op, a, b):
+        generic = bin_operations[op]
+        if op not in _FACTORIES:  # xor, exp, ...
+            return lambda env: generic(a(env), b(env))
+        return _FACTORIES[op](a, b, generic, self._site(op))
+
+    def call(self, func_code, codes, tail):
+        """Aufruf nur mit positionellen Argumenten"""
+        site = self._site("call")
+        expected = names = padding = None  # Signatur, Slot-Tabelle, freie Slots
+
+        def f(env):
+            func_obj = func_code(env)
+            # gleiche Signatur heißt: derselbe lambda-Ausdruck, keine Partial Application
+            if type(func_obj) is Lambda and func_obj.signature is expected and func_obj.memo is None:
+                args = [code(env) for code in codes]
+                if tail:
+                    return TailCall(func_obj, args, {})
+                result = func_obj.body(Frame(names, args + padding, func_obj.closure_env))
+                if type(result) is TailCall:
+                    return _call(result.lambda_obj, result.pos_args, result.keyword_args)
+                return result
+            return miss(env, func_obj)
+
+        def miss(env, func_obj):
+            nonlocal expected, names, padding
+            if not isinstance(func_obj, Lambda):
+                raise TypeError(f"Cannot call object of type {type(func_obj)}")
+            if site.state is UNSEEN and _simple(func_obj, len(codes)):
+                expected, names = func_obj.signature, func_obj.names
+                padding = [None] * (expected.slot_count - len(codes))
+                site.specialize(expected)
+            elif site.state is not GENERIC:
+                expected = None
+                site.deoptimize()
+            args = [code(env) for code in codes]
+            if tail:
+                return TailCall(func_obj, args, {})
+            return _call(func_obj, args, {})
+
+        return f
+
+
+def compile(expression):
+    """(closure, stellen) für einen aufgelösten AST, wie compiler.compile_ast"""
+    quickener = Quickener()
+    compiler.sites = quickener
+    try:
+        return compile_ast(expression), quickener.sites
+    finally:
+        compiler.sites = None
+
+
+def run(expression, env: Environment):
+    """Kompiliert den AST mit Typ-Rückmeldung und führt ihn direkt aus"""
+    code, _ = compile(resolve(expression))
+    return code(Frame({}, [], env, env))
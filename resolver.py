@@ -0,0 +1,94 @@
+# Resolver-Pass für den Closure-Compiler: jede Variable wird einmal beim
+# Kompilieren auf eine Adresse abgebildet
+#   ("local", depth, slot, name)  -- depth Frames nach oben, dann slots[slot]
+#   ("global", name)              -- über den Namen im globalen Environment
+# Scopes sind nur Lambda-Aufrufe und sei-Bindungen, alles andere (auch
+# Schleifenzähler und neue Variablen aus :=) landet wie bisher global.
+
+
+def lookup(name, scopes):
+    """Adresse eines Namens in der Scope-Kette (innerster Scope zuletzt)"""
+    for i in range(len(scopes) - 1, -1, -1):
+        if name in scopes[i]:
+            return ("local", len(scopes) - 1 - i, scopes[i][name], name)
+    return ("global", name)
+
+
+def lambda_names(parameter):
+    """Slot-Tabelle eines Lambdas: Parameter, Defaults und varargs"""
+    names = {}
+    for param in parameter[1]:
+        names.setdefault(param[1], len(names))
+    return names
+
+
+def _resolve_all(body, scopes):
+    return [resolve(expr, scopes) for expr in body]
+
+
+def resolve(expression, scopes=()):
+    """Ersetzt Variablennamen im AST durch (depth, slot)-Adressen"""
+    match expression:
+        case ("var", n):
+            return lookup(n, scopes)
+        case ("complex", imag):
+            return ("complex", resolve(imag, scopes))
+        case ("binop", op, expr1, expr2):
+            return ("binop", op, resolve(expr1, scopes), resolve(expr2, scopes))
+        case ("comparison", op, x, y):
+            return ("comparison", op, resolve(x, scopes), resolve(y, scopes))
+        case ("assign", op, var, val):
+            return ("assign", op, lookup(var, scopes), resolve(val, scopes))
+        case ("unary", op, expr):
+            return ("unary", op, resolve(expr, scopes))
+        case ("seq", body):
+            return ("seq", _resolve_all(body, scopes))
+        case ("if", condition, then_body, else_body):
+            if else_body is not None:
+                else_body = [
+                    (cond if cond == "None" else resolve(cond, scopes), _resolve_all(statement, scopes))
+                    for cond, statement in else_body
+                ]
+            return ("if", resolve(condition, scopes), _resolve_all(then_body, scopes), else_body)
+        case ("while", condition, body):
+            return ("while", resolve(condition, scopes), _resolve_all(body, scopes))
+        case ("loop", counter, (left, expr1, expr2, right), body):
+            interval = (left, resolve(expr1, scopes), resolve(expr2, scopes), right)
+            return ("loop", lookup(counter, scopes), interval, _resolve_all(body, scopes))
+        case ("lambda", parameter, body):
+            names = lambda_names(parameter)
+            # Defaults werden beim Erzeugen im äußeren Scope ausgewertet
+            parameter = (
+                parameter[0],
+                [
+                    ("keyword", p[1], resolve(p[2], scopes)) if p[0] == "keyword" else p
+                    for p in parameter[1]
+                ],
+            )
+            return ("lambda", parameter, resolve(body, (*scopes, names)), names)
+        case ("call", func, args_expr):
+            # Keyword-Namen beim Aufruf sind Parameter-Namen, keine Variablen
+            args = [
+                ("pos", resolve(p[1], scopes)) if p[0] == "pos"
+                else ("keyword", p[1], resolve(p[2], scopes))
+                for p in args_expr[1]
+            ]
+            return ("call", resolve(func, scopes), (args_expr[0], args))
+        case ("let", asgn, body):
+            names = {asgn[2]: 0}
+            inner = (*scopes, names)  # letrec: Zuweisung sieht den eigenen Namen
+            return ("let", resolve(asgn, inner), resolve(body, inner), names)
+        case ("function", func, params):
+            return ("function", func, _resolve_all(params, scopes))
+        case ("array", list_elements):
+            return ("array", _resolve_all(list_elements, scopes))
+        case ("array_access", array_ptr, index):
+            if index not in (".", "*"):
+                index = resolve(index, scopes)
+            return ("array_access", resolve(array_ptr, scopes), index)
+        case ("list", list_elements):
+            return ("list", _resolve_all(list_elements, scopes))
+        case ("cons", expr1, expr2):
+            return ("cons", resolve(expr1, scopes), resolve(expr2, scopes))
+        case _:
+            return expression
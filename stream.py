@@ -0,0 +1,184 @@
+import re
+import sys
+from ply.lex import LexToken
+from backend import BACKENDS
+from environment import Environment
+from lexer import lexer, table
+import positions
+
+# Dateien Anweisung für Anweisung ausführen: die Datei wird zeilenweise
+# gelesen und gelext, die Tokens werden an den ;-Grenzen der obersten Ebene
+# in Anweisungen zerlegt, jede Anweisung wird sofort geparst und ausgeführt.
+# Im Speicher liegt also immer nur die aktuelle Anweisung.
+#
+# Einschränkung: Strings dürfen nicht über mehrere Zeilen gehen, Kommentare
+# (# ... #) schon. Ein # in einem String öffnet keinen Kommentar.
+
+# Diese Tokens öffnen einen Block, der mit "." endet
+BLOCK_OPENERS = {"IF", "WHILE", "LOOP", "LET"}
+# Strings wie beim Lexer (ein # darin zählt nicht) oder ein #
+_STRING_OR_HASH = re.compile(next(p for p, name in table.items() if name == "STRING") + r"|\#")
+
+
+class _Chunk:
+    """Lexdaten für print_error_with_caret, erst bei einem Syntaxfehler gebaut
+
+    lexpos der Tokens ist der Offset in der ganzen Datei (wie in der
+    SourceMap), also wird vor dem Stück so aufgefüllt, dass Zeile first_line
+    genau bei start beginnt.
+    """
+
+    __slots__ = ("text", "first_line", "start")
+
+    def __init__(self, text, first_line, start):
+        self.text = text
+        self.first_line = first_line
+        self.start = start
+
+    @property
+    def lexdata(self):
+        padding = self.start - (self.first_line - 1)
+        return " " * padding + "\n" * (self.first_line - 1) + self.text
+
+
+def _comment_open(line, open_):
+    """Ist nach line ein Kommentar offen, wenn davor schon einer offen war?
+
+    Nur die neue Zeile wird gelesen, Strings gehen nie über eine Zeile hinaus.
+    """
+    pos = 0
+    while True:
+        if open_:
+            end = line.find("#", pos)
+            if end < 0:
+                return True
+            pos, open_ = end + 1, False
+        m = _STRING_OR_HASH.search(line, pos)
+        if m is None:
+            return False
+        pos, open_ = m.end(), m.group() == "#"
+
+
+def iter_lines(lines):
+    """Zeilen zu lexbaren Stücken zusammenfassen: Kommentare bleiben ganz"""
+    chunk, first_line, open_ = [], 1, False
+    for lineno, line in enumerate(lines, 1):
+        if not chunk:
+            first_line = lineno
+        chunk.append(line)
+        open_ = _comment_open(line, open_)
+        if not open_:
+            yield "".join(chunk), first_line
+            chunk = []
+    if chunk:
+        yield "".join(chunk), first_line
+
+
+def iter_tokens(lines):
+    """Tokens einer Datei, Stück für Stück vom PLY-Lexer geholt"""
+    lex = lexer.clone()
+    start = 0  # Offset des Stücks in der Datei
+    for text, first_line in iter_lines(lines):
+        lex.input(text)
+        lex.lineno = first_line
+        chunk = _Chunk(text, first_line, start)
+        for tok in iter(lex.token, None):
+            tok.lexpos += start
+            tok.lexer = chunk
+            yield tok
+        start += len(text)
+
+
+def split_statements(tokens):
+    """Token-Listen der Anweisungen auf oberster Ebene
+
+    Eine Datei der Form { a; b; c } wird wie a; b; c behandelt. Gezählt
+    werden nur { } und die Blöcke wenn/solange/für/sei, die mit . enden;
+    ; kommt sonst nirgends vor.
+    """
+    statement = []
+    depth = 0
+    wrapped = None  # äußere { } um die ganze Datei
+    previous = None
+    for tok in tokens:
+        kind = tok.type
+        if wrapped is None:
+            wrapped = kind == "BEGIN"
+            if wrapped:
+                previous = kind
+                continue
+        if depth == 0 and kind == "SEMICOLON":
+            if statement:
+                yield statement
+            statement = []
+            previous = kind
+            continue
+        if depth == 0 and kind == "END" and wrapped:
+            wrapped = False
+            previous = kind
+            continue
+        if kind == "BEGIN" or (kind in BLOCK_OPENERS and previous != "ELIF"):
+            depth += 1
+        elif kind == "END" or (kind == "DOT" and previous != "OPEN_BRACKETS"):
+            depth -= 1
+        statement.append(tok)
+        previous = kind
+    if statement:
+        yield statement
+
+
+def _token(kind, value, like):
+    tok = LexToken()
+    tok.type, tok.value = kind, value
+    tok.lineno, tok.lexpos, tok.lexer = like.lineno, like.lexpos, like.lexer
+    return tok
+
+
+def parse_tokens(tokens, filename=None, register_map=True):
+    """Tokens einer Anweisung als (("seq", [anweisung]), SourceMap) parsen
+
+    Bei einem Syntaxfehler (None, None). Die Offsets sind die lexpos der
+    Tokens, ohne Quelltext liest die SourceMap Zeile/Spalte aus filename.
+    """
+    tokens = iter([_token("BEGIN", "{", tokens[0]), *tokens, _token("END", "}", tokens[-1])])
+    return positions.parse_with_map(
+        None, filename, register_map, lexer=lexer, tokenfunc=lambda: next(tokens, None)
+    )
+
+
+def parse_statement(tokens, filename=None):
+    """Eine Anweisung als ("seq", [anweisung]) parsen, None bei Syntaxfehler"""
+    return parse_tokens(tokens, filename)[0]
+
+
+def statements(lines, filename=None):
+    """ASTs der Anweisungen, jeweils erst geparst, wenn sie gebraucht werden"""
+    for tokens in split_statements(iter_tokens(lines)):
+        yield parse_statement(tokens, filename)
+
+
+def run_stream(path, backend="eval", env=None):
+    """Führt eine Datei Anweisung für Anweisung aus, Ergebnis der letzten"""
+    run = BACKENDS[backend]
+    env = Environment() if env is None else env
+    result = None
+    with open(path, encoding="utf-8") as lines:
+        for ast in statements(lines, str(path)):
+            if ast is None:
+                return None  # Syntaxfehler, Meldung kam schon vom Parser
+            try:
+                result = run(ast, env)
+            except Exception as e:
+                if where := positions.failing_location(e):
+                    e.add_note(f"bei {where}")
+                raise
+    return result
+
+
+if __name__ == "__main__":
+    backend = "eval"
+    for arg in sys.argv[1:]:
+        if arg[1:] in BACKENDS:
+            backend = arg[1:]
+        else:
+            print(run_stream(arg, backend))
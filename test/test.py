@@ -1,15 +1,45 @@
 from lexer import lexer
-from parser import parser
+from parser import parser, tables_up_to_date
 from interpreter import eval
-from environment import Environment
+from backend import BACKENDS
+from fold import fold
+from analysis import counter_usage
+import analysis
+import bytecode
+import vm
+from _list import from_values, list_tail
+from _lambda import Signature
+from hamt import HamtMap
+from _array import is_array, make_array
+from environment import Environment, Frame, PersistentEnvironment
+from stream import run_stream, split_statements, iter_tokens
+import stream
+import cache
+import conformance
+from bench import suite
+from profiler import Profiler
+import positions
+from tokenizer import Tokenizer
+from incremental import IncrementalParser
+from resolver import resolve
+import quicken
+import transpiler
+from lexer import LineIndex
+import interpreter
 import math
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 env = Environment()
 env.put(["x"])
 
+# Backends, die gegen eval geprüft werden: alle oder z.B. "-vm" / "-closure"
+SELECTED_BACKENDS = [b for b in BACKENDS if f"-{b}" in sys.argv] or [
+    b for b in BACKENDS if b != "eval"
+]
+
 __BASE_DIR = Path(__file__).resolve().parent.parent
 __SEARCH_PATH = __BASE_DIR / "test"
 ALL_TEST_FILES = []
@@ -83,14 +113,27 @@ def test_interpreter(input_string, env=None, verbose=False):
 
     if env is None:
         env = Environment()
+    checks = {b: BACKENDS[b] for b in SELECTED_BACKENDS}
+    checks["fold"] = lambda ast, env: eval(fold(ast), env)
+    backend_envs = {b: env.copy() for b in checks}
 
     ast = parser.parse(input_string, debug=verbose)
     print(ast, end=" === ") if verbose else ""
     res = eval(ast, env)
     print(res) if verbose else ""
+    # Alle gewählten Backends müssen dasselbe Ergebnis liefern
+    for b, backend_env in backend_envs.items():
+        assert same(checks[b](ast, backend_env), res), b
     return res
 
 
+def same(a, b):
+    """== auch für numpy-Arrays, mit gleichem dtype"""
+    if is_array(a) or is_array(b):
+        return is_array(a) and is_array(b) and a.dtype == b.dtype and a.tolist() == b.tolist()
+    return a == b
+
+
 assert test_interpreter("5") == 5
 assert test_interpreter("3.14") == 3.14
 assert test_interpreter("x", env={"x": 7}) == 7
@@ -121,6 +164,10 @@ assert test_interpreter("6 >= 5") == 1
 
 assert test_interpreter("1 and 1") == 1
 assert test_interpreter("1 or 0") == 1
+assert test_interpreter("1 or 1") == 1
+assert test_interpreter("0 or 2") == 1
+assert test_interpreter("0 and 1") == 0
+assert test_interpreter("3 and 2") == 1
 assert test_interpreter("1 xor 0") == 1
 assert test_interpreter("1 xor 1") == 0
 assert test_interpreter("not 1") == 0
@@ -147,6 +194,336 @@ assert test_interpreter("{2 < 5 and 5<2 e 10 and 2e 10 > 0}") == 1
 assert test_interpreter("{(2 < 5) and (5<2 e 10) and (2e 10 > 0)}") == 1
 assert test_interpreter("{x:=2<3; x:=x+1; x}") == 2
 
+# Vergleichsketten: jeder Operand einmal, Abbruch beim ersten falschen Glied
+zaehler = "n := 0; f := lambda x -> {n +:= 1; x};"
+assert test_interpreter("{" + zaehler + " 1 < f(2) < 3; n}") == 1
+assert test_interpreter("{" + zaehler + " 1 < f(2) < f(3) <= 3; n}") == 2
+assert test_interpreter("{" + zaehler + " 5 < f(2) < f(3) < 9; n}") == 1
+assert test_interpreter("{" + zaehler + " 5 < f(2) < f(3) < 9}") == 0
+assert test_interpreter("1 < 2 < 0 < 5") == 0
+assert test_interpreter("1 < 2 < 3 = 3") == 1
+
+# für-Schleife: Zähler nativ, Endwert landet trotzdem im Environment
+assert test_interpreter("{s := 0; für i in [1, 4] wiederhole s +:= i .; s}") == 9
+assert test_interpreter("{s := 0; für i in [1, 4] wiederhole s +:= 1 .; i}") == 4
+assert test_interpreter("{s := 0; für i in ]1, 4[ wiederhole s +:= i .; s + i}") == 6
+assert test_interpreter("{für i in [5, 2] wiederhole 1 .; i}") == 5
+assert test_interpreter("{s := 0; für i in [0, 10] wiederhole i +:= 2; s +:= 1 .; s}") == 4
+assert test_interpreter("{n := 0; f := lambda x -> i := 30; für i in [0, 20] wiederhole f(1); n +:= 1 .; n}") == 1
+assert counter_usage("i", parser.parse("{s +:= 1}")[1]) == "unused"
+assert counter_usage("i", parser.parse("{s +:= i}")[1]) == "read"
+assert counter_usage("i", parser.parse("{f(s)}")[1]) == "assigned"
+for n in range(analysis.MAX_CACHED + 10):
+    eval(parser.parse(f"{{für i in [0, 2] wiederhole {n} .}}"), Environment())
+assert len(analysis._cache) <= analysis.MAX_CACHED
+
+# Listen: Cons-Zellen, & ist rechtsassoziativ
+assert test_interpreter("{list(1, 2, 3)}") == from_values([1, 2, 3])
+assert test_interpreter("{1 & 2 & 3 & leere}") == from_values([1, 2, 3])
+assert test_interpreter("{(1 & 2 & leere)[.]}") == 1
+assert test_interpreter("{(1 & 2 & leere)[*]}") == from_values([2])
+assert test_interpreter("{list(4, 5, 6)[2]}") == 6
+assert test_interpreter("{länge(list(4, 5, 6))}") == 3
+assert test_interpreter("{länge(leere)}") == 0
+assert test_interpreter("{l := leere; für i in [0, 100000] wiederhole l := i & l .; länge(l) + (l[.])}") == 200000
+assert repr(from_values([1, 2])) == "list(1, 2)"
+
+# Arrays aus lauter ints/floats sind numpy-Arrays, binops elementweise
+assert same(test_interpreter("{[1, 2, 3] + 1}"), make_array([2, 3, 4]))
+assert same(test_interpreter("{[1, 2, 3] * [4, 5, 6]}"), make_array([4, 10, 18]))
+assert same(test_interpreter("{[1, 2, 3] <= 2}"), make_array([1, 1, 0]))
+assert same(test_interpreter("{[1.0, 2.0] | 2}"), make_array([0.5, 1.0]))
+assert test_interpreter("{[1, 2.5]}") == [1, 2.5]
+assert test_interpreter("{summe([1, 2, 3] ** 2)}") == 14
+assert test_interpreter("{maximum([1.5, 2.5]) + minimum([4, 3])}") == 5.5
+assert test_interpreter("{summe(list(1, 2, 3))}") == 6
+assert type(test_interpreter("{[4, 5, 6][1]}")) is int
+assert test_interpreter("{x := [1, 2, 3]; für i in [0, x[2]] wiederhole 1 .; i}") == 3
+# int64 läuft nicht über, dann wird mit Python-ints gerechnet
+big = 2**62
+assert test_interpreter(f"{{[{big}, 2] * 4}}").tolist() == [2**64, 8]
+assert test_interpreter("{[10, 20] ** 20}").tolist() == [10**20, 20**20]
+assert test_interpreter(f"{{summe([{big}, {big}])}}") == 2**63
+assert test_interpreter(f"{{-[{-(2**63)}, 1]}}").tolist() == [2**63, -1]
+assert same(test_interpreter(f"{{[{big}, 2] * 4 - [{2**64}, 0]}}"), make_array([0, 8]))
+assert test_interpreter(f"{{[{2**70}, 1] + 1}}").tolist() == [2**70 + 1, 2]
+# = und != vergleichen wie bei Listen als Ganzes, mit einer Zahl also nie gleich
+assert test_interpreter("{[1, 2] = [1, 2, 3]}") == 0
+assert test_interpreter("{[1, 2] != [1, 2, 3]}") == 1
+assert test_interpreter("{[1, 2] = [1, 2]}") == 1
+assert test_interpreter("{[1, 2] = [1, 2.5]}") == 0
+assert test_interpreter("{wenn [1, 2] = [1, 2] gilt, 7 sonst 8 .}") == 7
+assert test_interpreter("{[1, 2] = 2}") == 0 and test_interpreter("{[2] != 2}") == 1
+# sonst auch die Regeln der Listen: + hängt an, wahr heißt nicht leer
+assert same(test_interpreter("{[1, 2, 3] + [4]}"), make_array([1, 2, 3, 4]))
+assert test_interpreter("{[1, 2] + [2.5]}") == [1, 2, 2.5]
+assert same(test_interpreter("{x := [1]; x +:= [2, 3]; x}"), make_array([1, 2, 3]))
+assert test_interpreter("{[1, 2] and 1}") == 1 and test_interpreter("{not [1, 2]}") == 0
+assert test_interpreter("{wenn [1, 2] gilt, 7 sonst 8 .}") == 8  # [1, 2] = 1 ist falsch
+assert test_interpreter("{n := 0; x := [1]; solange x gilt, n +:= 1; wenn n = 3 gilt, x := 0 . .; n}") == 3
+# negative Exponenten wie bei Python-ints
+assert same(test_interpreter("{[2, 4] ** -1}"), make_array([0.5, 0.25]))
+assert test_interpreter("{[2, 3] ** [1, -1]}").tolist() == [2, 1 / 3]
+
+# arr[*] kopiert nicht: gemischte Arrays liefern Views auf dieselbe Liste
+assert test_interpreter("{a := [1, 2.5, 3, 4]; a[*]}") == [2.5, 3, 4]
+assert test_interpreter("{a := [1, 2.5, 3, 4]; länge(a[*][*]) + (a[*][*][0])}") == 5
+assert test_interpreter("{a := [1, 2.5, 3, 4]; a[*][*][*]}") == 4
+assert test_interpreter("{a := [1, 2, 3]; (a[*])[1]}") == 3
+assert test_interpreter("{a := [1, 2.5, 3]; b := (a[*]); b = [2.5, 3]}") == 1
+assert test_interpreter("{[1.5, 2, 3][*] = [2, 3]}") == 1
+assert test_interpreter("{[2, 3] = ([1.5, 2, 3][*])}") == 1
+assert test_interpreter("{[1.5, 2, 3][*] != [2, 4]}") == 1
+arr = list(range(100000)) + ["x"]
+view = arr
+for _ in range(99999):
+    view = list_tail(view)
+assert view.base is arr and view == [99999, "x"] and len(view) == 2
+test_code = """sei walk = lambda (a, n) ->
+    wenn länge(a) = 2 gilt, n + 2 sonst walk(a[*], n + 1) .
+in walk([1, 2, 3.0, 4, 5, 6, 7, 8], 0) ."""
+assert test_interpreter(test_code) == 8
+
+# Argumente binden: schneller Weg und Partial Application über Signature
+assert test_interpreter("{f := lambda (a, b) -> a - b; g := f(b: 1); g(5)}") == 4
+assert test_interpreter("{f := lambda (a, b: 2) -> a * b; f(3) + f(3, b: 5)}") == 21
+assert test_interpreter("{f := lambda (a, b, c) -> a - b - c; f(10)(2)(3)}") == 5
+sig = Signature(["a", "b"], ["c"], "rest", {"c": 0, "a": 1, "b": 2, "rest": 3})
+assert sig.param_slots == (1, 2) and not sig.prefix and sig.slot_count == 4
+assert list(sig.template) == ["a", "b", "c", "rest"]
+
+# merke: LRU-Cache über alle gebundenen Werte, auch bei Partials und Defaults
+test_code = "sei fib = merke(lambda n -> wenn n < 2 gilt, n sonst fib(n - 1) + fib(n - 2) .) in fib(80) ."
+assert test_interpreter(test_code) == 23416728348467685
+assert test_interpreter("{f := merke(lambda (a, b) -> a * 10 + b); g := f(1); h := f(2); g(3) + h(3) + g(3)}") == 49
+assert test_interpreter("{f := merke(lambda (a, b: 1) -> a + b); f(1) + f(1, b: 5) + f(1)}") == 10
+for run in BACKENDS.values():
+    env = Environment()
+    run(parser.parse("{f := merke(lambda n -> n * 2, 2); f(1); f(2); f(1); f(3)}"), env)
+    assert env["f"].memo.stats() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+    assert list(env["f"].memo.entries) == [((int, 1),), ((int, 3),)]
+assert type(test_interpreter("{f := merke(lambda x -> x); f(1); f(1.0)}")) is float  # 1 == 1.0
+
+# Persistente Hash-Map: gleiches Verhalten wie dict, alte Versionen bleiben gültig
+class SameHash:
+    def __init__(self, n):
+        self.n = n
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, SameHash) and other.n == self.n
+
+
+reference, versions, hamt_map = {}, [], HamtMap()
+for i in range(3000):
+    key = SameHash(i % 7) if i % 5 == 0 else (i * 7919) % 1009
+    hamt_map = hamt_map.set(key, i)
+    reference[key] = i
+    versions.append((hamt_map, dict(reference)))
+for old_map, old_reference in versions[::250]:
+    assert len(old_map) == len(old_reference)
+    assert all(old_map[k] == v for k, v in old_reference.items())
+    assert dict(old_map.items()) == old_reference
+assert SameHash(3) in hamt_map and SameHash(8) not in hamt_map and 5000 not in hamt_map
+
+env = PersistentEnvironment()
+assert test_interpreter("{a := 1; b := 2; a + b}", env) == 3
+snapshot = env.snapshot()
+test_interpreter("{a := 10; c := 5}", env)
+assert env["a"] == 10 and env["c"] == 5
+env.restore(snapshot)
+assert env["a"] == 1 and "c" not in env
+assert test_interpreter("{f := lambda x -> x + a; f(2)}", env) == 3
+
+# Dateien Anweisung für Anweisung: gleiches Ergebnis wie am Stück
+for path, content in ALL_TEST_FILES:
+    try:
+        expected = parser.parse(content) and eval(parser.parse(content), Environment())
+    except Exception:
+        continue
+    assert same(run_stream(path), expected), path
+stream_source = [
+    "{ x := 1;\n",
+    "  # Kommentar; über\n zwei Zeilen #\n",
+    "  wenn x = 1 gilt, y := 2; z := 3 sonst y := 0 .;\n",
+    "  l := [1, 2, 3]; s := 0;\n",
+    "  für i in [0, 3[ wiederhole s := s + (l[i]); s := s .;\n",
+    "  sei a = 1 in a + 1 .; (l[*])[.] + s\n",
+    "}\n",
+]
+assert len(list(split_statements(iter_tokens(stream_source)))) == 7
+# ein # im String öffnet keinen Kommentar, ein ' im Kommentar keinen String
+chunks = list(stream.iter_lines(['s := "a#b";\n', "x := 2;\n", "# 'Text\n", "# y := 3\n"]))
+assert [first for _, first in chunks] == [1, 2, 3]
+assert stream._comment_open('a # b "\n', False) and not stream._comment_open('c # d "#"\n', True)
+with tempfile.TemporaryDirectory() as tmp:
+    stream_file = Path(tmp) / "stream.incc25"
+    stream_file.write_text("".join(stream_source), encoding="utf-8")
+    expected = eval(parser.parse("".join(stream_source)), Environment())
+    for backend in BACKENDS:
+        assert same(run_stream(stream_file, backend), expected) and expected == 7
+
+# Konformitäts-Läufer: Erwartung aus Kommentar oder .expected-Datei
+with tempfile.TemporaryDirectory() as tmp:
+    programs = {
+        "kommentar.incc25": "{\n# ergebnis: 6 #\nx := 2; x * 3\n}",
+        "daneben.incc25": "{ 2 + 2 }",
+        "falsch.incc25": "{ # ergebnis: 5 # 2 + 2 }",
+        "fehler.incc25": "{ y + 1 }",
+        "ohne.incc25": "{ 1 }",
+        "gewollt.incc25": "{ # fehler: variable y not found # y + 1 }",
+        "ungewollt.incc25": "{ # fehler: variable y not found # 1 }",
+    }
+    for name, source in programs.items():
+        (Path(tmp) / name).write_text(source, encoding="utf-8")
+    (Path(tmp) / "daneben.expected").write_text("4\n", encoding="utf-8")
+    assert conformance.expected_result(Path(tmp) / "kommentar.incc25") == "6"
+    assert conformance.expected_result(Path(tmp) / "ohne.incc25") is None
+    results = conformance.run([tmp], ("eval", "vm"), workers=2)
+    status = {(Path(r[0]).name, r[1]): r[2] for r in results}
+    for backend in ("eval", "vm"):
+        assert status["kommentar.incc25", backend] == conformance.PASS
+        assert status["daneben.incc25", backend] == conformance.PASS
+        assert status["falsch.incc25", backend] == conformance.FAIL
+        assert status["fehler.incc25", backend] == conformance.ERROR
+        assert status["ohne.incc25", backend] == conformance.PASS
+        assert status["gewollt.incc25", backend] == conformance.PASS
+        assert status["ungewollt.incc25", backend] == conformance.FAIL
+
+# Benchmark-Suite: Phasen einzeln, Regression gegen eine Baseline
+timings = suite.run({"klein": "{x := 2; x * 3}"}, ("eval",), warmup=0, repeats=1)
+assert set(timings["klein"]) == {"lex", "parse", "eval"}
+assert suite.parse(suite.lex("{x := 2; x * 3}")) == parser.parse("{x := 2; x * 3}")
+baseline = {"klein": {"lex": {"min": 1.0}, "eval": {"min": 1.0}}}
+now = {"klein": {"lex": {"min": 1.2}, "eval": {"min": 1.3}, "parse": {"min": 9.0}}}
+assert suite.regressions(now, baseline, 0.25) == [("klein", "eval", 1.0, 1.3)]
+
+# Profiler: nur innerhalb von with ist interpreter.eval ersetzt
+original_eval = interpreter.eval
+profiler = Profiler()
+assert profiler.run(parser.parse("{f := lambda x -> x + 1; g := f; f(1) + g(2)}"), Environment()) == 5
+assert interpreter.eval is original_eval
+profile = profiler.to_dict()
+assert profile["nodes"]["binop:plus"]["calls"] == 3 and profile["nodes"]["call"]["calls"] == 2
+assert [(e["name"], e["calls"]) for e in profile["lambdas"]] == [("f", 2)]
+profiler = Profiler()
+profiler.run(parser.parse("{sei fac = lambda n -> wenn n = 0 gilt, 1 sonst n * fac(n - 1) . in fac(6) .}"), Environment())
+nodes = profiler.to_dict()["nodes"]
+assert nodes["if"]["calls"] == 7 and nodes["if"]["cumulative"] <= nodes["let"]["cumulative"]
+assert all(0 <= n["self"] <= n["cumulative"] + 1e-9 for n in nodes.values())
+
+# Quelltext-Positionen in einer Tabelle neben dem AST
+source = "{x := 1;\n  f := lambda a ->\n    a + unbekannt;\n  f(x) < 3\n}"
+ast, source_map = positions.parse_with_map(source, "pos.incc25")
+assert ast == parser.parse(source)
+assert positions.pending is None and positions.parse_with_map("{1 +}") == (None, None)
+assert positions.pending is None  # auch nach einem Syntaxfehler wieder frei
+lambda_node = ast[1][1][3]
+plus_node = lambda_node[2]
+assert source_map.locate(ast[1][0]) == (1, 4)  # :=
+assert positions.where(lambda_node) == "pos.incc25:2:8"
+assert positions.where(plus_node) == "pos.incc25:3:7" and positions.where(plus_node[3]) == "pos.incc25:3:9"
+assert positions.where(ast[1][2]) == "pos.incc25:4:8"  # <
+assert positions.where(("var", "unbekannt")) is None
+try:
+    eval(ast, Environment())
+    assert False
+except Exception as e:
+    assert positions.failing_location(e) == "pos.incc25:3:9"
+with tempfile.TemporaryDirectory() as tmp:
+    cache_dir, evicted, cache.CACHE_DIR = cache.CACHE_DIR, cache._evicted, Path(tmp)
+    path = Path(tmp) / "pos.incc25"
+    path.write_text(source[1:-1], encoding="utf-8")  # ohne { }: Zeilen bleiben gleich
+    for _ in range(2):  # Fehlschlag, dann Treffer mit Offsets aus dem Cache
+        cached = cache.parse_file(path)
+        assert positions.where(cached[1][1][3][2][3]) == f"{path}:3:9"
+    with open(path, encoding="utf-8") as lines:
+        statement = list(stream.statements(lines, str(path)))[1]
+    assert positions.where(statement[1][0][3]) == f"{path}:2:8"
+    cache.CACHE_DIR, cache._evicted = cache_dir, evicted
+
+# Tokenizer: dieselben Tokens wie der PLY-Lexer, Fehlerstellen über LineIndex
+def token_stream(lex, text):
+    lex.input(text)
+    return [(t.type, t.value, t.lexpos) for t in iter(lex.token, None)]
+
+
+tricky = 'x and:= y; e:=3; 2e3; 1. + .5; "a\nb"; gilt , ,aber; 🙂x := 1 # a\nb #; x <=:= 2 ** 3 != 4'
+for source in [content for _, content in ALL_TEST_FILES] + list(suite.PROGRAMS.values()) + [tricky]:
+    assert token_stream(Tokenizer(), source) == token_stream(lexer.clone(), source)
+    if source is not tricky:
+        assert parser.parse(source, lexer=Tokenizer()) == parser.parse(source)
+# Bezeichner, die mit einem Schlüsselwort anfangen, zerlegen beide gleich
+for source in ["index", "ende", "and2", "sonst3", "echo(e2)", "element", "order", "{index := 3}", "{1 and2}", "x \t"]:
+    assert token_stream(Tokenizer(), source) == token_stream(lexer.clone(), source), source
+assert [t[:2] for t in token_stream(Tokenizer(), "index and2")] == [
+    ("IN", "in"), ("IDENTIFIER", "dex"), ("AND", "and"), ("NUMBER", "2")
+]
+tokenizer = Tokenizer()
+tokenizer.input('{x := 1;\n# zwei\nZeilen #\n  y := "a\nb" + z}')
+assert [t.lineno for t in iter(tokenizer.token, None) if t.type == "IDENTIFIER"] == [1, 4, 5]
+assert tokenizer.locate(tokenizer.lexdata.rindex("z")) == (5, 5)
+line_index = LineIndex("ab\n\ncd\n")
+assert [line_index.locate(i) for i in (0, 2, 3, 4, 5, 7)] == [(1, 0), (1, 2), (2, 0), (3, 0), (3, 1), (4, 0)]
+assert line_index.line(3) == "cd" and line_index.line(2) == ""
+
+# Inkrementell: nur geänderte Anweisungen neu parsen, Positionen stimmen trotzdem
+session = IncrementalParser("inc.incc25")
+for source in [content for _, content in ALL_TEST_FILES] + list(suite.PROGRAMS.values()):
+    assert session.parse(source) == parser.parse(source)
+source = "{a := 1;\nf := lambda x -> x + a;\nf(2)}"
+session = IncrementalParser("inc.incc25")
+first = session.parse(source)
+assert (session.parsed, session.reused) == (3, 0)
+edited = session.parse(source.replace("a := 1", "a := 100"))
+assert edited == parser.parse(source.replace("a := 1", "a := 100"))
+assert (session.parsed, session.reused) == (1, 2) and edited[1][1] is first[1][1]
+assert positions.where(edited[1][1][3][2]) == "inc.incc25:2:20"  # +
+assert positions.where(edited[1][2]) == "inc.incc25:3:2"  # (
+assert session.parse("{x := 1; x := 1}")[1][0] is not session.parse("{x := 1; x := 1}")[1][1]
+assert session.parse("{a;;b}") is None and session.parse("{a} ; b") is None
+# REPL und Datei lexen gleich: beides Syntaxfehler bzw. beides derselbe AST
+for source in ["{index := 3}", "{1 and2}", "{x := 1; ende := 2}"]:
+    assert IncrementalParser().parse(source) == parser.parse(source), source
+assert IncrementalParser().parse("{index := 3}") is None  # in dex := 3
+assert IncrementalParser().parse("{1 and2}") == ("seq", [("binop", "and", ("num", 1), ("num", 2))])
+
+# quick: Stellen spezialisieren sich auf die beobachteten Typen, der Guard fällt zurück
+source = "{f := lambda (a, b) -> a < b; g := lambda (x, y) -> x * y; s := f(1, 2) + f(2.5, 1); h := g(2); s + g(3, 4) + h(5) + f([1, 5], [2, 2])[1]}"
+code, sites = quicken.compile(resolve(parser.parse(source)))
+assert code(Frame({}, [], Environment(), Environment())) == eval(parser.parse(source), Environment()) == 23
+less, times, *calls = sites[0], sites[1], *[site for site in sites if site.kind == "call"]
+assert less.state == quicken.GENERIC and less.deopts == 1  # erst int, int, dann float, int
+assert times.state == quicken.MONO and times.types == (int, int)
+assert [c.state for c in calls] == [quicken.MONO, quicken.MONO, quicken.GENERIC, quicken.MONO, quicken.GENERIC, quicken.MONO]
+
+# python: erzeugter Quelltext hält die Auswertungsreihenfolge, Code-Cache neben der Datei
+assert test_interpreter("x := 1; x + (x := 5)") == 6
+assert test_interpreter("x := 1; f := lambda y -> x := y; x + f(3) + x") == 7
+assert test_interpreter("f := lambda (a, b: 2) -> a - b; f(x := 4, b: x + 1) + f(1)") == -2
+assert test_interpreter("n := 0; f := lambda y -> n +:= y; 1 < 0 < f(5); 0 < 2 < f(3) < 4 < f(10); n") == 13
+assert test_interpreter("für i in [1, 4] wiederhole s := (wenn i > 2 gilt, i sonst 0 .) + (i := i) .; i") == 4
+assert test_interpreter("+".join(["1"] * 300)) == 300
+assert test_interpreter("2 - -2 ** 2") == -2 and test_interpreter("(0 - 2) ** 2") == 4
+with tempfile.TemporaryDirectory() as tmp:
+    cache_dir, evicted, cache.CACHE_DIR = cache.CACHE_DIR, cache._evicted, Path(tmp) / "ast"
+    program = Path(tmp) / "hot.incc25"
+    program.write_text("x := 0;\nfür i in [1, 10] wiederhole x +:= i * i .;\nx", encoding="utf-8")
+    assert transpiler.run_file(program) == 384 and transpiler.cache_path(program).is_file()
+    assert transpiler.load_code(program, cache.read_source(program)) is not None
+    program.write_text("x := 2; x * x", encoding="utf-8")
+    assert transpiler.load_code(program, cache.read_source(program)) is None
+    assert transpiler.run_file(program) == 4
+    cache.CACHE_DIR, cache._evicted = cache_dir, evicted
+
+# and/or werten die rechte Seite nur aus, wenn sie das Ergebnis noch ändert
+assert test_interpreter("{" + zaehler + " 0 and f(1); 1 or f(1); n}") == 0
+assert test_interpreter("{" + zaehler + " 1 and f(1); 0 or f(0); n}") == 2
+assert test_interpreter("{" + zaehler + " wenn 1 or f(1) gilt, n sonst 7 .}") == 0
+assert test_interpreter("{x := 1; wenn x or 1 gilt, 5 sonst 7 .}") == 5
+
 
 test_code = r"""
 {
@@ -189,6 +566,14 @@ i_me:=420.69
 }"""
 assert test_interpreter(test_code) == 420.69
 
+# Literale kommen schon umgewandelt aus dem Parser, Konstanten werden gefaltet
+assert parser.parse("{0xff; 0b11; 2.5}") == ("seq", [("num", 255), ("num", 3), ("float", 2.5)])
+assert fold(parser.parse("{2 e 10}")) == ("seq", [("num", 20000000000)])
+assert fold(parser.parse("{10 ** (4 | 2 + 3)}")) == ("seq", [("float", 10 ** (4 / 2 + 3))])
+assert fold(parser.parse("{x + 2 * 3}")) == ("seq", [("binop", "plus", ("var", "x"), ("num", 6))])
+assert fold(parser.parse("{2 < 5 < 2 e 10 > 0}")) == ("seq", [("num", 1)])
+assert fold(parser.parse("{1 | 0}")) == parser.parse("{1 | 0}")  # Fehler erst zur Laufzeit
+
 ################### LEXER TEST ###################
 v = False
 assert test_lexer(read_file("test1.incc25"), verbose=v)
@@ -197,11 +582,28 @@ assert test_lexer(read_file("test3.incc25"), verbose=v)
 assert test_lexer(read_file("test6.incc25"), verbose=v)
 
 ################### PARSER TEST ###################
+assert tables_up_to_date(), "Grammatik geändert: make tables"
 assert test_parser(read_file("test1.incc25"), verbose=v)
 assert test_parser(read_file("test2.incc25"), verbose=v)
 assert test_parser(read_file("test3.incc25"), verbose=v)
 assert test_parser(read_file("test6.incc25"), verbose=v)
 
+################### AST-CACHE TEST ###################
+cache_dir = cache.CACHE_DIR
+with tempfile.TemporaryDirectory() as tmp:
+    cache.CACHE_DIR = Path(tmp)
+    (Path(tmp) / "v0").mkdir()  # Eintrag einer alten Grammatik-Version
+    source = read_file("test2.incc25")
+    assert cache.load(source) is None
+    assert cache.parse_cached(source) == parser.parse(source)
+    assert cache.load(source) == parser.parse(source)
+    assert not (Path(tmp) / "v0").exists()
+    # was marshal nicht kann (z.B. ein gefalteter numpy-Skalar), wird nicht gecacht
+    for value in [make_array([1, 2])[0], make_array([2**70]), object()]:
+        cache.store("{x}", ("seq", [("const", value)]))
+        assert cache.load("{x}") is None and not list(Path(tmp).rglob("*.tmp"))
+cache.CACHE_DIR = cache_dir
+
 ################### INTERPRETER TEST ###################
 assert test_interpreter(read_file("test1.incc25"), verbose=v) == 23
 assert test_interpreter(read_file("test2.incc25"), verbose=v) == 2432902008176640000
@@ -209,3 +611,38 @@ assert test_interpreter(read_file("test3.incc25"), verbose=v) == 4
 assert test_interpreter(read_file("test4.incc25"), verbose=v) == 4
 assert test_interpreter(read_file("test5.incc25"), verbose=v) == 4
 assert test_interpreter(read_file("test6.incc25"), verbose=v) == 7
+
+assert test_interpreter("wenn 1 = 1 gilt, 1 sonst 2 .") == 1
+assert test_interpreter("sei fac = lambda x -> wenn x = 0 gilt, 1 sonst x*fac(x-1) . in fac(5) .") == 120
+
+# Geschachtelte Closures und globale Variablen, die erst später entstehen
+assert test_interpreter("{add := lambda x -> lambda y -> x + y + z; z := 10; add(2)(3)}") == 15
+assert test_interpreter("{f := lambda (a, b) -> sei c = a * b in lambda d -> c + d .; f(2, 3)(4)}") == 10
+
+# REPL: jede Eingabe einzeln auf demselben Environment
+for run in BACKENDS.values():
+    env = Environment()
+    run(parser.parse("{g := lambda x -> x + w}"), env)
+    assert run(parser.parse("{w := 5}"), env) == 5
+    assert run(parser.parse("{g(1)}"), env) == 6
+
+# VM: Rekursion über eigene Frames, kein RecursionError
+test_code = "{sei sum = lambda n -> wenn n = 0 gilt, 0 sonst n + sum(n-1) . in sum(5000) .}"
+assert BACKENDS["vm"](parser.parse(test_code), Environment()) == 12502500
+# Builtin ohne Argumente nimmt nichts vom Stack (stack[-0:] wäre der ganze Stack)
+code = bytecode.Code()
+code.emit(bytecode.CONST, code.const(5))
+code.emit(bytecode.BUILTIN, code.const((lambda args: ("num", len(args)), 0)))
+code.emit(bytecode.POP)
+code.emit(bytecode.RETURN)
+assert vm.execute(code, Environment()) == 5
+
+# Tail Calls laufen in konstantem Python-Stack
+test_code = "sei sum = lambda (n, acc) -> wenn n = 0 gilt, acc sonst sum(n - 1, acc + n) . in sum(20000, 0) ."
+assert test_interpreter(test_code) == 200010000
+test_code = r"""{
+gerade := lambda n -> wenn n = 0 gilt, 1 sonst ungerade(n - 1) .;
+ungerade := lambda n -> wenn n = 0 gilt, 0 sonst gerade(n - 1) .;
+gerade(10001)
+}"""
+assert test_interpreter(test_code) == 0
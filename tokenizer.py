@@ -0,0 +1,132 @@
+import re
+from functools import partial
+from lexer import line_index, print_error_with_caret, table
+
+# Alternativer Tokenizer ohne PLY: ein einziger regulärer Ausdruck mit einer
+# benannten Gruppe je Token-Klasse, alle Schlüsselwörter (wenn, solange, in,
+# e, and, ...) teilen sich eine Gruppe und werden im dict nachgeschlagen statt
+# als eigene Regel probiert. Die Tabellen werden aus lexer.table abgeleitet.
+#
+#   parser.parse(quelltext, lexer=Tokenizer())
+#
+# Die Tokens sind dieselben wie beim PLY-Lexer. Wie dort stehen die
+# Schlüsselwörter in der Reihenfolge von lexer.table vor den Bezeichnern, ein
+# Bezeichner, der mit einem Schlüsselwort anfängt, wird also genauso zerlegt:
+# index -> IN dex, ende -> EXP nde, and2 -> AND 2.
+# Zeilennummern werden mitgezählt, die Spalte liefert bei Bedarf line_index.
+
+_by_type = {name: pattern for pattern, name in table.items()}
+_CLASSES = {"FLOAT", "NUMBER", "STRING", "IDENTIFIER"}
+
+
+def _literal(pattern):
+    return re.sub(r"\\(.)", r"\1", pattern)
+
+
+KEYWORDS = {}  # wenn -> IF, and -> AND, e -> EXP, ...
+LITERALS = {}  # Operatoren, Klammern, aber auch and:= oder gilt,
+for _pattern, _name in table.items():
+    if _name in _CLASSES:
+        continue
+    _text = _literal(_pattern)
+    if re.fullmatch(r"\w+", _text):
+        KEYWORDS[_text] = _name
+    else:
+        LITERALS[_text] = _name
+
+
+def _alternatives(texts):
+    # längste zuerst, so gewinnt ** vor * und and:= vor and
+    return "|".join(re.escape(t) for t in sorted(texts, key=len, reverse=True))
+
+
+def _in_table_order(texts):
+    # erster Treffer gewinnt wie bei PLY, also Reihenfolge von lexer.table (echo vor e)
+    return "|".join(re.escape(t) for t in texts)
+
+
+_words = [t for t in LITERALS if re.search(r"\w", t)]  # and:=, e:=, gilt,, ,aber
+# Leerzeichen und Tabs vor einem Token gehören mit zum Treffer, das spart
+# einen eigenen Treffer je Lücke. lexpos ist deshalb m.start(Gruppe).
+MASTER = re.compile(
+    r"[ \t]*(?:"
+    + "|".join(
+        [
+            r"(?P<newline>\n+)",
+            r"(?P<comment>\#[^\#]*\#)",
+            f"(?P<FLOAT>{_by_type['FLOAT']})",
+            f"(?P<NUMBER>{_by_type['NUMBER']})",
+            f"(?P<STRING>{_by_type['STRING']})",
+            f"(?P<word>{_alternatives(_words)})",
+            f"(?P<keyword>{_in_table_order(KEYWORDS)})",
+            f"(?P<name>{_by_type['IDENTIFIER']})",
+            f"(?P<literal>{_alternatives(t for t in LITERALS if t not in _words)})",
+            r"(?P<error>[^ \t])",  # Leerzeichen am Ende sind kein Fehler
+        ]
+    )
+    + ")"
+)
+
+
+class Token:
+    """Wie ply.lex.LexToken, nur mit __slots__"""
+
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, type, value, lineno, lexpos, lexer):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.lexer = lexer
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+class Tokenizer:
+    """Ersatz für den PLY-Lexer mit input/token, z.B. für parser.parse(lexer=...)"""
+
+    def __init__(self):
+        self.lexdata = ""
+        self.token = lambda: None
+
+    def input(self, text):
+        self.lexdata = text
+        # token ist direkt next auf dem Generator, kein Python-Aufruf je Token
+        self.token = partial(next, self.tokenize(text), None)
+
+    def clone(self):
+        return Tokenizer()
+
+    def tokenize(self, text):
+        keywords, literals = KEYWORDS, LITERALS
+        lineno = 1
+        for m in MASTER.finditer(text):
+            kind = m.lastgroup
+            if kind == "name":
+                yield Token("IDENTIFIER", m.group(kind), lineno, m.start(kind), self)
+            elif kind == "keyword":
+                value = m.group(kind)
+                yield Token(keywords[value], value, lineno, m.start(kind), self)
+            elif kind == "literal" or kind == "word":
+                value = m.group(kind)
+                yield Token(literals[value], value, lineno, m.start(kind), self)
+            elif kind == "newline":
+                lineno += m.end() - m.start(kind)
+            elif kind == "comment":
+                lineno += m.group(kind).count("\n")
+            elif kind == "error":
+                pos = m.start(kind)
+                print_error_with_caret(text, lineno, pos)
+                # wie t_error: Token vom Typ error mit dem Rest der Eingabe
+                yield Token("error", text[pos:], lineno, pos, self)
+            else:  # FLOAT, NUMBER, STRING
+                value = m.group(kind)
+                yield Token(kind, value, lineno, m.start(kind), self)
+                if kind == "STRING":
+                    lineno += value.count("\n")
+
+    def locate(self, lexpos):
+        """(zeile, spalte) eines Tokens, über den LineIndex in O(log n)"""
+        return line_index(self.lexdata).locate(lexpos)
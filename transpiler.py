@@ -0,0 +1,599 @@
+import hashlib
+import importlib.util
+import marshal
+import math
+import os
+import sys
+from pathlib import Path
+
+from analysis import ASSIGNED, READ, counter_usage
+from compiler import _call
+from environment import Environment, Frame
+from interpreter import bin_operations, unary_operations, func_list, eval
+from lexer import GRAMMAR_VERSION
+from resolver import resolve
+from _array import as_int, make_array, scalar
+from _lambda import Lambda, Signature, TailCall
+from _list import Cons, from_values, list_head, list_tail
+
+# Übersetzt den aufgelösten AST (resolver.py) in Python-Quelltext und mit
+# compile() in ein Code-Objekt. Die Semantik ist die des Closure-Compilers:
+# lokale Variablen liegen in Frames, globale im Environment, jedes Lambda
+# wird eine Python-Funktion body(frame), Aufrufe gehen über compiler._call
+# (Partial Application, Keywords, merke und TailCalls wie in call_lambda).
+# Im erzeugten Code steht aber kein Closure-Aufruf je Knoten mehr, sondern
+# z.B. direkt x + y, und Schleifen sind Python-Schleifen.
+#
+#   python3 transpiler.py [-zeigen] datei.incc25
+#
+# führt eine Datei aus, das Code-Objekt wird neben ihr gespeichert
+# (datei.incc25c) und beim nächsten Mal ohne Lexen, Parsen und Übersetzen
+# geladen. Mit -zeigen wird nur der erzeugte Python-Quelltext ausgegeben.
+
+TRANSPILER_VERSION = 1
+SUFFIX = ".incc25c"
+MAX_DEPTH = 40  # tiefer geschachtelte Ausdrücke kommen in Hilfsvariablen
+
+# Ausdruck je Operator, genau wie die Lambdas in bin_operations
+_INLINE = {
+    "plus": "({x} + {y})",
+    "minus": "({x} - {y})",
+    "times": "({x} * {y})",
+    "power": "({x} ** {y})",
+    "divide": "({x} / {y})",
+    "divide_floor": "({x} // {y})",
+    "divide_ceil": "(-(-{x} // {y}))",
+    "mod": "({x} % {y})",
+    "exp": "({x} * 10 ** {y})",
+}
+_COMPARISONS = {
+    "equals": "==",
+    "unequals": "!=",
+    "smaller_than": "<",
+    "greater_than": ">",
+    "smaller_equals": "<=",
+    "greater_equals": ">=",
+}
+# Knoten, die ein Python-Ausdruck werden, wenn ihre Kinder es auch sind
+_EXPRESSIONS = {
+    "num", "float", "const", "str", "complex", "local", "global", "binop", "comparison",
+    "unary", "lambda", "call", "function", "array", "array_access", "list", "cons",
+}
+
+
+def _not_callable(func_obj):
+    raise TypeError(f"Cannot call object of type {type(func_obj)}")
+
+
+def _missing(name, env):
+    raise Exception(f"variable {name} not found in environment {env}")
+
+
+def _unknown(text):
+    print(f"unknown expression {text}")
+    return -1
+
+
+def _non_int():
+    raise TypeError("Non-Int Type is not supported!")
+
+
+# Alles, was der erzeugte Code außer den eigenen Funktionen braucht
+RUNTIME = {
+    "Lambda": Lambda,
+    "Signature": Signature,
+    "TailCall": TailCall,
+    "Frame": Frame,
+    "call": _call,
+    "not_callable": _not_callable,
+    "missing": _missing,
+    "unknown": _unknown,
+    "non_int": _non_int,
+    "as_int": as_int,
+    "ops": bin_operations,
+    "unary": unary_operations,
+    "builtins": func_list,
+    "eval": eval,
+    "make_array": make_array,
+    "scalar": scalar,
+    "list_head": list_head,
+    "list_tail": list_tail,
+    "from_values": from_values,
+    "Cons": Cons,
+}
+
+
+def _literal(value):
+    """Python-Literal für einen Wert oder None, wenn es keins gibt"""
+    if type(value) is float and not math.isfinite(value):
+        return f"float({str(value)!r})"
+    if type(value) in (int, float) and value < 0:
+        return f"({value!r})"  # -2 ** 2 wäre -(2 ** 2)
+    if type(value) in (int, float, str, bool) or value is None:
+        return repr(value)
+    return None
+
+
+class _Function:
+    """Eine erzeugte Python-Funktion: Zeilen und Frames im Zugriff"""
+
+    def __init__(self, name):
+        self.name = name
+        self.lines: list = []
+        self.indent = 1
+        self.frames: list = ["env"]  # innerster zuletzt: env, dann sei-Frames
+        self.slots: dict = {}  # Frame-Ausdruck -> Name der Slot-Liste
+        self.aliases: dict = {}  # Adresse des Zählers -> Python-Variable
+
+
+class _Generator:
+    def __init__(self):
+        self.header: list = []  # Slot-Tabellen und Signaturen
+        self.functions: list = []
+        self.constants: list = []  # Werte ohne Literal, nur im Speicher
+        self.count = 0
+        self._heights: dict = {}
+        self.f = None
+
+    def name(self, prefix):
+        self.count += 1
+        return f"{prefix}{self.count}"
+
+    def emit(self, line):
+        self.f.lines.append("    " * self.f.indent + line)
+
+    def temp(self, text):
+        t = self.name("t")
+        self.emit(f"{t} = {text}")
+        return t
+
+    def function(self, name, body, tail):
+        """def name(env): ... für einen Lambda-Body bzw. das Programm"""
+        outer, self.f = self.f, _Function(name)
+        result = self.value(body, tail)
+        self.emit(f"return {result}")
+        f, self.f = self.f, outer
+        lines = [f"def {name}(env):"]
+        lines += [f"    {s} = {frame}.slots" for frame, s in f.slots.items()]
+        self.functions.append("\n".join(lines + f.lines))
+
+    # --- Ausdrücke ------------------------------------------------------
+
+    def height(self, node):
+        """Schachtelungstiefe als Python-Ausdruck, None wenn Anweisungen nötig sind"""
+        key = id(node)
+        if key in self._heights:
+            return self._heights[key][1]
+        if not isinstance(node, tuple) or not node or node[0] not in _EXPRESSIONS:
+            height = 0 if node == "leere" else None
+        else:
+            children = _children(node)
+            heights = [self.height(c) for c in children]
+            height = None if None in heights else 1 + max(heights, default=0)
+            if height is not None and height > MAX_DEPTH:
+                height = None
+        self._heights[key] = (node, height)  # node hält die id gültig
+        return height
+
+    def simple(self, node):
+        return self.height(node) is not None
+
+    def values(self, nodes):
+        """Ausdrücke für die Knoten, ausgewertet in dieser Reihenfolge
+
+        Braucht ein späterer Knoten Anweisungen, kommen die früheren vorher
+        in Hilfsvariablen, sonst würden sie erst danach ausgewertet.
+        """
+        texts = []
+        for i, node in enumerate(nodes):
+            text = self.value(node)
+            if not all(self.simple(n) for n in nodes[i + 1 :]) and not _constant(node):
+                text = self.temp(text)
+            texts.append(text)
+        return texts
+
+    def value(self, node, tail=False):
+        """Python-Ausdruck für den Wert des Knotens, davor nötige Anweisungen"""
+        text = self._value(node, tail)
+        if not self.simple(node) and not text.isidentifier():
+            text = self.temp(text)  # z.B. zu tief geschachtelt
+        return text
+
+    def _value(self, node, tail):
+        match node:
+            case ("num", n) | ("float", n) | ("const", n):
+                literal = _literal(n)
+                if literal is None:
+                    self.constants.append(n)
+                    return f"constants[{len(self.constants) - 1}]"
+                return literal
+            case ("str", n):
+                return repr(str(n))
+            case ("complex", imag):
+                return f"unary['imag']({self.value(imag)})"
+            case ("local", _, _, _) | ("global", _):
+                return self.read(node)
+
+            case ("binop", "and" | "or" as op, expr1, expr2):
+                a = self.value(expr1)
+                if self.simple(expr2):
+                    b = f"int(bool({self.value(expr2)}))"
+                    return f"({b} if {a} else 0)" if op == "and" else f"(1 if {a} else {b})"
+                t = self.name("t")
+                self.emit(f"if {a}:" if op == "and" else f"if not {a}:")
+                self.block(lambda: self.emit(f"{t} = int(bool({self.value(expr2)}))"))
+                self.emit("else:")
+                self.block(lambda: self.emit(f"{t} = {0 if op == 'and' else 1}"))
+                return t
+            case ("binop", op, expr1, expr2):
+                x, y = self.values([expr1, expr2])
+                return self.operator(op, x, y)
+
+            case ("comparison", op, x, y):
+                # Kette a < b < c: jeder Operand genau einmal, beim ersten
+                # falschen Glied 0 wie im Closure-Compiler
+                operands, ops = [x], []
+                while y[0] == "comparison":
+                    ops.append(op)
+                    operands.append(y[2])
+                    op, y = y[1], y[3]
+                ops.append(op)
+                operands.append(y)
+                if len(ops) == 1:
+                    return self.operator(op, *self.values(operands))
+                if self.simple(node):
+                    # ((... if op2(r1, (r2 := c)) else 0) if op1(a, (r1 := b)) else 0)
+                    texts = [self.value(o) for o in operands]
+                    names = [texts[0]] + [self.name("t") for _ in texts[1:-1]]
+                    text = self.operator(ops[-1], names[-1], texts[-1])
+                    for i in range(len(ops) - 2, -1, -1):
+                        bound = f"({names[i + 1]} := {texts[i + 1]})"
+                        text = f"({text} if {self.operator(ops[i], names[i], bound)} else 0)"
+                    return text
+                t = self.name("t")
+                left = self.temp(self.value(operands[0]))
+                self.emit(f"{t} = 0")
+                for op, operand in zip(ops, operands[1:-1]):
+                    right = self.temp(self.value(operand))
+                    self.emit(f"if {self.operator(op, left, right)}:")
+                    self.f.indent += 1
+                    left = right
+                self.emit(f"{t} = {self.operator(ops[-1], left, self.value(operands[-1]))}")
+                self.f.indent -= len(ops) - 1
+                return t
+
+            case ("assign", op, var, val):
+                v = self.temp(self.value(val))
+                if op is not None:
+                    self.emit(f"{v} = {self.operator(op, self.read(var), v)}")
+                self.write(var, v)
+                return v
+
+            case ("unary", op, expr):
+                x = self.value(expr)
+                match op:
+                    case "not":
+                        return f"int(not {x})"
+                    case "uminus":
+                        return f"(-{x})"
+                return f"unary[{op!r}]({x})"
+
+            case ("seq", body):
+                return self.seq(body, tail)
+
+            case ("if", condition, then_body, else_body):
+                t = self.name("t")
+                self.emit(f"if {self.value(condition)} == 1:")
+                self.block(lambda: self.emit(f"{t} = {self.seq(then_body, tail)}"))
+                opened = 0  # else-Blöcke für Bedingungen mit Anweisungen
+                for c, statement in else_body or ():
+                    if c == "None":
+                        self.emit("else:")
+                    elif self.simple(c):
+                        self.emit(f"elif {self.value(c)}:")
+                    else:
+                        self.emit("else:")
+                        self.f.indent += 1
+                        opened += 1
+                        self.emit(f"if {self.value(c)}:")
+                    self.block(lambda s=statement: self.emit(f"{t} = {self.seq(s, tail)}"))
+                    if c == "None":
+                        break
+                else:
+                    self.emit("else:")
+                    self.block(lambda: self.emit(f"{t} = None"))
+                self.f.indent -= opened
+                return t
+
+            case ("while", condition, body):
+                t = self.temp("None")
+                if self.simple(condition):
+                    self.emit(f"while {self.value(condition)}:")
+                    self.block(lambda: self.emit(f"{t} = {self.seq(body)}"))
+                    return t
+                self.emit("while True:")
+                self.f.indent += 1
+                self.emit(f"if not {self.value(condition)}:")
+                self.block(lambda: self.emit("break"))
+                self.emit(f"{t} = {self.seq(body)}")
+                self.f.indent -= 1
+                return t
+
+            case ("loop", counter, interval, body):
+                return self.loop(counter, interval, body)
+
+            case ("lambda", parameter, body, names):
+                params, defaults, varargs = [], [], None
+                for param in parameter[1]:
+                    match param:
+                        case "keyword", var, expr:
+                            defaults.append((var, expr))
+                        case "infty", var:
+                            varargs = var
+                        case "pos", var:
+                            params.append(var)
+                name = self.name("lambda")
+                self.header.append(f"names_{name} = {names!r}")
+                self.header.append(
+                    f"sig_{name} = Signature({tuple(params)!r}, {[v for v, _ in defaults]!r}, {varargs!r}, names_{name})"
+                )
+                self.function(name, body, tail=True)
+                values = self.values([expr for _, expr in defaults])
+                items = ", ".join(f"{var!r}: {v}" for (var, _), v in zip(defaults, values))
+                return f"Lambda(sig_{name}.params, {varargs!r}, {{{items}}}, {name}, {self.f.frames[-1]}, names_{name}, sig_{name})"
+
+            case ("call", func, args_expr):
+                args = args_expr[1]  # Keywords stehen laut Grammatik immer hinten
+                texts = self.values([func] + [a[-1] for a in args])
+                f = self.name("f")
+                callee = f"({f} if isinstance({f} := {texts[0]}, Lambda) else not_callable({f}))"
+                pos = ", ".join(t for a, t in zip(args, texts[1:]) if a[0] == "pos")
+                keywords = ", ".join(f"{a[1][1]!r}: {t}" for a, t in zip(args, texts[1:]) if a[0] == "keyword")
+                if tail:
+                    return f"TailCall({callee}, [{pos}], {{{keywords}}})"
+                return f"call({callee}, [{pos}], {{{keywords}}})"
+
+            case ("let", asgn, body, names):
+                name = self.name("names")
+                self.header.append(f"{name} = {names!r}")
+                frame = self.temp(f"Frame({name}, [None], {self.f.frames[-1]})")
+                self.f.frames.append(frame)
+                self.value(asgn)
+                result = self.value(body, tail)
+                self.f.frames.pop()
+                return result
+
+            case ("function", func, params):
+                # Builtins liefern einen kleinen AST zurück
+                values = ", ".join(self.values(params))
+                return f"eval(builtins[{func!r}]([{values}]), {self.f.frames[-1]})"
+
+            case ("array", list_elements):
+                return f"make_array([{', '.join(self.values(list_elements))}])"
+
+            case ("array_access", array_ptr, index):
+                if index == ".":
+                    return f"list_head({self.value(array_ptr)})"
+                if index == "*":
+                    return f"list_tail({self.value(array_ptr)})"
+                arr, i = self.values([array_ptr, index])
+                return f"scalar({arr}[{i}])"
+
+            case ("list", list_elements):
+                return f"from_values([{', '.join(self.values(list_elements))}])"
+
+            case ("cons", expr1, expr2):
+                return "Cons({}, {})".format(*self.values([expr1, expr2]))
+
+            case "leere":
+                return "None"
+
+            case _:
+                return f"unknown({str(node)!r})"
+
+    def operator(self, op, x, y):
+        if op in _INLINE:
+            return _INLINE[op].format(x=x, y=y)
+        if op in _COMPARISONS:
+            # bool direkt als 0/1, sonst (z.B. numpy-Arrays) über as_int
+            c = self.name("c")
+            return f"(1 if ({c} := {x} {_COMPARISONS[op]} {y}) is True else 0 if {c} is False else as_int({c}))"
+        return f"ops[{op!r}]({x}, {y})"
+
+    def block(self, emit):
+        self.f.indent += 1
+        emit()
+        self.f.indent -= 1
+
+    def seq(self, body, tail=False):
+        for expr in body[:-1]:
+            text = self.value(expr)
+            if not text.isidentifier() and not _constant(expr):
+                self.emit(text)  # nur wegen der Nebenwirkung, z.B. ein Aufruf
+        return self.value(body[-1], tail)
+
+    # --- Variablen ------------------------------------------------------
+
+    def slots(self, depth):
+        """Name der Slot-Liste des Frames depth Ebenen nach oben"""
+        frames = self.f.frames
+        if depth < len(frames) - 1:
+            return f"{frames[-1 - depth]}.slots"
+        frame = "env" + ".parent" * (depth - len(frames) + 1)
+        if frame not in self.f.slots:
+            self.f.slots[frame] = f"s{len(self.f.slots)}"
+        return self.f.slots[frame]
+
+    def read(self, address):
+        if address in self.f.aliases:
+            return self.f.aliases[address]
+        match address:
+            case ("local", depth, slot, _):
+                return f"{self.slots(depth)}[{slot}]"
+            case ("global", n):
+                return f"(v[{n!r}] if {n!r} in v else missing({n!r}, globals_env))"
+
+    def write(self, address, value):
+        match address:
+            case ("local", depth, slot, _):
+                self.emit(f"{self.slots(depth)}[{slot}] = {value}")
+            case ("global", n):
+                self.emit(f"v[{n!r}] = {value}")
+
+    def loop(self, counter, interval, body):
+        left_interval, expr1, expr2, right_interval = interval
+        a, b = [self.temp(text) for text in self.values([expr1, expr2])]
+        self.emit(f"if not isinstance({a}, int) or not isinstance({b}, int):")
+        self.block(lambda: self.emit("non_int()"))
+        if left_interval == "]":
+            self.emit(f"{a} += 1")
+        if right_interval == "[":
+            self.emit(f"{b} -= 1")
+        t = self.temp("None")
+        usage = counter_usage(counter, body)
+        if usage == ASSIGNED:
+            # Rumpf kann den Zähler ändern, also jedes Mal neu lesen
+            self.write(counter, a)
+            self.emit(f"while {self.read(counter)} < {b}:")
+            self.f.indent += 1
+            self.write(counter, f"{self.read(counter)} + 1")
+            self.emit(f"{t} = {self.seq(body)}")
+            self.f.indent -= 1
+            return t
+        # Der Rumpf ruft nichts auf und ändert den Zähler nicht, also sieht
+        # ihn niemand außer dem Rumpf selbst: er bleibt eine Python-Variable
+        # und kommt erst am Ende ins Environment
+        i = self.name("i") if usage == READ else "_"
+        self.emit(f"for {i} in range({a} + 1, {b} + 1):")
+        self.f.indent += 1
+        if usage == READ:
+            self.f.aliases[counter] = i
+        self.emit(f"{t} = {self.seq(body)}")
+        self.f.aliases.pop(counter, None)
+        self.f.indent -= 1
+        self.write(counter, f"max({a}, {b})")
+        return t
+
+
+def _children(node):
+    match node:
+        case ("complex", x) | ("unary", _, x):
+            return [x]
+        case ("binop", _, x, y) | ("comparison", _, x, y) | ("cons", x, y):
+            return [x, y]
+        case ("lambda", parameter, _, _):
+            return [p[2] for p in parameter[1] if p[0] == "keyword"]
+        case ("call", func, (_, args)):
+            return [func] + [a[-1] for a in args]
+        case ("function", _, params):
+            return params
+        case ("array", elements) | ("list", elements):
+            return elements
+        case ("array_access", array_ptr, index):
+            return [array_ptr] if index in (".", "*") else [array_ptr, index]
+    return []
+
+
+def _constant(node):
+    return node == "leere" or isinstance(node, tuple) and node[0] in ("num", "float", "str")
+
+
+def to_python(ast):
+    """(python_quelltext, konstanten) für einen AST aus parser.parse
+
+    Konstanten gibt es nur für Werte ohne Literal (z.B. numpy-Werte aus
+    fold.py), der Code braucht sie dann beim Ausführen.
+    """
+    generator = _Generator()
+    generator.function("main", resolve(ast), tail=False)
+    source = "\n\n".join(["\n".join(generator.header), *generator.functions]) + "\n"
+    return source, generator.constants
+
+
+def compile_ast(ast, filename="<incc25>"):
+    """(code, konstanten) für einen AST aus parser.parse"""
+    source, constants = to_python(ast)
+    return compile(source, filename, "exec"), constants
+
+
+def execute(code, env: Environment, constants=()):
+    # Globale direkt über das dict des Environments, wenn es kein äußeres gibt
+    v = env.vars if isinstance(env, Environment) and env.parent is None else env
+    namespace = {**RUNTIME, "constants": constants, "globals_env": env, "v": v}
+    exec(code, namespace)
+    return namespace["main"](Frame({}, [], env, env))
+
+
+def run(ast, env: Environment):
+    """Backend: übersetzt den AST und führt das Code-Objekt aus"""
+    code, constants = compile_ast(ast)
+    return execute(code, env, constants)
+
+
+# --- Code-Cache neben der Datei ------------------------------------------
+
+
+def cache_path(path):
+    path = Path(path)
+    return path.with_name(path.name.removesuffix(".incc25") + SUFFIX)
+
+
+def cache_key(source: str):
+    # marshal-Format und Bytecode hängen an der Python-Version
+    magic = importlib.util.MAGIC_NUMBER.hex()
+    return hashlib.sha256(f"{GRAMMAR_VERSION}\0{TRANSPILER_VERSION}\0{magic}\0{source}".encode()).hexdigest()
+
+
+def load_code(path, source: str):
+    """Code-Objekt aus datei.incc25c, wenn es zum Quelltext passt, sonst None"""
+    try:
+        key, code = marshal.loads(cache_path(path).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return code if key == cache_key(source) else None
+
+
+def store_code(path, source: str, code):
+    target = cache_path(path)
+    try:
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(marshal.dumps((cache_key(source), code)))
+        os.replace(tmp, target)  # atomar, wie cache.store
+    except OSError:
+        pass  # ohne Cache geht es auch
+
+
+def load_or_compile(path):
+    """Code-Objekt für eine .incc25-Datei, None bei Syntaxfehler"""
+    from cache import parse_file, read_source
+
+    source = read_source(path)
+    code = load_code(path, source)
+    if code is not None:
+        return code
+    ast = parse_file(path)
+    if ast is None:
+        return None
+    code, _ = compile_ast(ast, f"{path} (übersetzt)")  # ohne fold gibt es keine Konstanten
+    store_code(path, source, code)
+    return code
+
+
+def run_file(path, env=None):
+    code = load_or_compile(path)
+    if code is None:
+        return None
+    return execute(code, Environment() if env is None else env)
+
+
+if __name__ == "__main__":
+    from cache import parse_file
+
+    args = sys.argv[1:]
+    if "-zeigen" in args:
+        for f in args:
+            if f != "-zeigen":
+                print(to_python(parse_file(f))[0])
+    else:
+        for f in args:
+            print(run_file(f))
@@ -0,0 +1,186 @@
+from environment import Environment
+from _array import make_array, scalar
+from _memo import MISSING
+from _list import Cons, list_head, list_tail
+from interpreter import eval
+from _lambda import Lambda, bind_arguments
+from bytecode import (
+    Code,
+    compile_code,
+    CONST, LOAD, STORE, STORE_OP, BINOP, UNARY, POP, JUMP, JUMP_IF_FALSE,
+    JUMP_IF_NOT_ONE, COMPARE_CHAIN, LOOP_INIT, LOOP_NEXT, LOOP_EXIT, MAKE_LAMBDA, CALL,
+    RETURN, LET_ENTER, LET_EXIT, BUILTIN, BUILD_ARRAY, INDEX, INDEX_HEAD,
+    INDEX_TAIL, CONS, UNKNOWN, RANGE_INIT, RANGE_NEXT,
+)
+
+
+def execute(code: Code, env):
+    """Dispatch-Schleife der Stack-VM
+
+    Lambda-Aufrufe legen nur einen Frame auf die eigene Frame-Liste,
+    Schleifen sind Sprünge -- der Python-Stack wächst dabei nicht.
+    """
+    stack = []
+    frames = []  # (ops, consts, pc, env, (memo, key) oder None) des Aufrufers
+    ops, consts = code.ops, code.consts
+    pc = 0
+
+    while True:
+        op = ops[pc]
+        arg = ops[pc + 1]
+        pc += 2
+
+        if op == LOAD:
+            name = consts[arg]
+            if name not in env:
+                raise Exception(f"variable {name} not found in environment {env}")
+            stack.append(env[name])
+        elif op == CONST:
+            stack.append(consts[arg])
+        elif op == BINOP:
+            b = stack.pop()
+            stack[-1] = consts[arg](stack[-1], b)
+        elif op == STORE:
+            name = consts[arg]
+            env[name] = stack[-1]
+            stack[-1] = env[name]
+        elif op == STORE_OP:
+            name, f = consts[arg]
+            env[name] = f(env[name], stack[-1])
+            stack[-1] = env[name]
+        elif op == JUMP_IF_FALSE:
+            if not stack.pop():
+                pc = arg
+        elif op == JUMP_IF_NOT_ONE:
+            if stack.pop() != 1:
+                pc = arg
+        elif op == LOOP_NEXT:
+            counter = consts[arg]
+            if env[counter] < stack[-2]:
+                env[counter] += 1
+                pc += 2  # JUMP zum Schleifenende überspringen
+        elif op == RANGE_NEXT:
+            i = next(stack[-2], None)
+            if i is not None:
+                if name := consts[arg]:
+                    env[name] = i
+                pc += 2  # JUMP zum Schleifenende überspringen
+        elif op == POP:
+            stack.pop()
+        elif op == JUMP:
+            pc = arg
+        elif op == UNARY:
+            stack[-1] = consts[arg](stack[-1])
+        elif op == COMPARE_CHAIN:
+            f, target = consts[arg]
+            b = stack.pop()
+            if f(stack[-1], b):
+                stack[-1] = b
+            else:
+                stack[-1] = 0
+                pc = target
+
+        elif op == CALL:
+            kinds = consts[arg]
+            n = len(kinds)
+            args = stack[len(stack) - n :]
+            del stack[len(stack) - n :]
+            func_obj = stack.pop()
+            if not isinstance(func_obj, Lambda):
+                raise TypeError(f"Cannot call object of type {type(func_obj)}")
+            pos_args = []
+            keyword_args = {}
+            for kind, val in zip(kinds, args):
+                if kind[0] == "pos":
+                    pos_args.append(val)
+                else:
+                    keyword_args[kind[1]] = val
+            lokal_env = bind_arguments(func_obj, pos_args, keyword_args)
+            if isinstance(lokal_env, Lambda):  # Partial Application
+                stack.append(lokal_env)
+                continue
+            memo = func_obj.memo
+            pending = None
+            if memo is not None and (key := memo.key(lokal_env)) is not None:
+                value = memo.lookup(key)
+                if value is not MISSING:
+                    stack.append(value)
+                    continue
+                pending = (memo, key)  # bei RETURN merken
+            frames.append((ops, consts, pc, env, pending))
+            ops, consts = func_obj.body.ops, func_obj.body.consts
+            pc = 0
+            env = lokal_env
+        elif op == RETURN:
+            if not frames:
+                return stack.pop()
+            ops, consts, pc, env, pending = frames.pop()
+            if pending is not None:
+                pending[0].store(pending[1], stack[-1])
+        elif op == MAKE_LAMBDA:
+            signature, keywords, varargs, body = consts[arg]
+            n = len(keywords)
+            defaults = dict(zip(keywords, stack[len(stack) - n :]))
+            del stack[len(stack) - n :]
+            stack.append(Lambda(signature.params, varargs, defaults, body, env, None, signature))
+
+        elif op == LOOP_INIT:
+            counter, left, right = consts[arg]
+            b = stack.pop()
+            a = stack.pop()
+            if not isinstance(a, int) or not isinstance(b, int):
+                raise TypeError("Non-Int Type is not supported!")
+            env[counter] = a + left
+            stack.append(b - right)  # Schleifengrenze
+        elif op == RANGE_INIT:
+            counter, left, right = consts[arg]
+            b = stack.pop()
+            a = stack.pop()
+            if not isinstance(a, int) or not isinstance(b, int):
+                raise TypeError("Non-Int Type is not supported!")
+            a += left
+            b -= right
+            env[counter] = max(a, b)  # der Rumpf liest den Zähler erst nach RANGE_NEXT
+            stack.append(iter(range(a + 1, b + 1)))
+        elif op == LOOP_EXIT:
+            result = stack.pop()
+            stack[-1] = result
+        elif op == LET_ENTER:
+            stack.append(env)
+            env = Environment(env)
+            env.put([consts[arg]])
+        elif op == LET_EXIT:
+            result = stack.pop()
+            env = stack.pop()
+            stack.append(result)
+
+        elif op == BUILTIN:
+            builtin, n = consts[arg]
+            args = stack[len(stack) - n :]
+            del stack[len(stack) - n :]
+            # Builtins liefern einen kleinen AST zurück
+            stack.append(eval(builtin(args), env))
+        elif op == BUILD_ARRAY:
+            arr = stack[len(stack) - arg :]
+            del stack[len(stack) - arg :]
+            stack.append(make_array(arr))
+        elif op == INDEX:
+            i = stack.pop()
+            stack[-1] = scalar(stack[-1][i])
+        elif op == INDEX_HEAD:
+            stack[-1] = list_head(stack[-1])
+        elif op == INDEX_TAIL:
+            stack[-1] = list_tail(stack[-1])
+        elif op == CONS:
+            b = stack.pop()
+            stack[-1] = Cons(stack[-1], b)
+        elif op == UNKNOWN:
+            print(f"unknown expression {consts[arg]}")
+            stack.append(-1)
+        else:
+            raise RuntimeError(f"unknown opcode {op}")
+
+
+def run(expression, env: Environment):
+    """Kompiliert den AST zu Bytecode und führt ihn in der VM aus"""
+    return execute(compile_code(expression), env)